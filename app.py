@@ -1,14 +1,18 @@
 import json
-import random
 from cfonts import render, say
 from menus.game_settings_menu import GameSettingsMenu
 from menus.menu import *
+from game.history import HandHistoryRecorder
+from game.opponent_stats import OpponentStats
 from game.table import Table
 from menus.starting_menu import StartingMenu
 from models.account import Account
 from models.deck import Deck, StandardDeck
-from settings import GameSettings
-from models.player import ComputerPlayer, HumanPlayer
+from settings import BotSettings, GameSettings, Pacing
+from models.player import HumanPlayer
+from models.strategies import create_bot, display_strategy_stats
+from utils.instrumentation import COUNTERS, LATENCIES
+from utils.rng import make_rng
 
 
 class Application:
@@ -28,6 +32,14 @@ class Application:
             deck (Deck): The deck of cards used in the game.
             chips_amount (int): The initial amount of chips each player has.
             small_blind (int): The amount of the small blind in the game.
+            decision_timeout (float): The number of seconds for each decision, or None for no limit.
+            pacing (Pacing): How fast the interactive game moves on.
+            banner (str): The rendered banner, kept when the pacing does not redraw it.
+            history_dir (str): The directory hand histories are recorded in, or None to record nothing.
+            seed (int): The session seed seating and cards are derived from, or None for no seed.
+            tables_played (int): The number of tables opened in the session, which numbers the next table.
+            bot_settings (BotSettings): Which registered strategy every computer seat plays and how.
+            stats_path (str): The file the statistics of every player are kept in across tables.
             curr_account (Account): The current account logged into the application.
 
         Methods:
@@ -35,6 +47,7 @@ class Application:
             write_to_config(file_path, data): Writes the given data to the specified JSON file.
             game_loop(): Runs the main game loop, creating a table and starting a new game if applicable.
             run(): Runs the application, displaying menus and handling user input.
+            print_banner(): Clears the screen and prints the banner as the pacing allows.
             exit(): Exits the application, saving any changes to the accounts JSON file.
         """
     def __init__(self):
@@ -53,6 +66,14 @@ class Application:
         self.deck = StandardDeck()
         self.chips_amount = 100
         self.small_blind = 1
+        self.decision_timeout = None
+        self.pacing = Pacing.NORMAL
+        self.banner = None
+        self.history_dir = None
+        self.seed = None
+        self.tables_played = 0
+        self.bot_settings = BotSettings()
+        self.stats_path = "config_files/opponent_stats.npz"
         self.curr_account = None
 
     @staticmethod
@@ -85,32 +106,63 @@ class Application:
     def game_loop(self):
         """
         Runs the main game loop, creating a table and starting a new game if applicable.
+
+        Once the player leaves the table, the time the computer players' decisions took and the number of
+        decisions that ran out of time are displayed for every strategy seated.
         """
         if self.playing:
-            table = Table()
-
-            players = [ComputerPlayer(Account(username="BOT-" + str(i), chips=self.chips_amount)) for i in
-                       range(self.players_number - 1)]
+            observers = [OpponentStats(self.stats_path)]
+            if self.history_dir is not None:
+                observers.append(HandHistoryRecorder(self.history_dir))
+            table = Table(observers)
+
+            strategies = self.bot_settings.strategies
+            players = [create_bot(strategies[i % len(strategies)],
+                                  Account(username="BOT-" + str(i), chips=self.chips_amount), self.bot_settings)
+                       for i in range(self.players_number - 1)]
             players.append(HumanPlayer(self.curr_account))
-            random.shuffle(players)
+            counters = COUNTERS.snapshot()
+            latencies = LATENCIES.snapshot()
+            table_id = self.tables_played
+            self.tables_played += 1
+            make_rng(self.seed, "seating", table_id).shuffle(players)
             game_settings = GameSettings(players=players, deck=self.deck, dealer=0, small_blind=self.small_blind,
-                                         big_blind=self.small_blind * 2)
+                                         big_blind=self.small_blind * 2, decision_timeout=self.decision_timeout,
+                                         pacing=self.pacing, seed=self.seed, table_id=table_id)
             table.createTable(game_settings)
+            for observer in observers:
+                observer.close()
+            display_strategy_stats(LATENCIES.since(latencies), COUNTERS.snapshot() - counters)
+            input("Press Enter to return to the menu.")
 
     def run(self):
         """
         Runs the application, displaying menus and handling user input.
         """
         while self.running:
-            print(100 * "\n")
-            #  self.printBanner()
-            output = render('POKER CLI', colors=['green', 'yellow'], align='center')
-            print(output)
+            self.print_banner()
             self.curr_menu.display_menu()
             self.curr_menu.check_input()
             self.game_loop()
             self.playing = False
 
+    def print_banner(self):
+        """
+        Clears the screen and prints the banner as the pacing allows.
+
+        The normal pacing scrolls the screen away and renders the banner every time, faster pacings
+        clear the screen with an escape code and render the banner only once.
+        """
+        if self.pacing.redraw_banner:
+            print(100 * "\n")
+            print(render('POKER CLI', colors=['green', 'yellow'], align='center'))
+            return
+        print("\033[2J\033[H", end="")
+        if self.pacing.show_banner:
+            if self.banner is None:
+                self.banner = render('POKER CLI', colors=['green', 'yellow'], align='center')
+            print(self.banner)
+
     def exit(self):
         """
         Exits the application, saving any changes to the accounts JSON file.
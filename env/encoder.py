@@ -0,0 +1,186 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from utils.TexasHoldemStates import TexasHoldemState
+
+NO_CARD = -1
+
+# Feature layout of an encoded observation (float32, one row per state):
+#   [0, 52)    hole cards, one-hot by card index (see Card.index)
+#   [52, 104)  board cards, one-hot by card index
+#   [104, 108) street, one-hot: preflop, flop, turn, river (showdown counts as river)
+#   108        pot
+#   109        own stack
+#   110        opponents' stacks
+#   111        own bet in the hand
+#   112        highest bet in the hand
+#   113        amount to call
+#   114        seat counted from the dealer
+# Chip features are divided by the encoder's chip scale.
+HOLE_CARDS = slice(0, 52)
+BOARD = slice(52, 104)
+STREET = slice(104, 108)
+POT = 108
+OWN_STACK = 109
+OPPONENT_STACKS = 110
+OWN_BET = 111
+HIGHEST_BET = 112
+TO_CALL = 113
+POSITION = 114
+FEATURE_COUNT = 115
+
+
+class StateBatch(NamedTuple):
+    """
+    The compact form of many game states, each seen by one player, stored as arrays with one row per state.
+
+    Attributes:
+        hole_cards (np.ndarray): (N, 2) int8 card indexes of the player's hole cards, NO_CARD if not dealt.
+        board (np.ndarray): (N, 5) int8 card indexes of the board, NO_CARD for cards not dealt yet.
+        street (np.ndarray): (N,) int8 TexasHoldemState values.
+        pot (np.ndarray): (N,) int64 chips in the pot.
+        stacks (np.ndarray): (N, 2) int64 chips behind of the player and of all opponents together.
+        bets (np.ndarray): (N, 2) int64 chips the player has put in the hand and the highest bet in the hand.
+        position (np.ndarray): (N,) int8 seat of the player counted from the dealer.
+    """
+    hole_cards: np.ndarray
+    board: np.ndarray
+    street: np.ndarray
+    pot: np.ndarray
+    stacks: np.ndarray
+    bets: np.ndarray
+    position: np.ndarray
+
+    @staticmethod
+    def allocate(size):
+        """
+        Allocates an empty batch.
+
+        Args:
+            size (int): The number of states.
+
+        Returns:
+            StateBatch: The batch, with no cards dealt.
+        """
+        return StateBatch(np.full((size, 2), NO_CARD, dtype=np.int8), np.full((size, 5), NO_CARD, dtype=np.int8),
+                          np.zeros(size, dtype=np.int8), np.zeros(size, dtype=np.int64),
+                          np.zeros((size, 2), dtype=np.int64), np.zeros((size, 2), dtype=np.int64),
+                          np.zeros(size, dtype=np.int8))
+
+
+def write_game_state(game, seat, batch, row):
+    """
+    Writes the state of a game, as seen by the player in a seat, into a row of a batch.
+
+    Args:
+        game (TexasHoldemGame): The game.
+        seat (int): The seat of the player.
+        batch (StateBatch): The batch to write into.
+        row (int): The row to write.
+    """
+    player = game.players[seat]
+    batch.hole_cards[row] = NO_CARD
+    for position, card in enumerate(player.hole_cards[:2]):
+        batch.hole_cards[row, position] = card.index
+    batch.board[row] = NO_CARD
+    for position, card in enumerate(game.community_cards):
+        batch.board[row, position] = card.index
+    batch.street[row] = game.state.value
+    batch.pot[row] = game.pot
+    batch.stacks[row, 0] = player.account.chips
+    batch.stacks[row, 1] = sum(other.account.chips for other in game.players if other is not player)
+    batch.bets[row, 0] = game.players_bet[player.account.username]
+    batch.bets[row, 1] = game.highest_bet
+    batch.position[row] = (seat - game.curr_game_settings.dealer) % len(game.players)
+
+
+class ObservationEncoder:
+    """
+    Encodes batches of compact game states into fixed-size numeric observations.
+
+    The layout of a row is described by the module constants. Observations are written into an array
+    allocated once, so encoding a batch allocates nothing per state.
+
+    Attributes:
+        chip_scale (float): The number chip features are divided by, such as the starting stack.
+        capacity (int): The number of states the output array holds.
+        observations (np.ndarray): The (capacity, FEATURE_COUNT) float32 output array.
+
+    Methods:
+        encode(batch): Encodes a batch of states into float32 observations.
+        encode_cards(batch, out): Encodes the cards of a batch of states into uint8 card planes.
+    """
+
+    def __init__(self, capacity, chip_scale=100.0):
+        """
+        Initializes an ObservationEncoder instance.
+
+        Args:
+            capacity (int): The largest batch to encode.
+            chip_scale (float): The number chip features are divided by.
+        """
+        self.chip_scale = float(chip_scale)
+        self.capacity = capacity
+        self.observations = np.zeros((capacity, FEATURE_COUNT), dtype=np.float32)
+        self.rows = np.arange(capacity)[:, None]
+
+    def encode(self, batch, out=None):
+        """
+        Encodes a batch of states into float32 observations.
+
+        Args:
+            batch (StateBatch): The states to encode.
+            out (np.ndarray): The (N, FEATURE_COUNT) float32 array to write into, or None to use the encoder's array.
+
+        Returns:
+            np.ndarray: The observations, one row per state. Without out, a view of the encoder's array that the
+                next call overwrites.
+        """
+        size = len(batch.street)
+        if out is None:
+            if size > self.capacity:
+                raise ValueError(f"A batch of {size} states exceeds the encoder capacity of {self.capacity}.")
+            out = self.observations[:size]
+        rows = self.rows[:size]
+        out.fill(0)
+
+        hole_cards = batch.hole_cards.astype(np.intp)
+        dealt = hole_cards >= 0
+        out[np.broadcast_to(rows, hole_cards.shape)[dealt], hole_cards[dealt]] = 1
+        board = batch.board.astype(np.intp)
+        dealt = board >= 0
+        out[np.broadcast_to(rows, board.shape)[dealt], BOARD.start + board[dealt]] = 1
+        street = np.clip(batch.street, TexasHoldemState.PREFLOP.value, TexasHoldemState.RIVER.value)
+        out[rows[:, 0], STREET.start + street - TexasHoldemState.PREFLOP.value] = 1
+
+        scale = 1.0 / self.chip_scale
+        np.multiply(batch.pot, scale, out=out[:, POT], casting="unsafe")
+        np.multiply(batch.stacks[:, 0], scale, out=out[:, OWN_STACK], casting="unsafe")
+        np.multiply(batch.stacks[:, 1], scale, out=out[:, OPPONENT_STACKS], casting="unsafe")
+        np.multiply(batch.bets[:, 0], scale, out=out[:, OWN_BET], casting="unsafe")
+        np.multiply(batch.bets[:, 1], scale, out=out[:, HIGHEST_BET], casting="unsafe")
+        np.subtract(out[:, HIGHEST_BET], out[:, OWN_BET], out=out[:, TO_CALL])
+        out[:, POSITION] = batch.position
+        return out
+
+    @staticmethod
+    def encode_cards(batch, out):
+        """
+        Encodes the cards of a batch of states into uint8 card planes: plane 0 holds the hole cards and
+        plane 1 the board, one-hot by card index.
+
+        Args:
+            batch (StateBatch): The states to encode.
+            out (np.ndarray): The (N, 2, 52) uint8 array to write into.
+
+        Returns:
+            np.ndarray: The card planes.
+        """
+        out.fill(0)
+        rows = np.arange(len(batch.street))[:, None]
+        for plane, cards in enumerate((batch.hole_cards, batch.board)):
+            cards = cards.astype(np.intp)
+            dealt = cards >= 0
+            out[np.broadcast_to(rows, cards.shape)[dealt], plane, cards[dealt]] = 1
+        return out
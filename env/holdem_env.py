@@ -0,0 +1,213 @@
+import queue
+import threading
+from dataclasses import dataclass, field
+
+from env.encoder import ObservationEncoder, StateBatch, write_game_state
+from game.game import TexasHoldemGame
+from models.account import Account
+from models.deck import StandardDeck
+from models.player import Player
+from settings import GameSettings
+
+# The discrete actions of the environments. A call is a check when there is nothing to call, and a raise
+# that is not possible is played as a call.
+FOLD = 0
+CALL = 1
+RAISE = 2
+ACTION_COUNT = 3
+
+
+class EpisodeAborted(Exception):
+    """Raised on the game thread to abandon a hand that the environment no longer plays."""
+
+
+@dataclass
+class AgentPlayer(Player):
+    """
+    The seat of the learning agent. Every decision is handed to the environment, which answers with
+    the action passed to step.
+
+    Attributes:
+        env (HoldemEnv): The environment the player belongs to.
+
+    Inherits from:
+        Player
+    """
+    env: "HoldemEnv" = field(default=None, repr=False)
+
+    def decide(self, game):
+        self.env.events.put(("decision", None))
+        action = self.env.actions.get()
+        if action is None:
+            raise EpisodeAborted()
+        legal = game.legal_actions(game.current_player_index)
+        if action == RAISE and legal.can_raise:
+            game.make_raise(self, min(max(legal.call_amount + self.env.raise_size, legal.min_raise),
+                                      legal.max_raise))
+        elif action == FOLD:
+            game.make_fold(self)
+        elif legal.can_call:
+            game.make_call(self)
+        else:
+            game.make_check(self)
+
+
+@dataclass
+class CallingPlayer(Player):
+    """
+    A computer player that checks or calls every decision, the default opponent of the environments.
+
+    Inherits from:
+        Player
+    """
+
+    def to_call_all_in(self, game):
+        game.make_call(self)
+
+    def to_call_or_raise(self, game, diff):
+        game.make_call(self)
+
+    def to_check_raise(self, game):
+        game.make_check(self)
+
+
+class HoldemEnv:
+    """
+    A Gym-style environment in which an agent plays hands of Texas Hold'em against computer players.
+
+    Every episode is one hand of a headless TexasHoldemGame, with the stacks reset before it. The game runs on
+    a worker thread and pauses at every decision of the agent until step is called with the action.
+    Observations are FEATURE_COUNT float32 features laid out as described in env.encoder.
+
+    Attributes:
+        opponents (int): The number of computer players at the table.
+        chips (int): The chips every player starts the hand with.
+        small_blind (int): The small blind of every hand.
+        raise_size (int): The chips a raise puts in on top of the amount to call.
+        seed (int): The session seed the decks are shuffled from, or None for unseeded shuffles.
+        opponent_type (type): The Player class of the computer players.
+        hands (int): The number of hands dealt so far.
+
+    Methods:
+        reset(): Starts a new hand and returns the first observation of the agent.
+        step(action): Plays an action of the agent and returns the next observation, reward and done flag.
+        wait(): Waits until the game thread pauses for the agent or finishes the hand.
+        play(game): Plays a hand on the game thread.
+        close(): Abandons the hand being played.
+    """
+
+    def __init__(self, opponents=1, chips=100, small_blind=1, raise_size=5, seed=None,
+                 opponent_type=CallingPlayer):
+        """
+        Initializes a HoldemEnv instance.
+
+        Args:
+            opponents (int): The number of computer players at the table.
+            chips (int): The chips every player starts the hand with.
+            small_blind (int): The small blind of every hand.
+            raise_size (int): The chips a raise puts in on top of the amount to call.
+            seed (int): The session seed the decks are shuffled from, or None for unseeded shuffles.
+            opponent_type (type): The Player class of the computer players.
+        """
+        self.opponents = opponents
+        self.chips = chips
+        self.small_blind = small_blind
+        self.raise_size = raise_size
+        self.seed = seed
+        self.opponent_type = opponent_type
+        self.hands = 0
+        self.events = queue.Queue()
+        self.actions = queue.Queue()
+        self.game = None
+        self.agent = None
+        self.thread = None
+        self.states = StateBatch.allocate(1)
+        self.encoder = ObservationEncoder(1, chip_scale=chips)
+
+    def reset(self):
+        """
+        Starts a new hand and plays it up to the first decision of the agent. Hands that end before
+        the agent has a decision to make are skipped.
+
+        Returns:
+            np.ndarray: The observation of the agent.
+        """
+        while True:
+            self.close()
+            self.agent = AgentPlayer(Account(username="AGENT", chips=self.chips), env=self)
+            players = [self.opponent_type(Account(username=f"BOT-{i}", chips=self.chips))
+                       for i in range(self.opponents)]
+            # The agent changes seats every hand, so it plays every position.
+            players.insert(self.hands % (self.opponents + 1), self.agent)
+            game_settings = GameSettings(players=players, deck=StandardDeck(), dealer=0,
+                                         small_blind=self.small_blind, big_blind=self.small_blind * 2,
+                                         headless=True, seed=self.seed, hand_number=self.hands)
+            self.hands += 1
+            self.game = TexasHoldemGame(game_settings)
+            self.thread = threading.Thread(target=self.play, args=(self.game,), daemon=True)
+            self.thread.start()
+            observation, reward, done, info = self.wait()
+            if not done:
+                return observation
+
+    def step(self, action):
+        """
+        Plays an action of the agent and runs the hand up to the next decision of the agent or its end.
+
+        Args:
+            action (int): FOLD, CALL or RAISE.
+
+        Returns:
+            tuple: The observation, the reward (the agent's chip change, paid when the hand ends),
+                whether the hand has ended and an info dict.
+        """
+        if self.thread is None:
+            raise RuntimeError("Call reset before step.")
+        self.actions.put(int(action))
+        return self.wait()
+
+    def wait(self):
+        """
+        Waits until the game thread pauses for the agent or finishes the hand.
+
+        Returns:
+            tuple: The observation, reward, done flag and info dict.
+        """
+        event, error = self.events.get()
+        if event == "error":
+            self.thread = None
+            raise error
+        write_game_state(self.game, self.game.players.index(self.agent), self.states, 0)
+        observation = self.encoder.encode(self.states)[0].copy()
+        if event == "done":
+            self.thread.join()
+            self.thread = None
+            return observation, float(self.agent.account.chips - self.chips), True, {}
+        return observation, 0.0, False, {}
+
+    def play(self, game):
+        """
+        Plays a hand. Executed on the game thread.
+
+        Args:
+            game (TexasHoldemGame): The game to play.
+        """
+        try:
+            game.run()
+        except EpisodeAborted:
+            return
+        except Exception as error:
+            self.events.put(("error", error))
+            return
+        self.events.put(("done", None))
+
+    def close(self):
+        """
+        Abandons the hand being played, if any.
+        """
+        if self.thread is not None:
+            self.actions.put(None)
+            self.thread.join()
+            self.thread = None
+        self.events = queue.Queue()
+        self.actions = queue.Queue()
@@ -0,0 +1,280 @@
+import numpy as np
+
+from env.encoder import FEATURE_COUNT, NO_CARD, ObservationEncoder, StateBatch
+from env.holdem_env import FOLD, CALL, RAISE
+from utils.TexasHoldemCombinations import HandChecker
+from utils.TexasHoldemStates import TexasHoldemState
+from utils.rng import derive_seed
+
+# The visible board cards by street, indexed by TexasHoldemState value.
+_BOARD_SIZE = np.array([0, 0, 3, 4, 5, 5, 5], dtype=np.int8)
+_PREFLOP = TexasHoldemState.PREFLOP.value
+_RIVER = TexasHoldemState.RIVER.value
+
+
+def calling_policy(env, games):
+    """
+    The default opponent policy of VectorHoldemEnv: check or call every decision.
+
+    Args:
+        env (VectorHoldemEnv): The environment.
+        games (np.ndarray): The indexes of the games in which the opponent acts.
+
+    Returns:
+        np.ndarray: The action of the opponent in every game.
+    """
+    return np.full(len(games), CALL, dtype=np.int8)
+
+
+class VectorHoldemEnv:
+    """
+    Many heads-up hands of Texas Hold'em stored as stacked arrays and stepped together.
+
+    The agent plays seat 0 of every game and the opponent policy plays seat 1. The rules follow
+    TexasHoldemGame heads-up: the dealer posts the big blind, the other player posts the small blind and acts
+    first on every street. A raise puts in the amount to call plus raise_size, at most max_raises times per
+    street, and chips a short all-in cannot match are returned. Every game is one hand with fresh stacks;
+    a finished game is dealt a new hand at once, so every step returns a decision of the agent in every game.
+    Observations are FEATURE_COUNT float32 features per game, laid out as described in env.encoder.
+
+    Attributes:
+        num_envs (int): The number of games.
+        chips (int): The chips both players start every hand with.
+        small_blind (int): The small blind of every hand.
+        raise_size (int): The chips a raise puts in on top of the amount to call.
+        max_raises (int): The number of raises allowed per street.
+        opponent: The policy of seat 1, called with the environment and the indexes of the games to act in.
+        deck (np.ndarray): The shuffled deck of every game: hole cards of seat 0, of seat 1, then the board.
+        stacks (np.ndarray): The chips behind of both players in every game.
+        bets (np.ndarray): The chips both players have put in the hand in every game.
+        street (np.ndarray): The TexasHoldemState value of every game.
+        dealer (np.ndarray): The seat of the dealer in every game.
+        to_act (np.ndarray): The seat to act in every game.
+        raises (np.ndarray): The raises made in the current street of every game.
+        acted (np.ndarray): The actions taken in the current street of every game since the last raise.
+        finished (np.ndarray): Whether the hand of every game has ended and its pot has been awarded.
+        states (StateBatch): The compact states of the games as seen by the agent, filled by compact_states.
+
+    Methods:
+        reset(): Deals a new hand in every game and returns the observations of the agent.
+        step(actions): Plays an action of the agent in every game.
+        compact_states(): Writes the states of the games as seen by the agent in compact form.
+        observe(): Writes the observations of the agent.
+        act(games, actions): Applies actions of the players to act in some games.
+        settle(): Plays the opponent and deals new hands until the agent acts in every game.
+        deal(games): Deals new hands in some games.
+        showdown(games): Awards the pots of some games at showdown.
+    """
+
+    def __init__(self, num_envs, chips=100, small_blind=1, raise_size=5, max_raises=4, opponent=calling_policy,
+                 seed=None):
+        """
+        Initializes a VectorHoldemEnv instance.
+
+        Args:
+            num_envs (int): The number of games.
+            chips (int): The chips both players start every hand with.
+            small_blind (int): The small blind of every hand.
+            raise_size (int): The chips a raise puts in on top of the amount to call.
+            max_raises (int): The number of raises allowed per street.
+            opponent: The policy of seat 1, called with the environment and the indexes of the games to act in.
+            seed (int): The session seed the decks are shuffled from, or None for unseeded shuffles.
+        """
+        self.num_envs = num_envs
+        self.chips = chips
+        self.small_blind = small_blind
+        self.raise_size = raise_size
+        self.max_raises = max_raises
+        self.opponent = opponent
+        self.rng = np.random.default_rng(None if seed is None else derive_seed(seed, "vector-env"))
+
+        self.deck = np.zeros((num_envs, 52), dtype=np.int8)
+        self.stacks = np.zeros((num_envs, 2), dtype=np.int64)
+        self.bets = np.zeros((num_envs, 2), dtype=np.int64)
+        self.street = np.zeros(num_envs, dtype=np.int8)
+        self.dealer = np.ones(num_envs, dtype=np.int8)
+        self.to_act = np.zeros(num_envs, dtype=np.int8)
+        self.raises = np.zeros(num_envs, dtype=np.int8)
+        self.acted = np.zeros(num_envs, dtype=np.int8)
+        self.finished = np.zeros(num_envs, dtype=bool)
+
+        self.states = StateBatch.allocate(num_envs)
+        self.encoder = ObservationEncoder(num_envs, chip_scale=chips)
+        self.observations = np.zeros((num_envs, FEATURE_COUNT), dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.all_games = np.arange(num_envs)
+
+    def reset(self):
+        """
+        Deals a new hand in every game and plays the opponent up to the first decision of the agent.
+
+        Returns:
+            np.ndarray: The observations of the agent, one row per game.
+        """
+        self.deal(self.all_games)
+        self.rewards.fill(0)
+        self.dones.fill(False)
+        self.settle()
+        return self.observe().copy()
+
+    def step(self, actions):
+        """
+        Plays an action of the agent in every game, then plays the opponent and deals new hands in
+        finished games until the agent has a decision in every game.
+
+        Args:
+            actions: FOLD, CALL or RAISE for every game.
+
+        Returns:
+            tuple: The observations, the rewards (the agent's chip change in hands that ended), the done flags
+                of the games whose hand ended and an info dict.
+        """
+        self.rewards.fill(0)
+        self.dones.fill(False)
+        self.act(self.all_games, np.asarray(actions))
+        self.settle()
+        return self.observe().copy(), self.rewards.copy(), self.dones.copy(), {}
+
+    def compact_states(self):
+        """
+        Writes the states of the games as seen by the agent in compact form.
+
+        Returns:
+            StateBatch: The states, one row per game.
+        """
+        states = self.states
+        states.hole_cards[:] = self.deck[:, 0:2]
+        hidden = np.arange(5) >= _BOARD_SIZE[self.street][:, None]
+        np.copyto(states.board, np.where(hidden, NO_CARD, self.deck[:, 4:9]))
+        states.street[:] = self.street
+        self.bets.sum(axis=1, out=states.pot)
+        states.stacks[:] = self.stacks
+        states.bets[:, 0] = self.bets[:, 0]
+        self.bets.max(axis=1, out=states.bets[:, 1])
+        # The agent sits in seat 0, so its seat counted from the dealer is the dealer's seat.
+        states.position[:] = self.dealer
+        return states
+
+    def observe(self):
+        """
+        Writes the observations of the agent.
+
+        Returns:
+            np.ndarray: The observations, one row per game.
+        """
+        return self.encoder.encode(self.compact_states(), self.observations)
+
+    def act(self, games, actions):
+        """
+        Applies the actions of the players to act in some games, closing streets and hands they end.
+
+        Args:
+            games (np.ndarray): The indexes of the games.
+            actions (np.ndarray): The action taken in every one of the games.
+        """
+        seat = self.to_act[games]
+        other = 1 - seat
+        to_call = self.bets[games, other] - self.bets[games, seat]
+        stack = self.stacks[games, seat]
+
+        fold = actions == FOLD
+        raising = (actions == RAISE) & (self.raises[games] < self.max_raises) & (stack > to_call)
+        put = np.where(raising, np.minimum(to_call + self.raise_size, stack), np.minimum(to_call, stack))
+        put[fold] = 0
+        self.stacks[games, seat] -= put
+        self.bets[games, seat] += put
+        self.raises[games] += raising
+        self.acted[games] = np.where(raising, 1, self.acted[games] + 1)
+        self.to_act[games] = other
+
+        folded = games[fold]
+        if folded.size:
+            winner = other[fold]
+            self.stacks[folded, winner] += self.bets[folded].sum(axis=1)
+            self.finished[folded] = True
+
+        closing = ~fold & ~raising & (self.acted[games] >= 2)
+        closed = games[closing]
+        if not closed.size:
+            return
+        # Chips of the bigger bet that a short all-in could not match go back to their owner.
+        excess = self.bets[closed, 0] - self.bets[closed, 1]
+        owner = (excess < 0).astype(np.int8)
+        refund = np.abs(excess)
+        self.bets[closed, owner] -= refund
+        self.stacks[closed, owner] += refund
+
+        all_in = (self.stacks[closed] == 0).any(axis=1)
+        ending = all_in | (self.street[closed] >= _RIVER)
+        self.showdown(closed[ending])
+        going_on = closed[~ending]
+        self.street[going_on] += 1
+        self.raises[going_on] = 0
+        self.acted[going_on] = 0
+        self.to_act[going_on] = 1 - self.dealer[going_on]
+
+    def settle(self):
+        """
+        Plays the opponent and deals new hands in finished games until the agent acts in every game,
+        adding the result of every finished hand to the rewards.
+        """
+        while True:
+            finished = np.flatnonzero(self.finished)
+            if finished.size:
+                self.rewards[finished] += self.stacks[finished, 0] - self.chips
+                self.dones[finished] = True
+                self.deal(finished)
+            waiting = np.flatnonzero(self.to_act == 1)
+            if not waiting.size:
+                return
+            self.act(waiting, np.asarray(self.opponent(self, waiting)))
+
+    def deal(self, games):
+        """
+        Deals new hands in some games: shuffles their decks, resets the stacks, moves the dealer and
+        posts the blinds.
+
+        Args:
+            games (np.ndarray): The indexes of the games.
+        """
+        self.deck[games] = self.rng.random((len(games), 52)).argsort(axis=1)
+        self.dealer[games] = 1 - self.dealer[games]
+        big_blind_seat = self.dealer[games]
+        small_blind_seat = 1 - big_blind_seat
+        self.stacks[games] = self.chips
+        self.bets[games] = 0
+        self.bets[games, small_blind_seat] = self.small_blind
+        self.bets[games, big_blind_seat] = self.small_blind * 2
+        self.stacks[games] -= self.bets[games]
+        self.street[games] = _PREFLOP
+        self.to_act[games] = small_blind_seat
+        self.raises[games] = 0
+        self.acted[games] = 0
+        self.finished[games] = False
+
+    def showdown(self, games):
+        """
+        Awards the pots of some games at showdown, splitting tied pots.
+
+        Args:
+            games (np.ndarray): The indexes of the games.
+        """
+        if not games.size:
+            return
+        score = HandChecker.score_indexes
+        decks = self.deck[games].tolist()
+        wins = np.empty(len(games), dtype=np.int8)
+        for position, deck in enumerate(decks):
+            first = score(deck[0:2] + deck[4:9])
+            second = score(deck[2:9])
+            wins[position] = 0 if first > second else 1 if second > first else 2
+        pots = self.bets[games].sum(axis=1)
+        halves, odd_chips = np.divmod(pots, 2)
+        # The odd chip of a split pot goes to the first seat left of the dealer, as in the game.
+        first_seat = 1 - self.dealer[games]
+        for seat in (0, 1):
+            split = halves + odd_chips * (first_seat == seat)
+            self.stacks[games, seat] += np.where(wins == seat, pots, np.where(wins == 2, split, 0))
+        self.street[games] = TexasHoldemState.SHOWDOWN.value
+        self.finished[games] = True
@@ -0,0 +1,107 @@
+# The bits of a board texture, as computed by board_texture.
+PAIRED = 1 << 0  # two cards or more share a rank
+TRIPS = 1 << 1  # three cards or more share a rank
+TWO_PAIRED = 1 << 2  # two ranks are paired
+MONOTONE = 1 << 3  # three cards or more, all of one suit
+TWO_TONE = 1 << 4  # no more than two cards of any suit, and two of one suit
+FLUSH_POSSIBLE = 1 << 5  # three cards or more of one suit
+FLUSH_DRAW = 1 << 6  # two cards of one suit with cards still to come, and no flush possible yet
+CONNECTED = 1 << 7  # two cards of adjacent ranks
+STRAIGHT_POSSIBLE = 1 << 8  # three ranks in one straight
+# The class of the highest card, two bits: LOW (eight or lower), MIDDLE (nine to jack), HIGH (queen or king)
+# or ACE.
+HIGH_CARD_SHIFT = 9
+HIGH_CARD_MASK = 0b11 << HIGH_CARD_SHIFT
+LOW, MIDDLE, HIGH, ACE = range(4)
+HIGH_CARD_CLASSES = ("eight high or lower", "nine to jack high", "king/queen high", "ace high")
+
+# Flags that make the board draw-heavy ("wet").
+WET = FLUSH_POSSIBLE | FLUSH_DRAW | STRAIGHT_POSSIBLE
+
+_NAMES = ((TRIPS, "trips"), (TWO_PAIRED, "two paired"), (PAIRED, "paired"), (MONOTONE, "monotone"),
+          (TWO_TONE, "two-tone"), (FLUSH_POSSIBLE, "flush possible"), (FLUSH_DRAW, "flush draw"),
+          (CONNECTED, "connected"), (STRAIGHT_POSSIBLE, "straight possible"))
+# The rank masks of every straight, the wheel with the ace low.
+_STRAIGHTS = tuple(0b11111 << low for low in range(9)) + ((1 << 12) | 0b1111,)
+
+
+def board_texture(board):
+    """
+    Computes the texture of a board from its rank and suit counts, in one pass over the cards.
+
+    Args:
+        board: The card indexes of the community cards.
+
+    Returns:
+        int: The texture bits, 0 for an empty board.
+    """
+    if not board:
+        return 0
+    rank_counts = [0] * 13
+    suit_counts = [0] * 4
+    rank_mask = 0
+    for index in board:
+        suit, rank = divmod(int(index), 13)
+        rank_counts[rank] += 1
+        suit_counts[suit] += 1
+        rank_mask |= 1 << rank
+
+    texture = 0
+    pairs = sum(count >= 2 for count in rank_counts)
+    if pairs:
+        texture |= PAIRED
+    if pairs >= 2:
+        texture |= TWO_PAIRED
+    if max(rank_counts) >= 3:
+        texture |= TRIPS
+
+    most_of_a_suit = max(suit_counts)
+    if most_of_a_suit >= 3:
+        texture |= FLUSH_POSSIBLE
+        if most_of_a_suit == len(board):
+            texture |= MONOTONE
+    elif most_of_a_suit == 2:
+        texture |= TWO_TONE
+        if len(board) < 5:
+            texture |= FLUSH_DRAW
+
+    # Adjacent ranks, counting the ace as a one next to the two as well.
+    if rank_mask & (rank_mask >> 1) or (rank_mask & 1 and rank_mask >> 12):
+        texture |= CONNECTED
+    if any((rank_mask & straight).bit_count() >= 3 for straight in _STRAIGHTS):
+        texture |= STRAIGHT_POSSIBLE
+
+    high = rank_mask.bit_length() + 1
+    high_class = LOW if high <= 8 else MIDDLE if high <= 11 else HIGH if high <= 13 else ACE
+    return texture | high_class << HIGH_CARD_SHIFT
+
+
+def high_card_class(texture):
+    """
+    Returns the class of the highest card of a board.
+
+    Args:
+        texture (int): The texture bits.
+
+    Returns:
+        int: LOW, MIDDLE, HIGH or ACE.
+    """
+    return (texture & HIGH_CARD_MASK) >> HIGH_CARD_SHIFT
+
+
+def describe(texture):
+    """
+    Describes a board texture in words.
+
+    Args:
+        texture (int): The texture bits of a board that is not empty.
+
+    Returns:
+        str: The features of the board, such as "paired, two-tone, ace high".
+    """
+    names = [name for flag, name in _NAMES if texture & flag]
+    # Trips and two paired boards are paired too; say only the strongest.
+    if texture & (TRIPS | TWO_PAIRED):
+        names.remove("paired")
+    names.append(HIGH_CARD_CLASSES[high_card_class(texture)])
+    return ", ".join(names)
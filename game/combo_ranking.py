@@ -0,0 +1,208 @@
+from itertools import combinations
+from typing import NamedTuple
+
+import numpy as np
+
+from solver.abstraction import chen_score
+from utils.TexasHoldemCombinations import HandChecker
+
+_preflop_percentiles = None
+_preflop_ranking = None
+
+
+def preflop_percentiles():
+    """
+    Returns the share of starting hands ranked above every hole-card pair by Chen score, computed once.
+
+    Returns:
+        np.ndarray: (52, 52) symmetric share, 0 for the pairs of aces.
+    """
+    global _preflop_percentiles
+    if _preflop_percentiles is None:
+        pairs = list(combinations(range(52), 2))
+        scores = np.array([chen_score(first, second) for first, second in pairs])
+        above = len(scores) - np.searchsorted(np.sort(scores), scores, side="right")
+        _preflop_percentiles = np.zeros((52, 52))
+        for (first, second), count in zip(pairs, above):
+            _preflop_percentiles[first, second] = _preflop_percentiles[second, first] = count / len(pairs)
+    return _preflop_percentiles
+
+
+class HandStanding(NamedTuple):
+    """
+    Where a hand stands among every holding possible on a board.
+
+    Attributes:
+        score (int): The score of the hand with the board.
+        percentile (float): The share of the other holdings the hand is not behind, from 0 to 1.
+        better_values (int): The number of distinct hand values an opponent can hold that beat the hand, 0 for
+            the nuts.
+        better_combos (int): The number of pairs an opponent can hold that beat the hand.
+    """
+    score: int
+    percentile: float
+    better_values: int
+    better_combos: int
+
+
+class ComboRanking:
+    """
+    Every hole-card pair not on a board, scored once and sorted by score: the ranking of all hands on the
+    board, built once per board and shared by everyone at the table.
+
+    The pairs a hand is not behind are the prefix of the sorted pairs up to its score, so the hand strength
+    of any player is counted with prefix sums: the count of that prefix, minus the pairs the player's own
+    cards block, read from a prefix sum over the sorted positions of the pairs holding each card. A range
+    (see range_weights) gets its own prefix sums of weights, built the first time it is used. Against
+    several opponents the strengths multiply, HS^n without ranges.
+
+    Attributes:
+        board (tuple): The card indexes of the board.
+        combos (np.ndarray): (count, 2) card indexes of every pair not on the board, sorted by score.
+        scores (np.ndarray): (count,) score of every pair with the board, ascending.
+        positions (np.ndarray): (52, 52) position of every pair in the sorted pairs, -1 if on the board.
+        card_positions (list): The sorted positions of the pairs holding every card.
+        prefixes (dict): The prefix sums of every range used, by range share (None for every pair).
+
+    Methods:
+        range_weights(share): Returns the weights of the pairs of a range made of the best starting hands.
+        prefix(share): Returns the prefix sums of the weights of a range.
+        strength(hole, ranges): Returns the hand strength of hole cards against opponents.
+        standing(hole): Returns the percentile of hole cards and how far they are from the nuts.
+        locate(hole): Returns the score of hole cards and where the pairs that beat them start.
+    """
+
+    def __init__(self, board):
+        """
+        Initializes a ComboRanking instance, scoring every pair of cards not on the board.
+
+        Args:
+            board: The card indexes of the board.
+        """
+        self.board = tuple(board)
+        remaining = [index for index in range(52) if index not in self.board]
+        combos = np.array(list(combinations(remaining, 2)), dtype=np.int8)
+        score = HandChecker.score_indexes
+        scores = np.array([score((first, second) + self.board) for first, second in combos.tolist()],
+                          dtype=np.int64)
+        order = np.argsort(scores, kind="stable")
+        self.combos = combos[order]
+        self.scores = scores[order]
+        self.positions = np.full((52, 52), -1, dtype=np.int64)
+        sorted_positions = np.arange(len(self.combos))
+        self.positions[self.combos[:, 0], self.combos[:, 1]] = sorted_positions
+        self.positions[self.combos[:, 1], self.combos[:, 0]] = sorted_positions
+        self.card_positions = [np.flatnonzero((self.combos == card).any(axis=1)) for card in range(52)]
+        self.prefixes = {}
+
+    def range_weights(self, share):
+        """
+        Returns the weights of the pairs of a range made of the best starting hands, by Chen score.
+
+        Args:
+            share (float): The share of starting hands in the range, such as a player's VPIP, or None for a
+                range of every pair.
+
+        Returns:
+            np.ndarray: (count,) 1 for the pairs in the range, 0 for the others.
+        """
+        if share is None:
+            return np.ones(len(self.combos))
+        percentiles = preflop_percentiles()[self.combos[:, 0], self.combos[:, 1]]
+        return (percentiles < share).astype(float)
+
+    def prefix(self, share):
+        """
+        Returns the prefix sums of the weights of a range, computed the first time the range is used.
+
+        Args:
+            share (float): The share of starting hands in the range, or None for a range of every pair.
+
+        Returns:
+            tuple: The weights, their prefix sums over the sorted pairs, and the prefix sums over the pairs
+                holding every card.
+        """
+        prefix = self.prefixes.get(share)
+        if prefix is None:
+            weights = self.range_weights(share)
+            card_sums = [np.concatenate(([0.0], np.cumsum(weights[positions]))) for positions in self.card_positions]
+            prefix = self.prefixes[share] = (weights, np.concatenate(([0.0], np.cumsum(weights))), card_sums)
+        return prefix
+
+    def strength(self, hole, ranges=(None,)):
+        """
+        Returns the hand strength of hole cards against opponents, on the scale of
+        HandChecker.calculate_hand_strength: half the chance of being behind none of them, which against one
+        opponent without a range is the same value.
+
+        Args:
+            hole: The card indexes of the hole cards.
+            ranges: The range share (see range_weights) of every opponent, None for any pair.
+
+        Returns:
+            float: The hand strength.
+        """
+        first, second = hole
+        _, end, first_end, second_end = self.locate(hole)
+        own = self.positions[first, second]
+        not_behind = 1.0
+        for share in ranges:
+            weights, sums, card_sums = self.prefix(share)
+            total = sums[-1] - card_sums[first][-1] - card_sums[second][-1] + weights[own]
+            if total <= 0:
+                weights, sums, card_sums = self.prefix(None)
+                total = sums[-1] - card_sums[first][-1] - card_sums[second][-1] + weights[own]
+            count = sums[end] - card_sums[first][first_end] - card_sums[second][second_end] + weights[own]
+            not_behind *= count / total
+        return not_behind / 2
+
+    def standing(self, hole):
+        """
+        Returns the percentile of hole cards among every holding possible on the board and how far they are
+        from the nuts, leaving out the pairs the hole cards block.
+
+        Args:
+            hole: The card indexes of the hole cards.
+
+        Returns:
+            HandStanding: The standing of the hand.
+        """
+        first, second = hole
+        score, end, first_end, second_end = self.locate(hole)
+        ahead = np.ones(len(self.scores) - end, dtype=bool)
+        ahead[self.card_positions[first][first_end:] - end] = False
+        ahead[self.card_positions[second][second_end:] - end] = False
+        better = self.scores[end:][ahead]
+        values = int(np.count_nonzero(better[1:] != better[:-1])) + 1 if len(better) else 0
+        return HandStanding(score, float(2 * self.strength(hole)), values, len(better))
+
+    def locate(self, hole):
+        """
+        Returns the score of hole cards and where the pairs that beat them start, in the sorted pairs and in
+        the sorted positions of the pairs holding each hole card.
+
+        Args:
+            hole: The card indexes of the hole cards.
+
+        Returns:
+            tuple: The score, then the three positions.
+        """
+        first, second = hole
+        score = HandChecker.score_indexes(tuple(hole) + self.board)
+        # The pairs before this position are not ahead of the hand; the hand's own pair is one of them.
+        end = np.searchsorted(self.scores, score, side="right")
+        return (score, end, np.searchsorted(self.card_positions[first], end),
+                np.searchsorted(self.card_positions[second], end))
+
+
+def preflop_ranking():
+    """
+    Returns the ranking of the starting hands, the same at every table and built once.
+
+    Returns:
+        ComboRanking: The ranking of the pairs on an empty board.
+    """
+    global _preflop_ranking
+    if _preflop_ranking is None:
+        _preflop_ranking = ComboRanking(())
+    return _preflop_ranking
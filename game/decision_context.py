@@ -0,0 +1,214 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+from game.combo_ranking import ComboRanking, preflop_ranking
+from utils.instrumentation import COUNTERS
+from utils.timed_input import DecisionTimeout, check_deadline
+
+_speculation_executor = None
+
+
+def speculation_executor():
+    """
+    Returns the process pool speculative computations run on, creating it on first use.
+
+    Returns:
+        ProcessPoolExecutor: The pool.
+    """
+    global _speculation_executor
+    if _speculation_executor is None:
+        _speculation_executor = ProcessPoolExecutor(max_workers=max((os.cpu_count() or 2) - 1, 1))
+    return _speculation_executor
+
+
+class DecisionContext:
+    """
+    The values players derive from their cards during a hand, computed once per street and shared by
+    everyone at the table.
+
+    Every hand strength is counted from the ComboRanking of the board, built once per street: on a process
+    pool as soon as the street is dealt while a person decides, or by the first player who needs it. A
+    player can act several times on a street (check, face a raise, call) while its cards and the board stay
+    the same, so its hand strength is also kept until the next community card is dealt.
+
+    Attributes:
+        strengths (dict): The hand strength of every player on the current street, by username.
+        pending (Future): The speculative build of the ranking of the current street, or None.
+        ranking (ComboRanking): The ranking of the pairs on the current board, or None until needed.
+        board_size (int): The number of community cards the cached values were computed with.
+        computed (int): The number of hand strengths computed in the hand.
+        reused (int): The number of hand strength computations avoided in the hand.
+        prefetched (int): The number of rankings collected from speculative builds in the hand.
+
+    Methods:
+        hand_strength(player, community_cards): Returns the hand strength of a player.
+        multiway_strength(player, community_cards, ranges): Returns the hand strength against opponents.
+        combo_ranking(community_cards, deadline): Returns the ranking of the pairs on the board.
+        ready_ranking(community_cards): Returns the ranking of the pairs on the board if it is ready.
+        prefetch(community_cards): Starts building the ranking of the board in the background.
+        new_street(): Forgets the values of the previous street.
+        close(): Cancels the speculative build if nobody collected it.
+    """
+
+    def __init__(self, executor=None):
+        """
+        Initializes a DecisionContext instance for a new hand.
+
+        Args:
+            executor (Executor): The executor running speculative computations, the shared process pool if None.
+        """
+        self.executor = executor
+        self.strengths = {}
+        self.pending = None
+        self.ranking = None
+        self.board_size = 0
+        self.computed = 0
+        self.reused = 0
+        self.prefetched = 0
+
+    def hand_strength(self, player, community_cards):
+        """
+        Returns the hand strength of a player against one opponent, computing it only the first time on a street.
+
+        Args:
+            player (Player): The player.
+            community_cards (list): The community cards.
+
+        Returns:
+            float: The strength of the player's hand, as returned by ComboRanking.strength.
+
+        Raises:
+            DecisionTimeout: If the player's deadline passes before the strength is known.
+        """
+        self.check_board(community_cards)
+        username = player.account.username
+        strength = self.strengths.get(username)
+        if strength is None:
+            ranking = self.combo_ranking(community_cards, player.deadline)
+            strength = self.strengths[username] = ranking.strength([card.index for card in player.hole_cards])
+            self.computed += 1
+            COUNTERS.add("hand_strength.computed")
+            check_deadline(player.deadline)
+        else:
+            self.reused += 1
+            COUNTERS.add("hand_strength.reused")
+        return strength
+
+    def multiway_strength(self, player, community_cards, ranges):
+        """
+        Returns the hand strength of a player against several opponents, HS^n without ranges.
+
+        Args:
+            player (Player): The player.
+            community_cards (list): The community cards.
+            ranges (list): The range share of every live opponent (see ComboRanking.range_weights), None for
+                an opponent who can hold any pair.
+
+        Returns:
+            float: The hand strength, as returned by ComboRanking.strength.
+
+        Raises:
+            DecisionTimeout: If the player's deadline passes before the strength is known.
+        """
+        ranking = self.combo_ranking(community_cards, player.deadline)
+        COUNTERS.add("hand_strength.multiway")
+        return ranking.strength([card.index for card in player.hole_cards], ranges)
+
+    def combo_ranking(self, community_cards, deadline=None):
+        """
+        Returns the ranking of the pairs on the board, collecting the speculative build if there is one and
+        building it otherwise. The ranking of the starting hands is the same every hand and built once.
+
+        Args:
+            community_cards (list): The community cards.
+            deadline (float): The time.monotonic() value after which to stop waiting for a speculative build.
+
+        Returns:
+            ComboRanking: The ranking.
+
+        Raises:
+            DecisionTimeout: If the deadline passes while the speculative build is still running. The build is
+                kept, so a later decision can collect it.
+        """
+        self.check_board(community_cards)
+        if self.ranking is None and self.pending is not None:
+            try:
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                self.ranking = self.pending.result(timeout)
+                self.prefetched += 1
+                COUNTERS.add("combo_ranking.prefetched")
+            except FutureTimeout:
+                raise DecisionTimeout()
+            except Exception:
+                self.ranking = None
+            self.pending = None
+        if self.ranking is None:
+            if community_cards:
+                self.ranking = ComboRanking([card.index for card in community_cards])
+                COUNTERS.add("combo_ranking.built")
+            else:
+                self.ranking = preflop_ranking()
+        return self.ranking
+
+    def ready_ranking(self, community_cards):
+        """
+        Returns the ranking of the pairs on the board without waiting for the speculative build, so a display
+        never holds up the person the build overlaps with. Without a speculative build, it is built at once.
+
+        Args:
+            community_cards (list): The community cards.
+
+        Returns:
+            ComboRanking: The ranking, or None while the speculative build is still running.
+        """
+        self.check_board(community_cards)
+        if self.ranking is None and self.pending is not None and not self.pending.done():
+            return None
+        return self.combo_ranking(community_cards)
+
+    def prefetch(self, community_cards):
+        """
+        Starts building the ranking of the board in the background, so the decisions on the street only
+        collect it.
+
+        Args:
+            community_cards (list): The community cards.
+        """
+        self.check_board(community_cards)
+        if not community_cards or self.ranking is not None or self.pending is not None:
+            return
+        try:
+            executor = self.executor if self.executor is not None else speculation_executor()
+            self.pending = executor.submit(ComboRanking, [card.index for card in community_cards])
+        except (RuntimeError, OSError):
+            # Without a usable pool, the ranking is built when a player first needs it.
+            return
+        COUNTERS.add("combo_ranking.speculated")
+
+    def check_board(self, community_cards):
+        """
+        Forgets the cached values if the community cards changed since they were computed.
+
+        Args:
+            community_cards (list): The community cards.
+        """
+        if len(community_cards) != self.board_size:
+            self.new_street()
+            self.board_size = len(community_cards)
+
+    def new_street(self):
+        """
+        Forgets the values of the previous street. Called when community cards are dealt.
+        """
+        self.strengths.clear()
+        self.ranking = None
+        self.close()
+
+    def close(self):
+        """
+        Cancels the speculative build if nobody collected it.
+        """
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
@@ -1,12 +1,18 @@
 import copy
+import dataclasses
 import os
 import time
+from operator import itemgetter
 
-from utils.TexasHoldemStates import TexasHoldemState
+from game.board_texture import board_texture, describe
+from game.decision_context import DecisionContext
+from game.live_equity import LiveEquity
+from utils.TexasHoldemStates import TexasHoldemState, Action, LegalActions, NO_ACTIONS
 from utils.color import print_with_color
 from utils.color import Color
 from models.player import HumanPlayer
-from utils.TexasHoldemCombinations import HandChecker
+from utils.TexasHoldemCombinations import HandChecker, HandStrength
+from utils.rng import make_rng
 
 
 class Game:
@@ -24,12 +30,25 @@ class TexasHoldemGame(Game):
             active_players (int): The number of active players in the game.
             curr_game_settings: The settings for the current game.
             running (bool): Flag indicating whether the game is running.
+            headless (bool): Flag indicating whether the game runs without any output or pauses.
             state (TexasHoldemState): The current state of the game.
             pot (int): The total amount of chips in the pot.
             community_cards (list): A list of Card objects representing the community cards.
             players_bet (dict): A dictionary storing the bets made by each player.
+            highest_bet (int): The highest entry of players_bet, kept up to date by every action.
+            street_raises (int): The number of raises and bets made in the current street.
             last_state_player_index (int): The index of the last player to take action in the current state.
             current_player_index (int): The index of the current player taking action.
+            observers (list): The GameObserver objects following the game.
+            showdown_ranking (list): (score, player) pairs of the players at showdown, best hand first.
+            timeouts (list): The usernames of the players who ran out of time, one entry per timed out decision.
+            actions (list): (seat, Action) pairs of the actions taken in the hand, in order.
+            decision_context (DecisionContext): The values computer players derive from their cards this hand.
+            live_equity (LiveEquity): The estimate of the human player's equity, or None until displayed.
+            standing_board (int): The number of community cards the human player's standing was last displayed
+                with, or None.
+            board_texture (int): The texture bits of the community cards (see game.board_texture), computed once
+                per street.
 
         Methods:
             deal_preflop(): Deals the preflop round of Texas Hold'em.
@@ -40,31 +59,47 @@ class TexasHoldemGame(Game):
             make_check(player): Makes a check action for the specified player.
             make_call(player): Makes a call action for the specified player.
             make_fold(player): Makes a fold action for the specified player.
+            make_timeout(player): Takes the default action for a player who ran out of time.
+            amount_to_call(player): Returns the amount of chips the player has to put in to call.
+            legal_actions(seat): Returns the actions the player in a seat can take.
+            notify_action(player, action, amount): Logs an action that was applied and tells the observers.
+            announce(message, color): Announces an action or event at the table.
             collect_blind(player_position, blind_amount): Collects blinds from players.
             run(): Runs the Texas Hold'em game.
+            batching_bot_streets(): Checks whether the current street is played without being displayed.
+            speculate(): Starts the computer players' hand strength in the background while an interactive
+                player can act.
             next_state(): Moves the game to the next state.
             display_table(): Displays the current state of the table.
             display_combination(cards): Displays the best hand combination for the given cards.
             display_cards(cards): Displays the cards.
             display_hole_cards(): Displays the hole cards for the human player.
             display_human_player(): Displays the hole cards and best hand combination for the human player.
+            display_standing(player): Displays where a player's hand stands among the holdings possible.
+            display_equity(player): Displays the equity of a player's hand against the live opponents.
             determine_winner(): Determines the winner(s) of the game.
+            display_winners(winners, splitted_pot, score): Displays the winner(s) of the game.
             deal_showdown(): Deals with the showdown phase of the game.
     """
 
-    def __init__(self, game_settings):
+    def __init__(self, game_settings, observers=()):
         """
                Initializes a TexasHoldemGame instance with the specified game settings.
 
                Args:
                    game_settings: The settings for the current game.
+                   observers: The GameObserver objects following the game.
         """
+        self.observers = list(observers)
         self.players = game_settings.players[:]
         self.active_players = len(self.players)
 
-        self.curr_game_settings = copy.deepcopy(game_settings)
+        # Only the deck is consumed by the game, so it is the only part worth copying; players may hold
+        # resources such as connections that cannot be copied.
+        self.curr_game_settings = dataclasses.replace(game_settings, deck=copy.deepcopy(game_settings.deck))
 
         self.running = False
+        self.headless = game_settings.headless
         self.state = TexasHoldemState.PREFLOP
 
         self.pot = 0
@@ -75,10 +110,20 @@ class TexasHoldemGame(Game):
         for player in self.players:
             self.players_bet[player.account.username] = 0
             player.active = True
+        self.highest_bet = 0
+        self.street_raises = 0
 
         self.last_state_player_index = None
         self.current_player_index = 0
 
+        self.showdown_ranking = []
+        self.timeouts = []
+        self.actions = []
+        self.decision_context = DecisionContext()
+        self.live_equity = None
+        self.standing_board = None
+        self.board_texture = 0
+
     def deal_preflop(self):
         """
               Deals the preflop round of Texas Hold'em.
@@ -87,6 +132,7 @@ class TexasHoldemGame(Game):
         """
         for player in self.players:
             player.hole_cards = [self.curr_game_settings.deck.deal_card() for _ in range(2)]
+        self.speculate()
 
         small_blind_player = (self.curr_game_settings.dealer + 1) % len(self.players)
         big_blind_player = (self.curr_game_settings.dealer + 2) % len(self.players)
@@ -127,12 +173,18 @@ class TexasHoldemGame(Game):
         """
         self.current_player_index = (self.curr_game_settings.dealer + 1) % len(self.players)
         self.last_state_player_index = self.curr_game_settings.dealer
+        self.street_raises = 0
 
         if self.state == TexasHoldemState.FLOP:
             for _ in range(3):
                 self.community_cards.append(self.curr_game_settings.deck.deal_card())
         else:
             self.community_cards.append(self.curr_game_settings.deck.deal_card())
+        self.board_texture = board_texture([card.index for card in self.community_cards])
+        self.decision_context.new_street()
+        if self.live_equity is not None:
+            self.live_equity.cancel()
+        self.speculate()
 
         self.display_table()
 
@@ -149,19 +201,21 @@ class TexasHoldemGame(Game):
 
             Args:
                 player: The player making the raise bet.
-                amount: The amount of chips to raise by.
+                amount: The amount of chips to put in, more than the amount to call.
 
              Returns:
                 bool: True if the raise is successful, False otherwise.
         """
-        last_player_bet = self.players[(self.last_state_player_index + 1) % len(self.players)]
-        diff = self.players_bet[last_player_bet.account.username] - self.players_bet[player.account.username]
-        if diff < amount <= player.account.chips:
+        to_call = self.amount_to_call(player)
+        if to_call < amount <= player.account.chips:
             player.account.chips -= amount
             self.players_bet[player.account.username] += amount
+            self.highest_bet = max(self.highest_bet, self.players_bet[player.account.username])
             self.pot += amount
+            self.street_raises += 1
             self.last_state_player_index = (self.current_player_index - 1) % len(self.players)
-            print_with_color(f'{player.account.username} raised {amount}', Color.MAGENTA)
+            self.announce(f'{player.account.username} raised {amount}')
+            self.notify_action(player, Action.RAISE, amount)
         else:
             return False
         return True
@@ -177,12 +231,15 @@ class TexasHoldemGame(Game):
                Returns:
                    bool: True if the bet is successful, False otherwise.
         """
-        if player.account.chips > amount:
+        if self.amount_to_call(player) < amount <= player.account.chips:
             player.account.chips -= amount
             self.players_bet[player.account.username] += amount
+            self.highest_bet = max(self.highest_bet, self.players_bet[player.account.username])
             self.pot += amount
+            self.street_raises += 1
             self.last_state_player_index = (self.current_player_index - 1) % len(self.players)
-            print_with_color(f'{player.account.username} bet {amount}', Color.MAGENTA)
+            self.announce(f'{player.account.username} bet {amount}')
+            self.notify_action(player, Action.BET, amount)
         else:
             return False
         return True
@@ -194,7 +251,8 @@ class TexasHoldemGame(Game):
                Args:
                    player: The player making the check action.
         """
-        print_with_color(f'{player.account.username} checked', Color.MAGENTA)
+        self.announce(f'{player.account.username} checked')
+        self.notify_action(player, Action.CHECK, 0)
 
     def make_call(self, player):
         """
@@ -206,18 +264,20 @@ class TexasHoldemGame(Game):
                 Returns:
                     bool: True if the call is successful, False otherwise.
         """
-        last_player_bet = self.players[(self.last_state_player_index + 1) % len(self.players)]
-        diff = self.players_bet[last_player_bet.account.username] - self.players_bet[player.account.username]
+        diff = self.amount_to_call(player)
         if diff <= player.account.chips:
             player.account.chips -= diff
             self.players_bet[player.account.username] += diff
             self.pot += diff
-            print_with_color(f'{player.account.username} called {diff}', Color.MAGENTA)
+            self.announce(f'{player.account.username} called {diff}')
+            self.notify_action(player, Action.CALL, diff)
         else:
-            self.players_bet[player.account.username] += player.account.chips
-            self.pot += player.account.chips
-            print_with_color(f'{player.account.username} all-in {player.account.chips}', Color.MAGENTA)
+            all_in = player.account.chips
+            self.players_bet[player.account.username] += all_in
+            self.pot += all_in
+            self.announce(f'{player.account.username} all-in {all_in}')
             player.account.chips = 0
+            self.notify_action(player, Action.CALL, all_in)
         return True
 
     def make_fold(self, player):
@@ -227,9 +287,83 @@ class TexasHoldemGame(Game):
                Args:
                    player: The player making the fold action.
         """
-        print_with_color(f'{player.account.username} folded', Color.MAGENTA)
+        self.announce(f'{player.account.username} folded')
         player.active = False
         self.active_players -= 1
+        self.notify_action(player, Action.FOLD, 0)
+
+    def make_timeout(self, player):
+        """
+                Takes the default action for a player who ran out of time: a check if possible, a fold otherwise.
+
+                Args:
+                    player: The player who ran out of time.
+
+                The timeout is recorded in the timeouts list.
+        """
+        self.timeouts.append(player.account.username)
+        self.announce(f'{player.account.username} ran out of time', Color.RED)
+        if self.amount_to_call(player) > 0:
+            self.make_fold(player)
+        else:
+            self.make_check(player)
+
+    def amount_to_call(self, player):
+        """
+                Returns the amount of chips the player has to put in to call the highest bet.
+
+                Args:
+                    player: The player to act.
+
+                Returns:
+                    int: The amount to call, 0 if the player can check.
+        """
+        return self.highest_bet - self.players_bet[player.account.username]
+
+    def legal_actions(self, seat):
+        """
+                Returns the actions the player in a seat can take, from the cached highest bet in O(1).
+
+                Args:
+                    seat: The index of the player in the players list.
+
+                Returns:
+                    LegalActions: The legal actions; none for a player who folded or has no chips left.
+        """
+        player = self.players[seat]
+        chips = player.account.chips
+        if not player.active or chips == 0:
+            return NO_ACTIONS
+        to_call = self.amount_to_call(player)
+        if chips > to_call:
+            return LegalActions(True, to_call == 0, to_call > 0, to_call, to_call + 1, chips)
+        return LegalActions(True, False, True, chips, 0, 0)
+
+    def notify_action(self, player, action, amount):
+        """
+                Logs an action that was applied and tells the observers about it.
+
+                Args:
+                    player: The player who acted.
+                    action: The action taken.
+                    amount: The chips the player put in with the action.
+        """
+        self.actions.append((self.players.index(player), action))
+        for observer in self.observers:
+            observer.on_action(self, player, action, amount)
+
+    def announce(self, message, color=Color.MAGENTA):
+        """
+                Announces an action or event at the table.
+
+                Args:
+                    message: The text to announce.
+                    color: The color used to print the text.
+
+                Nothing is printed when the game is headless.
+        """
+        if not self.headless:
+            print_with_color(message, color)
 
     def collect_blind(self, player_position, blind_amount):
         """
@@ -238,15 +372,25 @@ class TexasHoldemGame(Game):
                 Args:
                     player_position: The position of the player paying the blind.
                     blind_amount: The amount of chips for the blind.
+
+                A player with fewer chips than the blind puts in the chips left, a player without chips sits out.
         """
         player = self.players[player_position]
         if player.account.chips >= blind_amount:
             player.account.chips -= blind_amount
             self.players_bet[player.account.username] += blind_amount
+            self.highest_bet = max(self.highest_bet, self.players_bet[player.account.username])
             self.pot += blind_amount
-            print_with_color(f'{player.account.username} paid blind {blind_amount}', Color.MAGENTA)
-        else:
+            self.announce(f'{player.account.username} paid blind {blind_amount}')
+        elif player.account.chips > 0:
+            self.players_bet[player.account.username] += player.account.chips
+            self.highest_bet = max(self.highest_bet, self.players_bet[player.account.username])
+            self.pot += player.account.chips
+            self.announce(f'{player.account.username} paid blind all-in {player.account.chips}')
+            player.account.chips = 0
+        elif player.active:
             player.active = False
+            self.active_players -= 1
 
     def run(self):
         """
@@ -255,10 +399,15 @@ class TexasHoldemGame(Game):
                This method controls the flow of the game, including dealing cards, managing betting rounds,
                and determining the winner(s).
         """
-        self.curr_game_settings.deck.shuffle()
+        settings = self.curr_game_settings
+        self.curr_game_settings.deck.shuffle(make_rng(settings.seed, "deck", settings.table_id, settings.hand_number))
+        for observer in self.observers:
+            observer.on_hand_start(self)
+        pacing = self.curr_game_settings.pacing
         while self.state != TexasHoldemState.END:
-            print(5 * '\n')
-            time.sleep(0.5)
+            if not self.headless and not self.batching_bot_streets():
+                print(5 * '\n')
+                time.sleep(pacing.street_delay)
             if self.state == TexasHoldemState.PREFLOP:
                 self.deal_preflop()
             elif self.state == TexasHoldemState.FLOP:
@@ -272,6 +421,35 @@ class TexasHoldemGame(Game):
                 break
             else:
                 break
+        self.decision_context.close()
+        if self.live_equity is not None:
+            self.live_equity.cancel()
+        for observer in self.observers:
+            observer.on_hand_end(self)
+
+    def batching_bot_streets(self):
+        """
+                Checks whether the current street is played without being displayed.
+
+                Returns:
+                    bool: True if the pacing batches streets and no human player can still act in the hand.
+        """
+        if not self.curr_game_settings.pacing.batch_bot_streets:
+            return False
+        return not any(isinstance(player, HumanPlayer) and player.active and player.account.chips > 0
+                       for player in self.players)
+
+    def speculate(self):
+        """
+                Starts building the ranking of the board every hand strength of the street is counted from on a
+                process pool.
+
+                Only done while an interactive player can act: the build then runs while that player decides,
+                and the computer players' turns after it only collect the ranking.
+        """
+        players = [player for player in self.players if player.active and player.account.chips > 0]
+        if any(player.interactive for player in players):
+            self.decision_context.prefetch(self.community_cards)
 
     def next_state(self):
         """
@@ -294,9 +472,12 @@ class TexasHoldemGame(Game):
         """
                Displays the current state of the table.
 
-               This method prints out information about active players, pot size, community cards,
-               and the hole cards of the human player.
+               This method prints out information about active players, pot size, community cards and their
+               texture, and the hole cards of the human player. Nothing is displayed when the game is headless
+               or streets only computer players take part in are batched.
         """
+        if self.headless or self.batching_bot_streets():
+            return
         print_with_color("Active Players", Color.GREEN)
         print_with_color("==================================", Color.DARK_GRAY)
         for player in self.players:
@@ -312,21 +493,26 @@ class TexasHoldemGame(Game):
             print_with_color("==================================", Color.DARK_GRAY)
             print("Table:")
             self.display_cards(self.community_cards)
+            print_with_color(describe(self.board_texture), Color.DARK_GRAY)
             print_with_color("==================================", Color.DARK_GRAY)
         self.display_human_player()
 
-    def display_combination(self, cards):
+    def display_combination(self, cards, score=None):
         """
                 Displays the best hand combination for the given cards.
 
                 Args:
                     cards: A list of Card objects representing the player's hand.
+                    score: The score of the cards combined with the community cards, if it is already known.
 
-                This method calculates and displays the best hand combination for the given cards.
+                This method displays the best hand combination for the given cards, evaluating it only when
+                no score is given.
         """
-        print_with_color(f'{HandChecker.check_hand(cards + self.community_cards).str} ',
-                         Color.GREEN, end="")
-        combination = HandChecker.get_combination_cards(cards + self.community_cards)
+        hand = cards + self.community_cards
+        if score is None:
+            score = HandChecker.score_hand(hand)
+        print_with_color(f'{HandStrength.from_score(score).str} ', Color.GREEN, end="")
+        combination = HandChecker.get_score_cards(hand, score)
         print("( ", end='')
         for card in combination:
             print_with_color(f'{card} ', Color.GREEN, end='')
@@ -362,55 +548,135 @@ class TexasHoldemGame(Game):
 
     def display_human_player(self):
         """
-                Displays the hole cards and best hand combination for the human player.
+                Displays the hole cards, best hand combination and standing of the human player.
 
-                This method prints out the hole cards and best hand combination of the human player.
+                This method prints out the hole cards and best hand combination of the human player, then the
+                share of the holdings possible on the board the hand is not behind and how far it is from the
+                nuts, the outs on the flop and the turn, and the equity against the live opponents.
         """
         for player in self.players:
             if isinstance(player, HumanPlayer):
                 self.display_hole_cards()
                 self.display_combination(player.hole_cards)
+                self.display_standing(player)
+                self.display_outs(HandChecker.find_outs([card.index for card in player.hole_cards],
+                                                        [card.index for card in self.community_cards]))
+                self.display_equity(player)
+
+    def display_equity(self, player):
+        """
+                Displays the equity of a player's hand against the live opponents, estimated on a worker thread.
+
+                Args:
+                    player: The player, whose hand starts being estimated if it is not already.
+
+                The first display of a street only shows a placeholder; later ones, such as the one before
+                every decision, show the estimate refined from the deals sampled since.
+        """
+        if self.headless:
+            return
+        opponents = sum(other.active for other in self.players if other is not player)
+        if not player.active or opponents == 0:
+            return
+        if self.live_equity is None:
+            self.live_equity = LiveEquity()
+        self.live_equity.start([card.index for card in player.hole_cards],
+                               [card.index for card in self.community_cards], opponents)
+        estimate = self.live_equity.estimate()
+        print(f"Equity against {opponents}: ", end="")
+        if estimate is None:
+            print_with_color("calculating...", Color.DARK_GRAY)
+        else:
+            equity, samples = estimate
+            print_with_color(f"{equity:.1%}", Color.GREEN, end="")
+            print(f" ({samples} deals)")
+
+    def display_outs(self, outs):
+        """
+                Displays the number of outs of a hand and the categories they improve it to.
+
+                Args:
+                    outs (Outs): The outs of the hand. Nothing is displayed without any.
+        """
+        if outs.count == 0:
+            return
+        categories = sorted(outs.by_category.items(), key=lambda item: item[0].int)
+        print("Outs: ", end="")
+        print_with_color(f"{outs.count} ", Color.GREEN, end="")
+        print(f"({', '.join(f'{category.str} {len(cards)}' for category, cards in categories)})")
+
+    def display_standing(self, player):
+        """
+                Displays where a player's hand stands among the holdings possible on the board, once per street.
+
+                Args:
+                    player: The player.
+
+                The standing is read from the board's ranking shared with the computer players. While its
+                speculative build is still running, only a placeholder is shown, and the standing is shown
+                before the player's next decision instead, so the build overlaps with the player's thinking.
+        """
+        if self.headless or self.standing_board == len(self.community_cards):
+            return
+        ranking = self.decision_context.ready_ranking(self.community_cards)
+        print("Percentile: ", end="")
+        if ranking is None:
+            print_with_color("calculating...", Color.DARK_GRAY)
+            return
+        self.standing_board = len(self.community_cards)
+        standing = ranking.standing([card.index for card in player.hole_cards])
+        print_with_color(f"{standing.percentile:.0%}", Color.GREEN, end="")
+        print(" of hands   Nuts: ", end="")
+        if standing.better_values == 0:
+            print_with_color("you hold the nuts", Color.GREEN)
+        else:
+            values = "value" if standing.better_values == 1 else "values"
+            print_with_color(f"{standing.better_values} better hand {values} ({standing.better_combos} combos)",
+                             Color.YELLOW)
 
     def determine_winner(self):
         """
                 Determines the winner(s) of the game.
 
-                This method evaluates the hands of active players and determines the winner(s) based on hand strength.
+                This method scores the hands of all active players in one batch, ranks them by score and
+                splits the pot between the players sharing the best score. The odd chips of a split pot go to
+                the winners closest to the dealer's left, one each.
         """
-        winner_rank = None
+        live_players = [player for player in self.players if player.active]
+        scores = HandChecker.rank_hands([player.hole_cards + self.community_cards for player in live_players])
+        self.showdown_ranking = sorted(zip(scores, live_players), key=itemgetter(0), reverse=True)
+
+        best_score = self.showdown_ranking[0][0]
         winners = []
-        winner_hand = None
-        for player in self.players:
-            if player.active:
-                player_hand = player.hole_cards + self.community_cards
-                player_rank = HandChecker.check_hand(player_hand).int
-
-                if len(winners) == 0 or player_rank > winner_rank:
-                    winners.clear()
-                    winners.append(player)
-                    winner_rank = player_rank
-                    winner_hand = player_hand
-
-                elif winner_rank == player_rank:
-                    res = HandChecker.compare_same_combination(winner_hand, player_hand)
-                    if res == 1:
-                        continue
-                    elif res == -1:
-                        winners.clear()
-                        winners.append(player)
-                        winner_rank = player_rank
-                        winner_hand = player_hand
-                    else:
-                        winners.append(player)
-        splitted_pot = self.pot // len(winners)
+        for score, player in self.showdown_ranking:
+            if score != best_score:
+                break
+            winners.append(player)
+        splitted_pot, odd_chips = divmod(self.pot, len(winners))
+        dealer = self.curr_game_settings.dealer
+        winners.sort(key=lambda winner: (self.players.index(winner) - dealer - 1) % len(self.players))
+
+        for position, winner in enumerate(winners):
+            winner.account.chips += splitted_pot + (position < odd_chips)
+        self.display_winners(winners, splitted_pot, best_score)
+
+    def display_winners(self, winners, splitted_pot, score):
+        """
+                Displays the winner(s) of the game.
 
+                Args:
+                    winners: The players sharing the pot.
+                    splitted_pot: The amount of chips each winner receives.
+                    score: The score of the winning hand.
+        """
+        if self.headless:
+            return
         for winner in winners:
             print_with_color(winner.account.username, Color.MAGENTA, end="")
             print(" won ", end="")
             print_with_color(str(splitted_pot), Color.GREEN, end='')
             print(" with ", end="")
-            self.display_combination(winner.hole_cards)
-            winner.account.chips += splitted_pot
+            self.display_combination(winner.hole_cards, score)
         print_with_color("Game is over", Color.YELLOW)
 
     def deal_showdown(self):
@@ -419,12 +685,13 @@ class TexasHoldemGame(Game):
 
                This method handles the showdown phase, revealing all players' cards and determining the winner(s).
         """
-        print_with_color("Showdown", Color.GREEN)
-        self.display_cards(self.community_cards)
-        for player in self.players:
+        if not self.headless:
+            print_with_color("Showdown", Color.GREEN)
+            self.display_cards(self.community_cards)
+            for player in self.players:
 
-            if player.active:
-                print_with_color(player.account.username, Color.MAGENTA)
-                self.display_cards(player.hole_cards)
+                if player.active:
+                    print_with_color(player.account.username, Color.MAGENTA)
+                    self.display_cards(player.hole_cards)
 
         self.determine_winner()
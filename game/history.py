@@ -0,0 +1,356 @@
+import os
+import struct
+from typing import NamedTuple
+
+from game.observer import GameObserver
+from utils.TexasHoldemStates import Action
+
+# Every record is prefixed with its size, then a fixed header, the deck and board as card indexes,
+# one entry per seat and one fixed entry per action. All integers are little-endian.
+RECORD_SIZE = struct.Struct("<I")
+HEADER = struct.Struct("<QBBIIBBH")  # hand id, dealer, seats, small blind, big blind, deck size, board size, actions
+SEAT = struct.Struct("<IIBBB")  # starting chips, final chips, hole cards, winner flag (after the username)
+ACTION = struct.Struct("<BBBI")  # seat, street, action, amount
+# The sidecar index holds one fixed entry per hand, so the entry of hand N sits at N * INDEX_ENTRY.size.
+INDEX_ENTRY = struct.Struct("<HQ")  # segment number, offset of the record in the segment
+INDEX_NAME = "hands.idx"
+
+NO_CARD = 255
+ACTIONS = list(Action)
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+SEGMENT_NAME = "hands-{:06d}.bin"
+
+
+class HandRecord(NamedTuple):
+    """
+    A finished hand read back from a hand-history log.
+
+    Attributes:
+        hand_id (int): The number of the hand in the log.
+        dealer (int): The seat of the dealer.
+        small_blind (int): The small blind of the hand.
+        big_blind (int): The big blind of the hand.
+        deck (tuple): The shuffled deck as card indexes; cards are dealt from the end.
+        board (tuple): The community cards as card indexes.
+        usernames (tuple): The usernames of the players, in seat order.
+        starting_chips (tuple): The chips of every player before the hand.
+        final_chips (tuple): The chips of every player after the hand.
+        hole_cards (tuple): The hole cards of every player as pairs of card indexes.
+        winners (tuple): The seats that won the pot.
+        actions (tuple): (seat, street, action, amount) tuples in the order they were taken, where street is
+            the TexasHoldemState value and action the Action.
+    """
+    hand_id: int
+    dealer: int
+    small_blind: int
+    big_blind: int
+    deck: tuple
+    board: tuple
+    usernames: tuple
+    starting_chips: tuple
+    final_chips: tuple
+    hole_cards: tuple
+    winners: tuple
+    actions: tuple
+
+
+class HandHistoryRecorder(GameObserver):
+    """
+    Records every finished hand to an append-only log of binary records.
+
+    Records are kept in memory and written once per batch of hands. The log is split into numbered
+    segment files, and a new segment is started once the current one reaches the size limit.
+    A sidecar index file holds the segment and offset of every hand, so any hand can be read without a scan.
+
+    Attributes:
+        directory (str): The directory holding the segment files.
+        batch_size (int): The number of hands buffered before they are written.
+        segment_bytes (int): The size after which a new segment file is started.
+        next_hand_id (int): The id the next recorded hand gets.
+
+    Methods:
+        on_hand_start(game): Remembers the deck, dealer, blinds and stacks of a new hand.
+        on_action(game, player, action, amount): Remembers an action.
+        on_hand_end(game): Encodes the finished hand into the buffer.
+        flush(): Writes the buffered hands to the current segment.
+        close(): Writes the buffered hands and stops recording.
+    """
+
+    def __init__(self, directory, batch_size=256, segment_bytes=16 * 1024 * 1024):
+        """
+        Initializes a HandHistoryRecorder instance, continuing an existing log in the directory.
+
+        Args:
+            directory (str): The directory holding the segment files.
+            batch_size (int): The number of hands buffered before they are written.
+            segment_bytes (int): The size after which a new segment file is started.
+        """
+        self.directory = directory
+        self.batch_size = batch_size
+        self.segment_bytes = segment_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        segments = list_segments(directory)
+        self.segment = segment_number(segments[-1]) if segments else 0
+        index_path = os.path.join(directory, INDEX_NAME)
+        if segments and not os.path.exists(index_path):
+            build_index(directory)
+        self.next_hand_id = os.path.getsize(index_path) // INDEX_ENTRY.size if segments else 0
+
+        self.buffer = bytearray()
+        self.offsets = []
+        self.buffered_hands = 0
+        self.hand = None
+        self.seats = {}
+        self.actions = []
+
+    def on_hand_start(self, game):
+        self.seats = {id(player): seat for seat, player in enumerate(game.players)}
+        settings = game.curr_game_settings
+        self.hand = (settings.dealer, settings.small_blind, settings.big_blind,
+                     bytes(card.index for card in settings.deck.cards),
+                     [player.account.chips for player in game.players])
+        self.actions = []
+
+    def on_action(self, game, player, action, amount):
+        self.actions.append((self.seats[id(player)], game.state.value, ACTION_CODES[action], amount))
+
+    def on_hand_end(self, game):
+        if self.hand is None:
+            return
+        dealer, small_blind, big_blind, deck, starting_chips = self.hand
+        self.hand = None
+
+        best_score = game.showdown_ranking[0][0] if game.showdown_ranking else None
+        winners = {id(player) for score, player in game.showdown_ranking if score == best_score}
+        board = bytes(card.index for card in game.community_cards)
+
+        record = bytearray(HEADER.pack(self.next_hand_id, dealer, len(game.players), small_blind, big_blind,
+                                       len(deck), len(board), len(self.actions)))
+        record += deck
+        record += board
+        for player, chips in zip(game.players, starting_chips):
+            username = player.account.username.encode()
+            hole_cards = [card.index for card in player.hole_cards] if player.hole_cards else [NO_CARD, NO_CARD]
+            record.append(len(username))
+            record += username
+            record += SEAT.pack(chips, player.account.chips, hole_cards[0], hole_cards[1], id(player) in winners)
+        for action in self.actions:
+            record += ACTION.pack(*action)
+
+        self.offsets.append(len(self.buffer))
+        self.buffer += RECORD_SIZE.pack(len(record))
+        self.buffer += record
+        self.next_hand_id += 1
+        self.buffered_hands += 1
+        if self.buffered_hands >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered hands to the current segment, starting a new segment first if it is full,
+        and their entries to the index.
+        """
+        if not self.buffer:
+            return
+        path = os.path.join(self.directory, SEGMENT_NAME.format(self.segment))
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size >= self.segment_bytes:
+            self.segment += 1
+            path = os.path.join(self.directory, SEGMENT_NAME.format(self.segment))
+            size = 0
+        with open(path, "ab") as segment:
+            segment.write(self.buffer)
+        with open(os.path.join(self.directory, INDEX_NAME), "ab") as index:
+            index.write(b"".join(INDEX_ENTRY.pack(self.segment, size + offset) for offset in self.offsets))
+        self.buffer = bytearray()
+        self.offsets = []
+        self.buffered_hands = 0
+
+    def close(self):
+        """
+        Writes the buffered hands and stops recording.
+        """
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def list_segments(directory):
+    """
+    Lists the segment files of a hand-history log in order.
+
+    Args:
+        directory (str): The directory holding the segment files.
+
+    Returns:
+        list: The paths of the segment files.
+    """
+    names = sorted(name for name in os.listdir(directory) if name.startswith("hands-") and name.endswith(".bin"))
+    return [os.path.join(directory, name) for name in names]
+
+
+def segment_number(path):
+    """
+    Returns the number of a segment file.
+
+    Args:
+        path (str): The path of the segment file.
+
+    Returns:
+        int: The segment number.
+    """
+    return int(os.path.basename(path)[len("hands-"):-len(".bin")])
+
+
+def build_index(directory):
+    """
+    Builds the sidecar index of a hand-history log by scanning its segments.
+
+    Args:
+        directory (str): The directory holding the segment files.
+    """
+    with open(os.path.join(directory, INDEX_NAME), "wb") as index:
+        for path in list_segments(directory):
+            number = segment_number(path)
+            with open(path, "rb") as segment:
+                offset = 0
+                while True:
+                    size = segment.read(RECORD_SIZE.size)
+                    if len(size) < RECORD_SIZE.size:
+                        break
+                    index.write(INDEX_ENTRY.pack(number, offset))
+                    offset += RECORD_SIZE.size + RECORD_SIZE.unpack(size)[0]
+                    segment.seek(offset)
+
+
+def count_hands(directory):
+    """
+    Returns the number of hands in a hand-history log, read from its index.
+
+    Args:
+        directory (str): The directory holding the segment files.
+
+    Returns:
+        int: The number of recorded hands.
+    """
+    index_path = os.path.join(directory, INDEX_NAME)
+    return os.path.getsize(index_path) // INDEX_ENTRY.size if os.path.exists(index_path) else 0
+
+
+def read_hand(directory, hand_id):
+    """
+    Reads a single hand by seeking straight to it through the index.
+
+    Args:
+        directory (str): The directory holding the segment files.
+        hand_id (int): The id of the hand.
+
+    Returns:
+        HandRecord: The recorded hand.
+
+    Raises:
+        IndexError: If the log holds no hand with that id.
+    """
+    with open(os.path.join(directory, INDEX_NAME), "rb") as index:
+        index.seek(hand_id * INDEX_ENTRY.size)
+        entry = index.read(INDEX_ENTRY.size)
+    if hand_id < 0 or len(entry) < INDEX_ENTRY.size:
+        raise IndexError(f"No hand {hand_id} in {directory}.")
+    number, offset = INDEX_ENTRY.unpack(entry)
+    with open(os.path.join(directory, SEGMENT_NAME.format(number)), "rb") as segment:
+        segment.seek(offset)
+        size = RECORD_SIZE.unpack(segment.read(RECORD_SIZE.size))[0]
+        return decode_record(segment.read(size))
+
+
+def read_segment(path, offset=0):
+    """
+    Reads the hands of a single segment file one at a time.
+
+    Args:
+        path (str): The path of the segment file.
+        offset (int): The offset of the first record to read.
+
+    Yields:
+        HandRecord: The recorded hands, in the order they were played.
+    """
+    with open(path, "rb") as segment:
+        segment.seek(offset)
+        while True:
+            size = segment.read(RECORD_SIZE.size)
+            if len(size) < RECORD_SIZE.size:
+                return
+            record = segment.read(RECORD_SIZE.unpack(size)[0])
+            yield decode_record(record)
+
+
+def read_hand_history(directory, start=0):
+    """
+    Reads the hands of a hand-history log one at a time, without loading the log into memory.
+
+    Args:
+        directory (str): The directory holding the segment files.
+        start (int): The id of the first hand to read; the index is used to seek to it.
+
+    Yields:
+        HandRecord: The recorded hands, in the order they were played.
+    """
+    first_segment, offset = 0, 0
+    if start > 0:
+        with open(os.path.join(directory, INDEX_NAME), "rb") as index:
+            index.seek(start * INDEX_ENTRY.size)
+            entry = index.read(INDEX_ENTRY.size)
+        if len(entry) < INDEX_ENTRY.size:
+            return
+        first_segment, offset = INDEX_ENTRY.unpack(entry)
+    for path in list_segments(directory):
+        number = segment_number(path)
+        if number < first_segment:
+            continue
+        yield from read_segment(path, offset if number == first_segment else 0)
+
+
+def decode_record(record):
+    """
+    Decodes a single record, without its size prefix.
+
+    Args:
+        record (bytes): The encoded record.
+
+    Returns:
+        HandRecord: The decoded hand.
+    """
+    hand_id, dealer, seats, small_blind, big_blind, deck_size, board_size, action_count = \
+        HEADER.unpack_from(record)
+    offset = HEADER.size
+    deck = tuple(record[offset:offset + deck_size])
+    offset += deck_size
+    board = tuple(record[offset:offset + board_size])
+    offset += board_size
+
+    usernames, starting_chips, final_chips, hole_cards, winners = [], [], [], [], []
+    for seat in range(seats):
+        length = record[offset]
+        usernames.append(record[offset + 1:offset + 1 + length].decode())
+        offset += 1 + length
+        chips, final, first_card, second_card, winner = SEAT.unpack_from(record, offset)
+        offset += SEAT.size
+        starting_chips.append(chips)
+        final_chips.append(final)
+        hole_cards.append((first_card, second_card) if first_card != NO_CARD else ())
+        if winner:
+            winners.append(seat)
+
+    actions = []
+    for _ in range(action_count):
+        seat, street, code, amount = ACTION.unpack_from(record, offset)
+        offset += ACTION.size
+        actions.append((seat, street, ACTIONS[code], amount))
+
+    return HandRecord(hand_id, dealer, small_blind, big_blind, deck, board, tuple(usernames),
+                      tuple(starting_chips), tuple(final_chips), tuple(hole_cards), tuple(winners), tuple(actions))
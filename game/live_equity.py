@@ -0,0 +1,148 @@
+import random
+import threading
+
+from utils.TexasHoldemCombinations import HandChecker
+from utils.instrumentation import COUNTERS
+
+
+class LiveEquity:
+    """
+    Estimates the equity of a hand against the live opponents by Monte Carlo on a worker thread, so the
+    table is displayed at once and the estimate gets more precise while the person decides.
+
+    The worker deals the opponents' hole cards and the rest of the board at random, in batches, and adds
+    every batch to running totals read under a lock. A new street, a fold changing the number of opponents or
+    the end of the hand cancels it; the worker notices between two batches. Once the person has acted, the
+    worker is paused so it does not compete with the computer players' turns, and the next start of the same
+    hand resumes it from the totals it left.
+
+    Attributes:
+        batch (int): The deals sampled between two updates of the totals.
+        max_samples (int): The deals after which the worker stops on its own.
+        key (tuple): The hole cards, board and opponent count being estimated, or None.
+        samples (int): The deals sampled so far.
+        won (float): The pots won so far, ties counting as a share of the pot.
+
+    Methods:
+        start(hole, board, opponents): Starts estimating a hand, unless it is already being estimated.
+        estimate(): Returns the current estimate.
+        pause(): Stops the worker, keeping the estimate.
+        cancel(): Stops the worker.
+        wait(timeout): Waits for the worker to finish.
+    """
+
+    def __init__(self, batch=250, max_samples=20000):
+        """
+        Initializes a LiveEquity instance with no estimate running.
+
+        Args:
+            batch (int): The deals sampled between two updates of the totals.
+            max_samples (int): The deals after which the worker stops on its own.
+        """
+        self.batch = batch
+        self.max_samples = max_samples
+        self.key = None
+        self.samples = 0
+        self.won = 0.0
+        self.lock = threading.Lock()
+        self.cancelled = threading.Event()
+        self.thread = None
+
+    def start(self, hole, board, opponents):
+        """
+        Starts estimating the equity of a hand on a worker thread, cancelling the previous estimate. Nothing is
+        done if the same hand is already being estimated, and a paused estimate of the same hand is resumed.
+
+        Args:
+            hole: The card indexes of the hole cards.
+            board: The card indexes of the community cards.
+            opponents (int): The number of live opponents.
+        """
+        key = (tuple(hole), tuple(board), opponents)
+        with self.lock:
+            resumed = key == self.key
+            if resumed and not self.cancelled.is_set():
+                return
+        if not resumed:
+            self.cancel()
+        with self.lock:
+            if not resumed:
+                self.key = key
+                self.samples = 0
+                self.won = 0.0
+            self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(key, self.cancelled), daemon=True)
+        self.thread.start()
+        COUNTERS.add("live_equity.resumed" if resumed else "live_equity.started")
+
+    def run(self, key, cancelled):
+        """
+        Samples deals in batches until cancelled or max_samples deals are sampled. Runs on the worker thread.
+
+        Args:
+            key (tuple): The hole cards, board and opponent count to estimate.
+            cancelled (threading.Event): Set to stop the worker.
+        """
+        hole, board, opponents = key
+        score = HandChecker.score_indexes
+        rng = random.Random()
+        unseen = [index for index in range(52) if index not in hole and index not in board]
+        missing = 5 - len(board)
+        with self.lock:
+            samples = self.samples
+        while samples < self.max_samples and not cancelled.is_set():
+            won = 0.0
+            for _ in range(self.batch):
+                dealt = rng.sample(unseen, 2 * opponents + missing)
+                full_board = list(board) + dealt[2 * opponents:]
+                ours = score(list(hole) + full_board)
+                best = max(score(dealt[2 * seat:2 * seat + 2] + full_board) for seat in range(opponents))
+                if ours > best:
+                    won += 1.0
+                elif ours == best:
+                    tied = sum(score(dealt[2 * seat:2 * seat + 2] + full_board) == ours for seat in range(opponents))
+                    won += 1.0 / (tied + 1)
+            samples += self.batch
+            with self.lock:
+                if cancelled.is_set():
+                    return
+                self.samples += self.batch
+                self.won += won
+
+    def estimate(self):
+        """
+        Returns the current estimate.
+
+        Returns:
+            tuple: The equity and the deals it was estimated from, or None before the first batch.
+        """
+        with self.lock:
+            if self.samples == 0:
+                return None
+            return self.won / self.samples, self.samples
+
+    def pause(self):
+        """
+        Stops the worker, which drops the batch it is sampling, but keeps the estimate of the hand so the next
+        start of the same hand resumes sampling.
+        """
+        with self.lock:
+            self.cancelled.set()
+
+    def cancel(self):
+        """
+        Stops the worker, which drops the batch it is sampling.
+        """
+        with self.lock:
+            self.cancelled.set()
+            self.key = None
+
+    def wait(self, timeout=None):
+        """
+        Waits for the worker to finish.
+
+        Args:
+            timeout (float): The seconds to wait at most, or None to wait until it finishes.
+        """
+        if self.thread is not None:
+            self.thread.join(timeout)
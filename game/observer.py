@@ -0,0 +1,38 @@
+class GameObserver:
+    """
+    Base class for objects following the hands played at a table, such as hand-history recorders.
+
+    Every method is a no-op, so an observer only implements the events it needs.
+
+    Methods:
+        on_hand_start(game): Called once the deck is shuffled, before any card is dealt.
+        on_action(game, player, action, amount): Called after a player's action is applied.
+        on_hand_end(game): Called after the pot has been awarded.
+    """
+
+    def on_hand_start(self, game):
+        """
+        Called once the deck is shuffled, before any card is dealt or blind collected.
+
+        Args:
+            game (TexasHoldemGame): The game being played.
+        """
+
+    def on_action(self, game, player, action, amount):
+        """
+        Called after a player's action is applied.
+
+        Args:
+            game (TexasHoldemGame): The game being played.
+            player (Player): The player who acted.
+            action (Action): The action taken.
+            amount (int): The chips the player put in with the action.
+        """
+
+    def on_hand_end(self, game):
+        """
+        Called after the pot has been awarded.
+
+        Args:
+            game (TexasHoldemGame): The game that was played.
+        """
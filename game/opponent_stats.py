@@ -0,0 +1,195 @@
+import os
+from typing import NamedTuple
+
+import numpy as np
+
+from game.observer import GameObserver
+from utils.TexasHoldemStates import Action, TexasHoldemState
+
+# The counters kept for every player, one column each.
+HANDS = 0  # hands dealt in
+VPIP = 1  # hands with chips put in voluntarily preflop
+PFR = 2  # hands raised preflop
+AGGRESSIVE = 3  # bets and raises
+CALLS = 4  # calls of a bet
+FACED_BETS = 5  # decisions facing a bet after the flop
+FOLDS_TO_BET = 6  # folds facing a bet after the flop
+SAW_FLOP = 7  # hands still played when the flop was dealt
+SHOWDOWNS = 8  # hands shown down against another player
+COUNTER_COUNT = 9
+
+_AGGRESSIVE_ACTIONS = (Action.BET, Action.RAISE)
+
+
+class PlayerStats(NamedTuple):
+    """
+    The statistics of a player, read from the counters.
+
+    Attributes:
+        hands (int): The number of hands the player was dealt in.
+        vpip (float): The share of hands the player put chips in voluntarily preflop.
+        pfr (float): The share of hands the player raised preflop.
+        aggression (float): Bets and raises per call, the aggression factor.
+        fold_to_bet (float): The share of decisions facing a bet after the flop the player folded.
+        went_to_showdown (float): The share of the hands that reached the flop the player showed down.
+    """
+    hands: int
+    vpip: float
+    pfr: float
+    aggression: float
+    fold_to_bet: float
+    went_to_showdown: float
+
+
+NO_STATS = PlayerStats(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def _share(count, total):
+    return count / total if total else 0.0
+
+
+def find_opponent_stats(game):
+    """
+    Returns the OpponentStats following a game.
+
+    Args:
+        game (TexasHoldemGame): The game.
+
+    Returns:
+        OpponentStats: The statistics, or None if the game is not followed by any.
+    """
+    return next((observer for observer in game.observers if isinstance(observer, OpponentStats)), None)
+
+
+class OpponentStats(GameObserver):
+    """
+    Counts what every player does, hand after hand, to tell opponents apart.
+
+    The counters of all players are rows of one integer array, found through a dict keyed by username, so
+    every action updates them in O(1) and the statistics of a player are read in O(1). What a seat did in the
+    hand being played is kept in small per-seat arrays and added to the counters when the hand ends. The
+    counters are saved when the observer is closed and loaded again by the next one, so they carry over from
+    table to table.
+
+    Attributes:
+        path (str): The file the counters are saved to, or None to keep them in memory only.
+        rows (dict): The row of every player in the counters, by username.
+        counts (np.ndarray): (capacity, COUNTER_COUNT) int64 counters, one row per player.
+
+    Methods:
+        on_hand_start(game): Clears what the seats did in the previous hand.
+        on_action(game, player, action, amount): Counts an action.
+        on_hand_end(game): Adds what the seats did in the hand to the counters.
+        row(username): Returns the row of a player, adding one if needed.
+        stats(username): Returns the statistics of a player.
+        save(): Saves the counters.
+        close(): Saves the counters.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initializes an OpponentStats instance, loading the counters saved at the path if there are any.
+
+        Args:
+            path (str): The file the counters are saved to, or None to keep them in memory only.
+        """
+        self.path = path
+        self.rows = {}
+        self.counts = np.zeros((16, COUNTER_COUNT), dtype=np.int64)
+        self.vpip = self.pfr = self.fold_street = None
+        if path is not None and os.path.exists(path):
+            with np.load(path) as saved:
+                usernames = saved["usernames"].tolist()
+                self.counts = np.zeros((max(len(usernames), 16), COUNTER_COUNT), dtype=np.int64)
+                self.counts[:len(usernames)] = saved["counts"]
+            self.rows = {username: row for row, username in enumerate(usernames)}
+
+    def on_hand_start(self, game):
+        self.vpip = np.zeros(len(game.players), dtype=bool)
+        self.pfr = np.zeros(len(game.players), dtype=bool)
+        self.fold_street = np.full(len(game.players), -1, dtype=np.int8)
+
+    def on_action(self, game, player, action, amount):
+        seat = game.players.index(player)
+        counts = self.counts[self.row(player.account.username)]
+        aggressive = action in _AGGRESSIVE_ACTIONS
+        if aggressive:
+            counts[AGGRESSIVE] += 1
+        elif action == Action.CALL and amount > 0:
+            counts[CALLS] += 1
+        if action == Action.FOLD:
+            self.fold_street[seat] = game.state.value
+
+        if game.state == TexasHoldemState.PREFLOP:
+            self.vpip[seat] |= aggressive or (action == Action.CALL and amount > 0)
+            self.pfr[seat] |= aggressive
+        elif game.street_raises - aggressive > 0 and action != Action.CHECK:
+            # Someone bet before this action in the street, so the player was facing a bet.
+            counts[FACED_BETS] += 1
+            if action == Action.FOLD:
+                counts[FOLDS_TO_BET] += 1
+
+    def on_hand_end(self, game):
+        showdown = len(game.showdown_ranking) >= 2
+        flop = len(game.community_cards) >= 3
+        for seat, player in enumerate(game.players):
+            counts = self.counts[self.row(player.account.username)]
+            counts[HANDS] += 1
+            counts[VPIP] += self.vpip[seat]
+            counts[PFR] += self.pfr[seat]
+            if flop and (player.active or self.fold_street[seat] >= TexasHoldemState.FLOP.value):
+                counts[SAW_FLOP] += 1
+                counts[SHOWDOWNS] += showdown and player.active
+
+    def row(self, username):
+        """
+        Returns the row of a player in the counters, adding one if the player is new.
+
+        Args:
+            username (str): The username of the player.
+
+        Returns:
+            int: The row.
+        """
+        row = self.rows.get(username)
+        if row is None:
+            row = len(self.rows)
+            if row == len(self.counts):
+                self.counts = np.concatenate([self.counts, np.zeros_like(self.counts)])
+            self.rows[username] = row
+        return row
+
+    def stats(self, username):
+        """
+        Returns the statistics of a player.
+
+        Args:
+            username (str): The username of the player.
+
+        Returns:
+            PlayerStats: The statistics, all zero for a player never seen.
+        """
+        row = self.rows.get(username)
+        if row is None:
+            return NO_STATS
+        hands, vpip, pfr, aggressive, calls, faced, folds, saw_flop, showdowns = self.counts[row].tolist()
+        return PlayerStats(hands, _share(vpip, hands), _share(pfr, hands),
+                           aggressive / calls if calls else float(aggressive), _share(folds, faced),
+                           _share(showdowns, saw_flop))
+
+    def save(self):
+        """
+        Saves the counters, replacing the previous file only once the new one is complete.
+        """
+        if self.path is None:
+            return
+        temporary = self.path + ".tmp"
+        with open(temporary, "wb") as file:
+            np.savez(file, usernames=np.array(list(self.rows), dtype=str), counts=self.counts[:len(self.rows)])
+        os.replace(temporary, self.path)
+
+    def close(self):
+        """
+        Saves the counters.
+        """
+        self.save()
@@ -0,0 +1,216 @@
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from game.game import TexasHoldemGame
+from game.history import count_hands, read_hand, read_hand_history
+from models.account import Account
+from models.card import Card
+from models.deck import Deck
+from models.player import Player
+from settings import GameSettings
+from utils.TexasHoldemStates import Action
+from utils.color import Color, print_with_color
+
+
+class ReplayDeck(Deck):
+    """
+    A deck holding the recorded order of a hand's cards. Shuffling it keeps that order.
+
+    Inherits from:
+        Deck
+    """
+
+    def __init__(self, deck):
+        """
+        Initializes a ReplayDeck instance.
+
+        Args:
+            deck (tuple): The recorded deck as card indexes; cards are dealt from the end.
+        """
+        super().__init__()
+        self.cards = [Card.from_index(index) for index in deck]
+
+    def shuffle(self, rng=None):
+        """Keeps the recorded order of the cards."""
+
+
+@dataclass
+class ReplayPlayer(Player):
+    """
+    A player taking the actions recorded for its seat.
+
+    The recorded actions of all seats are shared in one queue, in the order they were taken. A decision that
+    did not change the hand when it was recorded, such as a raise the game refused, left no action behind,
+    so the player does nothing when the next action belongs to another seat or street.
+
+    Attributes:
+        seat (int): The seat of the player.
+        script (deque): The (seat, street, action, amount) tuples still to be replayed.
+
+    Inherits from:
+        Player
+    """
+    seat: int = 0
+    script: deque = field(default_factory=deque)
+
+    def decide(self, game):
+        if not self.script:
+            return
+        seat, street, action, amount = self.script[0]
+        if seat != self.seat or street != game.state.value:
+            return
+        self.script.popleft()
+        if action == Action.FOLD:
+            game.make_fold(self)
+        elif action == Action.CHECK:
+            game.make_check(self)
+        elif action == Action.CALL:
+            game.make_call(self)
+        elif action == Action.BET:
+            game.make_bet(self, amount)
+        elif action == Action.RAISE:
+            game.make_raise(self, amount)
+
+
+class ReplayResult(NamedTuple):
+    """
+    The outcome of a replayed hand.
+
+    Attributes:
+        hand_id (int): The id of the hand.
+        final_chips (tuple): The chips of every player after the replay.
+        expected_chips (tuple): The chips of every player after the recorded hand.
+        unplayed_actions (int): The recorded actions the replay never reached.
+    """
+    hand_id: int
+    final_chips: tuple
+    expected_chips: tuple
+    unplayed_actions: int
+
+    @property
+    def matches(self):
+        """
+        Whether the replay ended with the recorded chips and took every recorded action.
+        """
+        return self.final_chips == self.expected_chips and self.unplayed_actions == 0
+
+
+@dataclass
+class ReplayReport:
+    """
+    A data class summarizing the replay of a range of hands.
+
+    Attributes:
+        hands (int): The number of hands replayed.
+        mismatches (list): The ReplayResult of every hand that did not match its recording.
+        elapsed (float): The seconds the replay took.
+    """
+    hands: int
+    mismatches: list
+    elapsed: float
+
+    @property
+    def hands_per_second(self):
+        """
+        The number of hands replayed per second.
+        """
+        return self.hands / self.elapsed if self.elapsed else 0.0
+
+    def display(self):
+        """
+        Displays the report.
+        """
+        print(f"Replayed {self.hands} hands in {self.elapsed:.2f} s ({self.hands_per_second:.0f} hands/s)")
+        if not self.mismatches:
+            print_with_color("All final chip counts match the recording.", Color.GREEN)
+        for result in self.mismatches:
+            print_with_color(f"Hand {result.hand_id}: replayed {result.final_chips}, "
+                             f"recorded {result.expected_chips}", Color.RED)
+
+
+def replay_hand(record):
+    """
+    Replays a recorded hand through a headless game.
+
+    Args:
+        record (HandRecord): The hand to replay.
+
+    Returns:
+        ReplayResult: The outcome of the replay.
+    """
+    script = deque(record.actions)
+    players = [ReplayPlayer(Account(username=username, chips=chips), seat=seat, script=script)
+               for seat, (username, chips) in enumerate(zip(record.usernames, record.starting_chips))]
+    game_settings = GameSettings(players=players, deck=ReplayDeck(record.deck), dealer=record.dealer,
+                                 small_blind=record.small_blind, big_blind=record.big_blind, headless=True)
+    TexasHoldemGame(game_settings).run()
+    return ReplayResult(record.hand_id, tuple(player.account.chips for player in players),
+                        record.final_chips, len(script))
+
+
+class ReplayEngine:
+    """
+    Replays the hands of a hand-history log.
+
+    Attributes:
+        directory (str): The directory holding the log.
+
+    Methods:
+        hand_count(): Returns the number of hands in the log.
+        replay(hand_id): Replays a single hand, seeking straight to it.
+        replay_range(start, stop): Replays a range of hands.
+    """
+
+    def __init__(self, directory):
+        """
+        Initializes a ReplayEngine instance.
+
+        Args:
+            directory (str): The directory holding the log.
+        """
+        self.directory = directory
+
+    def hand_count(self):
+        """
+        Returns the number of hands in the log.
+
+        Returns:
+            int: The number of recorded hands.
+        """
+        return count_hands(self.directory)
+
+    def replay(self, hand_id):
+        """
+        Replays a single hand, seeking straight to it through the index.
+
+        Args:
+            hand_id (int): The id of the hand.
+
+        Returns:
+            ReplayResult: The outcome of the replay.
+        """
+        return replay_hand(read_hand(self.directory, hand_id))
+
+    def replay_range(self, start=0, stop=None):
+        """
+        Replays a range of hands, reading them one at a time from the first one on.
+
+        Args:
+            start (int): The id of the first hand.
+            stop (int): The id after the last hand, or None to replay up to the end of the log.
+
+        Returns:
+            ReplayReport: The summary of the replay.
+        """
+        begin = time.perf_counter()
+        hands, mismatches = 0, []
+        for record in read_hand_history(self.directory, start):
+            if stop is not None and record.hand_id >= stop:
+                break
+            result = replay_hand(record)
+            hands += 1
+            if not result.matches:
+                mismatches.append(result)
+        return ReplayReport(hands, mismatches, time.perf_counter() - begin)
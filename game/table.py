@@ -8,20 +8,26 @@ class Table:
 
     Attributes:
         game_settings: The settings for the current game.
-        games_played (int): The number of games played on the table.
+        games_played (int): The number of games played on the table, which numbers the next hand.
         current_game: The current game being played on the table.
         dealer: The index of the dealer position at the table.
+        observers (list): The GameObserver objects following every game at the table.
 
     Methods:
         start_new_game(game_settings): Starts a new Texas Hold'em game with the provided settings.
         createTable(game_settings): Creates and manages multiple Texas Hold'em games at the table.
+        remove_busted_players(game_settings): Removes the players without chips left before a game.
         check_input_new_game(): Prompts the user to play another game or quit the table.
     """
 
-    def __init__(self):
+    def __init__(self, observers=()):
         """
         Initializes a Table instance.
+
+        Args:
+            observers: The GameObserver objects following every game at the table.
         """
+        self.observers = list(observers)
         self.game_settings = None
         self.games_played: int = 0
         self.current_game: None = None
@@ -34,8 +40,9 @@ class Table:
         Args:
             game_settings (GameSettings): The settings for the new game.
         """
-        self.current_game = TexasHoldemGame(game_settings)
+        self.current_game = TexasHoldemGame(game_settings, self.observers)
         self.current_game.run()
+        self.games_played += 1
 
     def createTable(self, game_settings):
         """
@@ -46,11 +53,25 @@ class Table:
         """
         while True:
             game_settings.dealer = self.dealer
+            game_settings.hand_number = self.games_played
             self.start_new_game(game_settings)
             self.dealer = (self.dealer + 1) % len(game_settings.players)
             if not self.check_input_new_game():
                 break
 
+    def remove_busted_players(self, game_settings):
+        """
+        Removes the players without chips left before a game. The dealer button moves to the first remaining
+        player at or after the dealer's seat, so the dealer index stays within the remaining players.
+
+        Args:
+            game_settings (GameSettings): The settings for the next game.
+        """
+        players = game_settings.players
+        seated_before = sum(player.account.chips > 0 for player in players[:game_settings.dealer % len(players)])
+        players[:] = [player for player in players if player.account.chips > 0]
+        self.dealer = game_settings.dealer = seated_before % len(players)
+
     def check_input_new_game(self):
         """
         Prompts the user to play another game or quit the table.
@@ -0,0 +1,349 @@
+import functools
+import math
+import multiprocessing
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from game.history import HandHistoryRecorder
+from game.table import Table
+from models.account import Account
+from models.deck import StandardDeck
+from models.strategies import create_bot, display_strategy_stats
+from settings import BotSettings, GameSettings
+from utils.color import Color, print_with_color
+from utils.instrumentation import COUNTERS, LATENCIES
+from utils.rng import make_rng
+
+
+class TableState(NamedTuple):
+    """
+    The compact form of a tournament table exchanged between the coordinator and the workers.
+
+    Attributes:
+        table_id (int): The identifier of the table.
+        dealer (int): The seat of the dealer.
+        small_blind (int): The small blind the table plays with.
+        hands (int): The number of hands to play, or the number of hands played in a result.
+        usernames (tuple): The usernames of the seated players, in seat order.
+        chips (tuple): The chips of the seated players, in seat order.
+        hand_number (int): The number of hands dealt at the table before the round.
+    """
+    table_id: int
+    dealer: int
+    small_blind: int
+    hands: int
+    usernames: tuple
+    chips: tuple
+    hand_number: int = 0
+
+
+class TableResult(NamedTuple):
+    """
+    The outcome of a table's scheduling round.
+
+    Attributes:
+        state (TableState): The table after the round, with the number of hands actually played.
+        worker (int): The process id of the worker that played the round.
+        elapsed (float): The seconds the worker spent playing the round.
+        counters (dict): The instrumentation counters the round added to, such as hand strength computations.
+        latencies (dict): The bucket counts the round added to the latency histograms, by name.
+    """
+    state: TableState
+    worker: int
+    elapsed: float
+    counters: dict
+    latencies: dict
+
+
+class TournamentTable(Table):
+    """
+    A headless tournament table playing a fixed number of hands, or fewer if only one player has chips left.
+
+    Inherits from:
+        Table
+    """
+
+    def __init__(self, hands, observers=(), first_hand=0):
+        """
+        Initializes a TournamentTable instance.
+
+        Args:
+            hands (int): The maximum number of hands to play.
+            observers: The GameObserver objects following every game at the table.
+            first_hand (int): The number of hands dealt at the table in earlier rounds.
+        """
+        super().__init__(observers)
+        self.hands = hands
+        self.first_hand = first_hand
+
+    def start_new_game(self, game_settings):
+        self.remove_busted_players(game_settings)
+        game_settings.hand_number = self.first_hand + self.games_played
+        super().start_new_game(game_settings)
+
+    def check_input_new_game(self):
+        seated = [player for player in self.current_game.players if player.account.chips > 0]
+        return self.games_played < self.hands and len(seated) >= 2
+
+
+def play_table(state, history_dir=None, seed=None):
+    """
+    Plays a scheduling round of a tournament table. Runs in a worker process.
+
+    The cards of every hand only depend on the seed, the table and the hand number, so a seeded tournament
+    deals the same hands whichever worker plays a table. The players are seated with the default strategy,
+    so the time their decisions take is recorded and returned with the counters.
+
+    Args:
+        state (TableState): The table to play.
+        history_dir (str): The directory hand histories are recorded in, one log per table, or None.
+        seed (int): The session seed, or None for unseeded shuffles.
+
+    Returns:
+        TableResult: The table after the round.
+    """
+    start = time.perf_counter()
+    counters = COUNTERS.snapshot()
+    latencies = LATENCIES.snapshot()
+    bot_settings = BotSettings()
+    players = [create_bot("default", Account(username=username, chips=chips), bot_settings)
+               for username, chips in zip(state.usernames, state.chips)]
+    recorder = None
+    if history_dir is not None:
+        recorder = HandHistoryRecorder(os.path.join(history_dir, f"table-{state.table_id:04d}"))
+    table = TournamentTable(state.hands, [recorder] if recorder is not None else [], state.hand_number)
+    table.dealer = state.dealer % len(players)
+    game_settings = GameSettings(players=players[:], deck=StandardDeck(), dealer=table.dealer,
+                                 small_blind=state.small_blind, big_blind=state.small_blind * 2, headless=True,
+                                 seed=seed, table_id=state.table_id)
+    table.createTable(game_settings)
+    if recorder is not None:
+        recorder.close()
+    result = state._replace(dealer=table.dealer, hands=table.games_played,
+                            chips=tuple(player.account.chips for player in players),
+                            hand_number=state.hand_number + table.games_played)
+    return TableResult(result, os.getpid(), time.perf_counter() - start, dict(COUNTERS.snapshot() - counters),
+                       LATENCIES.since(latencies))
+
+
+@dataclass
+class TournamentReport:
+    """
+    A data class representing the outcome and throughput of a tournament.
+
+    Attributes:
+        places (list): The usernames in finishing order, winner first.
+        hands (int): The number of hands played over all tables.
+        rounds (int): The number of scheduling rounds.
+        wall_time (float): The seconds the tournament took.
+        workers (dict): The number of hands played and the busy seconds of every worker, by process id.
+        scheduling_overhead (float): The seconds spent outside of the workers' longest busy time in every round.
+        counters (dict): The instrumentation counters summed over all tables.
+        latencies (dict): The bucket counts of the latency histograms summed over all tables, by name.
+    """
+    places: list
+    hands: int
+    rounds: int
+    wall_time: float
+    workers: dict = field(default_factory=dict)
+    scheduling_overhead: float = 0.0
+    counters: dict = field(default_factory=dict)
+    latencies: dict = field(default_factory=dict)
+
+    def hands_per_second(self, worker):
+        """
+        Returns the number of hands a worker played per busy second.
+
+        Args:
+            worker (int): The process id of the worker.
+
+        Returns:
+            float: The worker's hands per second.
+        """
+        hands, busy = self.workers[worker]
+        return hands / busy if busy else 0.0
+
+    def display(self):
+        """
+        Displays the report.
+        """
+        print_with_color("Tournament Results", Color.GREEN)
+        print_with_color("==================================", Color.DARK_GRAY)
+        for place, username in enumerate(self.places[:3], start=1):
+            print(f"{place}. ", end="")
+            print_with_color(username, Color.MAGENTA)
+        print_with_color("==================================", Color.DARK_GRAY)
+        print(f"Hands: {self.hands}  Rounds: {self.rounds}  Time: {self.wall_time:.2f} s")
+        for worker, (hands, busy) in sorted(self.workers.items()):
+            print(f"Worker {worker}: {hands} hands, {self.hands_per_second(worker):.1f} hands/s")
+        overhead_share = self.scheduling_overhead / self.wall_time if self.wall_time else 0.0
+        print(f"Scheduling overhead: {self.scheduling_overhead:.3f} s ({overhead_share:.1%})")
+        computed = self.counters.get("hand_strength.computed", 0)
+        reused = self.counters.get("hand_strength.reused", 0)
+        print(f"Hand strength: {computed} computed, {reused} reused")
+        display_strategy_stats(self.latencies, self.counters)
+
+
+class Tournament:
+    """
+    A coordinator running a multi-table tournament of computer players.
+
+    Players are seated across as many tables as needed. Every scheduling round, each table plays a few hands
+    in a worker process; the coordinator then removes busted players, breaks tables that are no longer needed,
+    balances the rest and raises the blinds on schedule, until one player holds all the chips.
+
+    Attributes:
+        settings (TournamentSettings): The settings of the tournament.
+        tables (dict): The compact state of every table, by table id.
+        busted (list): The usernames of the busted players, in the order they busted.
+        rounds (int): The number of scheduling rounds played.
+        hands (int): The number of hands played over all tables.
+        workers (dict): The number of hands played and the busy seconds of every worker, by process id.
+        scheduling_overhead (float): The seconds spent outside of the workers' longest busy time in every round.
+        counters (Counter): The instrumentation counters summed over all tables.
+        latencies (dict): The bucket counts of the latency histograms summed over all tables, by name.
+
+    Methods:
+        seat_players(): Seats all entrants across the tables.
+        small_blind(): Returns the small blind of the current level.
+        run(): Runs the tournament to the end.
+        play_round(pool): Plays a scheduling round on every table.
+        balance_tables(): Removes busted players, breaks tables and balances the rest.
+    """
+
+    def __init__(self, settings):
+        """
+        Initializes a Tournament instance.
+
+        Args:
+            settings (TournamentSettings): The settings of the tournament.
+        """
+        self.settings = settings
+        self.tables = {}
+        self.busted = []
+        self.rounds = 0
+        self.hands = 0
+        self.workers = {}
+        self.scheduling_overhead = 0.0
+        self.counters = Counter()
+        self.latencies = {}
+
+    def seat_players(self):
+        """
+        Seats all entrants across the tables in random order, drawn from the seating stream of a seeded session.
+        """
+        usernames = [f"BOT-{i}" for i in range(self.settings.entrants)]
+        make_rng(self.settings.seed, "seating").shuffle(usernames)
+        table_count = math.ceil(len(usernames) / self.settings.seats_per_table)
+        for table_id in range(table_count):
+            seated = tuple(usernames[table_id::table_count])
+            self.tables[table_id] = TableState(table_id, 0, self.small_blind(), 0, seated,
+                                               (self.settings.chips,) * len(seated))
+
+    def small_blind(self):
+        """
+        Returns the small blind of the current level.
+
+        Returns:
+            int: The small blind.
+        """
+        levels = self.settings.blind_levels
+        return levels[min(self.rounds // self.settings.rounds_per_level, len(levels) - 1)]
+
+    def run(self):
+        """
+        Runs the tournament to the end.
+
+        Returns:
+            TournamentReport: The outcome and throughput of the tournament.
+        """
+        start = time.perf_counter()
+        self.seat_players()
+        pool = multiprocessing.Pool(self.settings.workers) if self.settings.workers > 0 else None
+        try:
+            while sum(len(state.usernames) for state in self.tables.values()) > 1:
+                self.play_round(pool)
+                balance_start = time.perf_counter()
+                self.balance_tables()
+                self.scheduling_overhead += time.perf_counter() - balance_start
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        winners = [username for state in self.tables.values() for username in state.usernames]
+        return TournamentReport(places=winners + self.busted[::-1], hands=self.hands, rounds=self.rounds,
+                                wall_time=time.perf_counter() - start, workers=self.workers,
+                                scheduling_overhead=self.scheduling_overhead, counters=dict(self.counters),
+                                latencies=self.latencies)
+
+    def play_round(self, pool):
+        """
+        Plays a scheduling round on every table, in parallel when a pool of workers is given.
+
+        Args:
+            pool (multiprocessing.Pool): The worker pool, or None to play every table in this process.
+        """
+        small_blind = self.small_blind()
+        states = [state._replace(small_blind=small_blind, hands=self.settings.hands_per_round)
+                  for state in self.tables.values()]
+
+        round_start = time.perf_counter()
+        play = functools.partial(play_table, history_dir=self.settings.history_dir, seed=self.settings.seed)
+        results = pool.imap_unordered(play, states) if pool is not None else map(play, states)
+        busy = {}
+        for result in results:
+            self.tables[result.state.table_id] = result.state
+            self.hands += result.state.hands
+            busy[result.worker] = busy.get(result.worker, 0.0) + result.elapsed
+            hands, total = self.workers.get(result.worker, (0, 0.0))
+            self.workers[result.worker] = (hands + result.state.hands, total + result.elapsed)
+            self.counters.update(result.counters)
+            for name, counts in result.latencies.items():
+                totals = self.latencies.get(name, [0] * len(counts))
+                self.latencies[name] = [total + count for total, count in zip(totals, counts)]
+        round_time = time.perf_counter() - round_start
+
+        self.scheduling_overhead += max(round_time - max(busy.values(), default=0.0), 0.0)
+        self.rounds += 1
+
+    def balance_tables(self):
+        """
+        Removes busted players, breaks the tables no longer needed and moves players until
+        table sizes differ by at most one.
+        """
+        seats = {}
+        for table_id, state in sorted(self.tables.items()):
+            seats[table_id] = []
+            for username, chips in zip(state.usernames, state.chips):
+                if chips > 0:
+                    seats[table_id].append((username, chips))
+                else:
+                    self.busted.append(username)
+
+        remaining = sum(len(players) for players in seats.values())
+        needed = max(math.ceil(remaining / self.settings.seats_per_table), 1)
+        while len(seats) > needed:
+            broken = min(seats, key=lambda table_id: len(seats[table_id]))
+            for player in seats.pop(broken):
+                smallest = min(seats, key=lambda table_id: len(seats[table_id]))
+                seats[smallest].append(player)
+
+        while True:
+            largest = max(seats, key=lambda table_id: len(seats[table_id]))
+            smallest = min(seats, key=lambda table_id: len(seats[table_id]))
+            if len(seats[largest]) - len(seats[smallest]) <= 1:
+                break
+            seats[smallest].append(seats[largest].pop())
+
+        tables = {}
+        for table_id, players in seats.items():
+            dealer = self.tables[table_id].dealer % len(players) if players else 0
+            tables[table_id] = TableState(table_id, dealer, self.small_blind(), 0,
+                                          tuple(username for username, _ in players),
+                                          tuple(chips for _, chips in players),
+                                          self.tables[table_id].hand_number)
+        self.tables = tables
@@ -1,24 +1,136 @@
+import argparse
 import time
 import sys
 
 from app import Application
+from settings import Pacing
 
 
-def loading():
+def loading(pacing=Pacing.NORMAL):
     print("Loading:")
 
     animation = ["[■□□□□□□□□□]", "[■■□□□□□□□□]", "[■■■□□□□□□□]", "[■■■■□□□□□□]", "[■■■■■□□□□□]", "[■■■■■■□□□□]",
                  "[■■■■■■■□□□]", "[■■■■■■■■□□]", "[■■■■■■■■■□]", "[■■■■■■■■■■]"]
 
     for i in range(len(animation)):
-        time.sleep(0.1)
+        time.sleep(pacing.loading_delay)
         sys.stdout.write("\r" + animation[i % len(animation)])
         sys.stdout.flush()
 
     print("\n")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="CLI Poker Game")
+    parser.add_argument("--pacing", choices=[pacing.str for pacing in Pacing], default=Pacing.NORMAL.str,
+                        help="how fast the interactive game moves on")
+    parser.add_argument("--history", metavar="DIR", help="record every hand to a hand-history log in DIR")
+    parser.add_argument("--serve", action="store_true", help="host tables for players connecting over a socket")
+    parser.add_argument("--connect", action="store_true", help="play at a table hosted by a table server")
+    parser.add_argument("--host", default="127.0.0.1", help="address of the table server")
+    parser.add_argument("--port", type=int, default=7777, help="TCP port of the table server")
+    parser.add_argument("--unix", metavar="PATH", help="Unix socket of the table server, used instead of TCP")
+    parser.add_argument("--players", type=int, default=2, help="seats at every hosted table (2 - 8)")
+    parser.add_argument("--humans", type=int, default=1, help="connected players seated together at a hosted table")
+    parser.add_argument("--timeout", type=float, help="seconds for each decision at a hosted table")
+    parser.add_argument("--username", default="player", help="username to join a table server with")
+    parser.add_argument("--tournament", type=int, metavar="ENTRANTS",
+                        help="run a multi-table tournament of computer players")
+    parser.add_argument("--seats", type=int, default=8, help="seats at every tournament table")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes running tournament tables")
+    parser.add_argument("--seed", type=int, help="seed that makes every shuffle of the session reproducible")
+    parser.add_argument("--replay", metavar="DIR", help="replay the hand-history log in DIR and check the chip counts")
+    parser.add_argument("--hand", type=int, help="replay only this hand of the log")
+    parser.add_argument("--train-solver", type=int, metavar="ITERATIONS",
+                        help="train the CFR solver and export its policy to the --policy file")
+    parser.add_argument("--checkpoint", metavar="PATH", help="CFR training checkpoint, resumed if it exists")
+    parser.add_argument("--policy", metavar="PATH", default="policy.cfr",
+                        help="CFR policy file written by training and played with --solver-bots")
+    parser.add_argument("--solver-bots", action="store_true", help="computer players follow the --policy file")
+    parser.add_argument("--build-buckets", metavar="PATH", help="precompute the card-abstraction buckets into PATH")
+    parser.add_argument("--bucket-samples", type=int, default=5000,
+                        help="deals sampled per street when building the buckets")
+    parser.add_argument("--buckets", metavar="PATH", help="card-abstraction buckets used to train and play the policy")
+    parser.add_argument("--build-push-fold", action="store_true",
+                        help="recompute the short-stack push/fold charts computer players use")
+    parser.add_argument("--search-bots", type=float, metavar="SECONDS",
+                        help="computer players choose with Monte Carlo tree search, SECONDS per decision")
+    parser.add_argument("--bots", metavar="NAMES",
+                        help="comma-separated registered strategies (default, cfr, mcts) of the computer seats, "
+                             "in turn")
+    parser.add_argument("--bot-budget", type=float, metavar="SECONDS",
+                        help="seconds every computer decision may take before the bot checks or folds instead")
+    return parser.parse_args()
+
+
 if __name__ == '__main__':
+    args = parse_args()
 
-    app = Application()
-    app.run()
+    if args.serve:
+        from server.table_server import run_server
+        run_server(args.host, args.port, args.unix, args.players, args.humans, args.timeout, args.seed)
+    elif args.tournament:
+        from game.tournament import Tournament
+        from settings import TournamentSettings
+        Tournament(TournamentSettings(entrants=args.tournament, seats_per_table=args.seats,
+                                      workers=args.workers, history_dir=args.history,
+                                      seed=args.seed)).run().display()
+    elif args.replay:
+        from game.replay import ReplayEngine
+        engine = ReplayEngine(args.replay)
+        if args.hand is not None:
+            result = engine.replay(args.hand)
+            print(f"Hand {result.hand_id}: replayed {result.final_chips}, recorded {result.expected_chips}")
+        else:
+            engine.replay_range().display()
+    elif args.build_buckets:
+        from solver.buckets import BucketTable
+        BucketTable.build(samples=args.bucket_samples, seed=args.seed).save(args.build_buckets)
+        print(f"Buckets written to {args.build_buckets}")
+    elif args.build_push_fold:
+        from solver.push_fold import CHARTS_PATH, PushFoldCharts
+        PushFoldCharts.build(seed=args.seed).save()
+        print(f"Push/fold charts written to {CHARTS_PATH}")
+    elif args.train_solver:
+        import os
+        from solver.abstraction import AbstractGame
+        from solver.buckets import BucketTable
+        from solver.cfr import CFRTrainer
+        bucket_table = BucketTable.load(args.buckets) if args.buckets else None
+        if args.checkpoint and os.path.exists(args.checkpoint):
+            trainer = CFRTrainer.from_checkpoint(args.checkpoint, args.seed, bucket_table)
+        elif bucket_table is not None:
+            trainer = CFRTrainer(AbstractGame(buckets=bucket_table.buckets), args.seed, bucket_table)
+        else:
+            trainer = CFRTrainer(seed=args.seed)
+        speed = trainer.train(args.train_solver, args.checkpoint)
+        trainer.export_policy(args.policy)
+        print(f"Trained {trainer.iterations} iterations ({speed:.0f} iterations/s), policy written to {args.policy}")
+    elif args.connect:
+        from server.client import run_client
+        run_client(args.username, args.host, args.port, args.unix)
+    else:
+        app = Application()
+        app.pacing = next(pacing for pacing in Pacing if pacing.str == args.pacing)
+        app.history_dir = args.history
+        app.seed = args.seed
+        bots = app.bot_settings
+        if args.solver_bots:
+            bots.strategies = ["cfr"]
+        if args.search_bots is not None:
+            bots.strategies = ["mcts"]
+            bots.search_budget = args.search_bots
+        if args.bots:
+            from models.strategies import STRATEGIES
+            bots.strategies = args.bots.split(",")
+            unknown = [name for name in bots.strategies if name not in STRATEGIES]
+            if unknown:
+                sys.exit(f"Unknown bot strategies: {', '.join(unknown)} (expected {', '.join(STRATEGIES)})")
+        bots.policy_path = args.policy
+        if args.buckets:
+            from solver.buckets import BucketTable
+            bots.bucket_table = BucketTable.load(args.buckets)
+        bots.latency_budget = args.bot_budget
+        bots.seed = args.seed
+        loading(app.pacing)
+        app.run()
@@ -1,4 +1,5 @@
 from menus.menu import Menu
+from settings import Pacing
 from utils.color import print_with_color, Color
 
 
@@ -13,6 +14,8 @@ class GameSettingsMenu(Menu):
         display_menu(): Displays the game settings menu to the user.
         check_input(): Checks and processes the user's input for the game settings menu.
         set_players(): Allows the user to set the number of players for the game.
+        set_decision_timeout(): Allows the user to set the time limit for each decision.
+        set_pacing(): Allows the user to set how fast the game moves on.
     """
 
     def __init__(self, app):
@@ -33,11 +36,16 @@ class GameSettingsMenu(Menu):
         print_with_color("==================================", Color.DARK_GRAY)
         print(Color.BLUE.value + "Number of players: " + Color.RED.value + str(
             self.app.players_number) + Color.RESET.value)
+        decision_timeout = "none" if self.app.decision_timeout is None else f"{self.app.decision_timeout:g} s"
+        print(Color.BLUE.value + "Decision time limit: " + Color.RED.value + decision_timeout + Color.RESET.value)
+        print(Color.BLUE.value + "Pacing: " + Color.RED.value + self.app.pacing.str + Color.RESET.value)
         print_with_color("==================================", Color.DARK_GRAY)
         print()
         print("1. Start the game")
         print("2. Change number of players")
-        print("3. Back to Main Menu")
+        print("3. Change decision time limit")
+        print("4. Change pacing")
+        print("5. Back to Main Menu")
 
     def check_input(self):
         """
@@ -55,12 +63,18 @@ class GameSettingsMenu(Menu):
                     self.set_players()
                     break
                 elif choice == 3:
+                    self.set_decision_timeout()
+                    break
+                elif choice == 4:
+                    self.set_pacing()
+                    break
+                elif choice == 5:
                     self.app.curr_menu = self.app.main_menu
                     break
                 else:
-                    print_with_color("Invalid choice. Please enter a number between 1 and 3.", Color.RED)
+                    print_with_color("Invalid choice. Please enter a number between 1 and 5.", Color.RED)
             else:
-                print_with_color("Invalid choice. Please enter a number between 1 and 3.", Color.RED)
+                print_with_color("Invalid choice. Please enter a number between 1 and 5.", Color.RED)
 
     def set_players(self):
         """
@@ -78,3 +92,38 @@ class GameSettingsMenu(Menu):
                     print_with_color("Invalid number of players. Please enter a number between 2 and 8.", Color.RED)
             else:
                 print_with_color("Invalid number of players. Please enter a number between 2 and 8.", Color.RED)
+
+    def set_decision_timeout(self):
+        """
+        Allows the user to set the number of seconds for each decision. A player who runs out of time
+        checks if possible and folds otherwise.
+        """
+        print_with_color("Enter seconds per decision (0 for no limit)", Color.GREEN)
+        while True:
+            choice = input("> ")
+            if choice.isdigit():
+                choice = int(choice)
+                self.app.decision_timeout = choice if choice > 0 else None
+                break
+            else:
+                print_with_color("Invalid number of seconds. Please enter a whole number.", Color.RED)
+
+    def set_pacing(self):
+        """
+        Allows the user to set how fast the game moves on: normal, fast or turbo.
+        """
+        pacings = list(Pacing)
+        print_with_color("Choose pacing", Color.GREEN)
+        for index, pacing in enumerate(pacings, start=1):
+            print(f"{index}. {pacing.str.capitalize()}")
+        while True:
+            choice = input("> ")
+            if choice.isdigit():
+                choice = int(choice)
+                if 1 <= choice <= len(pacings):
+                    self.app.pacing = pacings[choice - 1]
+                    break
+                else:
+                    print_with_color(f"Invalid choice. Please enter a number between 1 and {len(pacings)}.", Color.RED)
+            else:
+                print_with_color(f"Invalid choice. Please enter a number between 1 and {len(pacings)}.", Color.RED)
@@ -122,11 +122,36 @@ class Card:
 
     Methods:
         __repr__: Returns a string representation of the card in the format '{rank}{suit}'.
+        index: Returns the position of the card in a new deck (0 - 51).
+        from_index(index): Returns the card at the given position of a new deck.
     """
 
     rank: Rank
     suit: Suit
 
+    @property
+    def index(self):
+        """
+        Get the position of the card in a new deck, used as a compact card code.
+
+        Returns:
+            int: The index of the card, from 0 to 51.
+        """
+        return _SUIT_INDEX[self.suit] * 13 + self.rank.value['int'] - 2
+
+    @staticmethod
+    def from_index(index):
+        """
+        Returns the card at the given position of a new deck.
+
+        Args:
+            index (int): The index of the card, from 0 to 51.
+
+        Returns:
+            Card: The card with that index.
+        """
+        return Card(_RANKS[index % 13], _SUITS[index // 13])
+
     def __lt__(self, other):
         """
         Defines the behavior of the '<' operator for Card instances.
@@ -143,3 +168,8 @@ class Card:
             str: The string representation of the card.
         """
         return f'{self.rank.str}{self.suit.value}'
+
+
+_SUITS = list(Suit)
+_RANKS = list(Rank)
+_SUIT_INDEX = {suit: index for index, suit in enumerate(_SUITS)}
@@ -10,7 +10,7 @@ class Deck:
 
     Methods:
         __init__(): Initializes the deck with all 52 standard playing cards.
-        shuffle(): Shuffles the cards in the deck.
+        shuffle(rng): Shuffles the cards in the deck.
         deal_card(): Deals a single card from the top of the deck.
     """
 
@@ -18,9 +18,13 @@ class Deck:
         """Initialize the deck with all 52 standard playing cards."""
         self.cards = [Card(rank, suit) for suit in Suit for rank in Rank]
 
-    def shuffle(self):
-        """Shuffles the cards in the deck."""
-        random.shuffle(self.cards)
+    def shuffle(self, rng=random):
+        """Shuffles the cards in the deck.
+
+        Args:
+            rng (random.Random): The random number generator to shuffle with, the global one by default.
+        """
+        rng.shuffle(self.cards)
 
     def deal_card(self):
         """Deal a single card from the top of the deck.
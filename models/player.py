@@ -1,8 +1,14 @@
 
+import time
 from dataclasses import dataclass
-from utils.TexasHoldemCombinations import HandChecker
+from utils.timed_input import DecisionTimeout, timed_input
 from utils.color import Color, print_with_color
+from utils.instrumentation import COUNTERS, LATENCIES
 from models.account import Account
+from game.board_texture import WET
+from game.opponent_stats import NO_STATS, find_opponent_stats
+from utils.TexasHoldemStates import Action, TexasHoldemState
+from utils.TexasHoldemCombinations import HandChecker
 
 
 @dataclass
@@ -14,10 +20,19 @@ class Player:
           account (Account): The player's account.
           hole_cards (list): The player's hole cards.
           active (bool): Whether the player is active in the game.
+          deadline (float): The time.monotonic() value by which the current decision must be made, if limited.
+          interactive (bool): Whether a person takes the player's decisions, so the game waits on them.
+          strategy (str): The name the player was created with from the strategy registry, or None.
+          latency_budget (float): The seconds every decision may take before the default action is taken
+              for the player, or None for no limit beyond the game's decision timeout.
     """
     account: Account
     hole_cards = []
     active = True
+    deadline = None
+    interactive = False
+    strategy = None
+    latency_budget = None
 
     def choose_action(self, game):
         """
@@ -25,18 +40,42 @@ class Player:
 
                 Args:
                     game (TexasHoldemGame): The current Texas Hold'em game instance.
+
+                If the game limits the time per decision, or the player has a latency budget, and the player
+                runs out of time, the game takes the default action for the player. The time every decision
+                of a player created from the strategy registry takes is recorded in LATENCIES.
         """
         if self.account.chips == 0:
             return
-        last_player_bet = game.players[(game.last_state_player_index + 1) % len(game.players)]
+        start = time.monotonic()
+        limits = [limit for limit in (game.curr_game_settings.decision_timeout, self.latency_budget)
+                  if limit is not None]
+        if limits:
+            self.deadline = start + min(limits)
+        try:
+            self.decide(game)
+        except DecisionTimeout:
+            game.make_timeout(self)
+            if self.strategy is not None:
+                COUNTERS.add(f"strategy.{self.strategy}.fallbacks")
+        finally:
+            self.deadline = None
+            if self.strategy is not None:
+                LATENCIES.record(f"strategy.{self.strategy}", time.monotonic() - start)
 
-        if game.players_bet[last_player_bet.account.username] > game.players_bet[self.account.username]:
-            diff = game.players_bet[last_player_bet.account.username] - game.players_bet[self.account.username]
-            if diff < 0:
-                self.to_call_all_in(game)
-            else:
-                self.to_call_or_raise(game, diff)
+    def decide(self, game):
+        """
+                Decides which kind of action the player is facing and lets the player take it.
+
+                Args:
+                    game (TexasHoldemGame): The current Texas Hold'em game instance.
+        """
+        legal = game.legal_actions(game.current_player_index)
 
+        if legal.all_in_call:
+            self.to_call_all_in(game)
+        elif legal.can_call:
+            self.to_call_or_raise(game, legal.call_amount)
         else:
             # without Call. Check, Raise, Fold impl
             self.to_check_raise(game)
@@ -75,12 +114,97 @@ class ComputerPlayer(Player):
     """
       Represents a computer-controlled player in a poker game.
 
+      Preflop, once the effective stack is PUSH_FOLD_STACK big blinds or less, the player only pushes all-in
+      or folds, looking the decision up in the push/fold charts instead of estimating its hand strength.
+
+      The hand strength is measured against every live opponent: against several, or against opponents whose
+      VPIP is known, it is the chance of being behind none of them, each holding a range made of their VPIP's
+      share of the best starting hands.
+
+      Methods:
+          hand_strength(game): Returns the player's hand strength against the live opponents.
+          push_or_fold(game): Takes a short-stack preflop decision from the push/fold charts.
+          call_threshold(game): Returns the hand strength the player needs to call the last bet or raise.
+          raise_threshold(game): Returns the hand strength the player needs to bet or raise, from the board texture.
+          has_drawing_odds(game, diff): Returns whether the player's outs pay for a call.
+
       Inherits from:
           Player
       """
 
+    def decide(self, game):
+        if not self.push_or_fold(game):
+            super().decide(game)
+
+    def push_or_fold(self, game):
+        """
+                Takes a short-stack preflop decision from the push/fold charts: pushes all-in or folds when no one
+                raised, calls a raise all-in or folds otherwise.
+
+                Args:
+                    game (TexasHoldemGame): The current Texas Hold'em game instance.
+
+                Returns:
+                    bool: True if the player acted, False if the charts do not apply.
+        """
+        # Imported on the first computer decision, so importing the player models does not load the solver.
+        from solver.push_fold import PUSH_FOLD_STACK, push_fold_charts
+
+        charts = push_fold_charts()
+        if charts is None or game.state != TexasHoldemState.PREFLOP:
+            return False
+        seat = game.current_player_index
+        big_blind = game.curr_game_settings.big_blind
+        hole_cards = [card.index for card in self.hole_cards]
+        raiser = next((index for index in range(len(game.actions) - 1, -1, -1)
+                       if game.actions[index][1] in (Action.BET, Action.RAISE)), None)
+        if raiser is None:
+            opponents = [_stack(game, player) for player in game.players if player.active and player is not self]
+            stack = min(_stack(game, self), max(opponents, default=0)) / big_blind
+            behind = _players_behind(game, seat, len(game.actions))
+            if stack > PUSH_FOLD_STACK or behind == 0:
+                return False
+            act = charts.should_push(stack, behind, hole_cards)
+        else:
+            raiser_seat = game.actions[raiser][0]
+            stack = min(_stack(game, self), _stack(game, game.players[raiser_seat])) / big_blind
+            if stack > PUSH_FOLD_STACK:
+                return False
+            act = charts.should_call(stack, _players_behind(game, raiser_seat, raiser), hole_cards)
+
+        legal = game.legal_actions(seat)
+        if act and legal.can_raise:
+            game.make_raise(self, legal.max_raise)
+        elif act:
+            game.make_call(self)
+        elif legal.can_check:
+            game.make_check(self)
+        else:
+            game.make_fold(self)
+        return True
+
+    def hand_strength(self, game):
+        """
+                Returns the player's hand strength against the live opponents.
+
+                Args:
+                    game (TexasHoldemGame): The current Texas Hold'em game instance.
+
+                Returns:
+                    float: The hand strength, as returned by ComboRanking.strength.
+        """
+        stats = find_opponent_stats(game)
+        shares = []
+        for player in game.players:
+            if player is not self and player.active:
+                opponent = NO_STATS if stats is None else stats.stats(player.account.username)
+                shares.append(max(opponent.vpip, 0.05) if opponent.hands >= 20 else None)
+        if shares == [None]:
+            return game.decision_context.hand_strength(self, game.community_cards)
+        return game.decision_context.multiway_strength(self, game.community_cards, shares)
+
     def to_call_all_in(self, game):
-        hand_strength = HandChecker.calculate_hand_strength(self.hole_cards, game.community_cards)
+        hand_strength = self.hand_strength(game)
 
         if hand_strength > 0.5:
             game.make_call(self)
@@ -88,18 +212,79 @@ class ComputerPlayer(Player):
             game.make_fold(self)
 
     def to_call_or_raise(self, game, diff):
-        hand_strength = HandChecker.calculate_hand_strength(self.hole_cards, game.community_cards)
-        if hand_strength > 0.4:
-            amount = min(self.account.chips, 5)
+        hand_strength = self.hand_strength(game)
+        legal = game.legal_actions(game.current_player_index)
+        amount = min(legal.max_raise, 5)
+        if hand_strength > self.raise_threshold(game) and amount >= legal.min_raise:
             game.make_raise(self, amount)
-        elif hand_strength > 0.2:
+        elif hand_strength > self.call_threshold(game) or self.has_drawing_odds(game, diff):
+            # Also reached by a strong hand when a raise of 5 would not exceed the bet.
             game.make_call(self)
         else:
             game.make_fold(self)
 
+    def raise_threshold(self, game):
+        """
+                Returns the hand strength the player needs to bet or raise: less on a dry board, where few hands
+                can have improved, more on a board with flush or straight draws.
+
+                Args:
+                    game (TexasHoldemGame): The current Texas Hold'em game instance.
+
+                Returns:
+                    float: The hand strength needed to bet or raise.
+        """
+        if not game.community_cards:
+            return 0.4
+        return 0.45 if game.board_texture & WET else 0.35
+
+    def has_drawing_odds(self, game, diff):
+        """
+                Returns whether the chance that the next card improves the player's hand pays for a call.
+
+                Args:
+                    game (TexasHoldemGame): The current Texas Hold'em game instance.
+                    diff (int): The amount to call.
+
+                Returns:
+                    bool: True if the share of unseen cards that are outs is above the share of the pot the
+                    call puts in.
+        """
+        board = [card.index for card in game.community_cards]
+        outs = HandChecker.find_outs([card.index for card in self.hole_cards], board)
+        return outs.count / (50 - len(board)) > diff / (game.pot + diff)
+
+    def call_threshold(self, game):
+        """
+                Returns the hand strength the player needs to call the last bet or raise: less against an opponent
+                who bets far more often than they call, more against one who rarely does.
+
+                Args:
+                    game (TexasHoldemGame): The current Texas Hold'em game instance.
+
+                Returns:
+                    float: The hand strength needed to call.
+        """
+        stats = find_opponent_stats(game)
+        if stats is None:
+            return 0.2
+        for seat, action in reversed(game.actions):
+            if action in (Action.BET, Action.RAISE):
+                opponent = stats.stats(game.players[seat].account.username)
+                break
+        else:
+            return 0.2
+        if opponent.hands < 20:
+            return 0.2
+        if opponent.aggression > 3:
+            return 0.15
+        if opponent.aggression < 1:
+            return 0.3
+        return 0.2
+
     def to_check_raise(self, game):
-        hand_strength = HandChecker.calculate_hand_strength(self.hole_cards, game.community_cards)
-        if hand_strength > 0.4:
+        hand_strength = self.hand_strength(game)
+        if hand_strength > self.raise_threshold(game):
             # 10% from game pot
             amount = min(self.account.chips, 5)
             game.make_raise(self, amount)
@@ -107,6 +292,28 @@ class ComputerPlayer(Player):
             game.make_check(self)
 
 
+def _stack(game, player):
+    """
+    Returns the chips a player started the hand with.
+    """
+    return player.account.chips + game.players_bet[player.account.username]
+
+
+def _players_behind(game, seat, action_index):
+    """
+    Returns the number of players left to act after a seat preflop, up to the big blind, when the seat took
+    the action at action_index of game.actions.
+    """
+    folded = {index for index, action in game.actions[:action_index] if action == Action.FOLD}
+    big_blind = (game.curr_game_settings.dealer + 2) % len(game.players)
+    behind = 0
+    while seat != big_blind:
+        seat = (seat + 1) % len(game.players)
+        player = game.players[seat]
+        behind += seat not in folded and (player.active or player.account.chips > 0)
+    return behind
+
+
 @dataclass
 class HumanPlayer(Player):
     """
@@ -115,10 +322,19 @@ class HumanPlayer(Player):
       Inherits from:
           Player
     """
+    interactive = True
+
+    def decide(self, game):
+        game.display_standing(self)
+        game.display_equity(self)
+        super().decide(game)
+        if game.live_equity is not None:
+            game.live_equity.pause()
+
     def to_call_all_in(self, game):
         while True:
             print(f'Choose the action: 1. All-In {self.account.chips} 2. Fold')
-            choice = input(">")
+            choice = timed_input(">", self.deadline)
             if choice.isdigit():
                 choice = int(choice)
                 if 1 <= choice <= 2:
@@ -134,9 +350,10 @@ class HumanPlayer(Player):
                 print_with_color("Invalid choice.", Color.RED)
 
     def to_call_or_raise(self, game, diff):
+        legal = game.legal_actions(game.current_player_index)
         while True:
-            print(f'Choose the action: 1. Call ({diff}) 2. Raise 3. Fold')
-            choice = input(">")
+            print(f'Choose the action: 1. Call ({diff}) 2. Raise ({legal.min_raise}-{legal.max_raise}) 3. Fold')
+            choice = timed_input(">", self.deadline)
             if choice.isdigit():
                 choice = int(choice)
                 if 1 <= choice <= 3:
@@ -150,17 +367,17 @@ class HumanPlayer(Player):
                         # game.players_bet[game.current_player] += raise
                         # game.last_round_player = game.current_player
                         while True:
-                            choice = input("Amount: ")
+                            choice = timed_input("Amount: ", self.deadline)
                             if choice.isdigit():
                                 choice = int(choice)
-                                if choice < self.account.chips or choice < diff:
+                                if legal.min_raise <= choice <= legal.max_raise:
                                     if game.make_raise(self, choice):
                                         return
                                     else:
                                         print_with_color("Invalid Raise.", Color.RED)
                                 else:
                                     print_with_color(
-                                        "You don't have enough chips or the raise is less than call", Color.RED)
+                                        f"The raise must be between {legal.min_raise} and {legal.max_raise}", Color.RED)
                             else:
                                 print_with_color(
                                     "Invalid amount.", Color.RED)
@@ -175,9 +392,10 @@ class HumanPlayer(Player):
                 print_with_color("Invalid choice.", Color.RED)
 
     def to_check_raise(self, game):
+        legal = game.legal_actions(game.current_player_index)
         while True:
-            print(f'Choose the action: 1. Check  2. Bet 3. Fold')
-            choice = input(">")
+            print(f'Choose the action: 1. Check  2. Bet ({legal.min_raise}-{legal.max_raise}) 3. Fold')
+            choice = timed_input(">", self.deadline)
             if choice.isdigit():
                 choice = int(choice)
                 if 1 <= choice <= 3:
@@ -186,10 +404,10 @@ class HumanPlayer(Player):
                         break
                     elif choice == 2:
                         while True:
-                            choice = input("Amount: ")
+                            choice = timed_input("Amount: ", self.deadline)
                             if choice.isdigit():
                                 choice = int(choice)
-                                if choice < self.account.chips:
+                                if legal.min_raise <= choice <= legal.max_raise:
                                     if game.make_bet(self, choice):
                                         return
                                     else:
@@ -197,7 +415,7 @@ class HumanPlayer(Player):
                                             "Invalid Bet", Color.RED)
                                 else:
                                     print_with_color(
-                                        "You don't have enough chips", Color.RED)
+                                        f"The bet must be between {legal.min_raise} and {legal.max_raise}", Color.RED)
                             else:
                                 print_with_color(
                                     "Invalid amount.", Color.RED)
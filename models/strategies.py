@@ -0,0 +1,113 @@
+from models.player import ComputerPlayer
+from utils.color import Color, print_with_color
+from utils.instrumentation import LATENCY_BOUNDS, percentile
+from utils.rng import make_rng
+
+# The factory of every registered bot strategy, by name.
+STRATEGIES = {}
+
+
+def register_strategy(name):
+    """
+    Registers a bot strategy under a name, so settings can seat it.
+
+    Args:
+        name (str): The name of the strategy.
+
+    Returns:
+        function: A decorator registering a factory called with an Account and BotSettings, returning a Player.
+    """
+    def register(factory):
+        STRATEGIES[name] = factory
+        return factory
+    return register
+
+
+def create_bot(name, account, settings):
+    """
+    Creates a computer player with a registered strategy.
+
+    Args:
+        name (str): The name of the strategy.
+        account (Account): The player's account.
+        settings (BotSettings): The settings of the computer players.
+
+    Returns:
+        Player: The player, with its strategy name and latency budget set.
+
+    Raises:
+        ValueError: If no strategy is registered under the name.
+    """
+    factory = STRATEGIES.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown bot strategy {name!r}, expected one of: {', '.join(STRATEGIES)}")
+    player = factory(account, settings)
+    player.strategy = name
+    player.latency_budget = settings.latency_budget
+    return player
+
+
+def bot_rng(account, settings):
+    """
+    Returns the random stream of a computer player, derived from the session seed and the player's username,
+    so seeded sessions replay the same choices.
+
+    Args:
+        account (Account): The player's account.
+        settings (BotSettings): The settings of the computer players.
+
+    Returns:
+        random.Random: The generator of the stream, or the global random module for an unseeded session.
+    """
+    return make_rng(settings.seed, "bot", account.username)
+
+
+def display_strategy_stats(latencies, counters):
+    """
+    Displays how long the decisions of every strategy took and how many ran out of time and fell back to a
+    check or a fold.
+
+    Args:
+        latencies (dict): The bucket counts of the latency histograms, by name, as in a LATENCIES snapshot.
+        counters (dict): The instrumentation counters, by name.
+    """
+    for name, counts in sorted(latencies.items()):
+        if not name.startswith("strategy."):
+            continue
+        strategy = name[len("strategy."):]
+        p50, p95 = (percentile(counts, share) for share in (0.5, 0.95))
+        print(f"Strategy {strategy}: {sum(counts)} decisions, ", end="")
+        print_with_color(f"p50 {_format_bound(p50)}, p95 {_format_bound(p95)}", Color.GREEN, end="")
+        print(f", {counters.get(f'{name}.fallbacks', 0)} fallbacks")
+
+
+def _format_bound(seconds):
+    """
+    Formats the bound of a latency bucket.
+
+    Args:
+        seconds (float): The upper bound of the bucket, infinity for the last one.
+
+    Returns:
+        str: The bound in milliseconds.
+    """
+    if seconds == float("inf"):
+        return f"> {LATENCY_BOUNDS[-1] * 1000:g} ms"
+    return f"<= {seconds * 1000:g} ms"
+
+
+@register_strategy("default")
+def _default(account, settings):
+    return ComputerPlayer(account)
+
+
+@register_strategy("cfr")
+def _cfr(account, settings):
+    from solver.player import CFRPlayer
+    return CFRPlayer.load(account, settings.policy_path, settings.bucket_table, bot_rng(account, settings))
+
+
+@register_strategy("mcts")
+def _mcts(account, settings):
+    from solver.mcts import MCTSPlayer
+    return MCTSPlayer(account, budget=settings.search_budget, rng=bot_rng(account, settings))
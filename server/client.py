@@ -0,0 +1,244 @@
+import asyncio
+import sys
+import threading
+
+from server.protocol import encode_message, decode_message
+from utils.color import Color, print_with_color
+
+OPTION_NAMES = {
+    "all_in": "All-In",
+    "call": "Call",
+    "raise": "Raise",
+    "check": "Check",
+    "bet": "Bet",
+    "fold": "Fold",
+}
+
+
+class TableClient:
+    """
+    A command line client playing at a table server.
+
+    Attributes:
+        username (str): The username the client joins with.
+        reader (asyncio.StreamReader): The stream messages from the server are read from.
+        writer (asyncio.StreamWriter): The stream messages to the server are written to.
+        lines (asyncio.Queue): The lines entered by the user.
+        decision (asyncio.Task): The decision the user is currently taking, if any.
+        stale_input (bool): Whether a decision ran out of time, so lines typed since then are discarded.
+
+    Methods:
+        play(): Joins a table and plays until the server closes it.
+        start_input(): Starts reading user input in the background.
+        handle_message(message): Handles a single message from the server.
+        ask(prompt): Waits for a line of user input without blocking the event loop.
+        choose_action(message): Asks the user for an action and sends it to the server.
+    """
+
+    def __init__(self, username, reader, writer):
+        """
+        Initializes a TableClient instance.
+
+        Args:
+            username (str): The username the client joins with.
+            reader (asyncio.StreamReader): The stream messages from the server are read from.
+            writer (asyncio.StreamWriter): The stream messages to the server are written to.
+        """
+        self.username = username
+        self.reader = reader
+        self.writer = writer
+        self.lines = asyncio.Queue()
+        self.decision = None
+        self.stale_input = False
+
+    async def play(self):
+        """
+        Joins a table and plays until the server closes it.
+        """
+        self.start_input()
+        self.writer.write(encode_message({"type": "join", "username": self.username}))
+        await self.writer.drain()
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            if not await self.handle_message(decode_message(line)):
+                break
+        if self.decision is not None:
+            self.decision.cancel()
+        self.writer.close()
+
+    def start_input(self):
+        """
+        Starts reading user input on a daemon thread, so a decision can be abandoned when its time runs out
+        while server messages keep being handled.
+        """
+        loop = asyncio.get_running_loop()
+
+        def read_lines():
+            for line in sys.stdin:
+                loop.call_soon_threadsafe(self.lines.put_nowait, line.rstrip('\n'))
+
+        threading.Thread(target=read_lines, daemon=True).start()
+
+    async def handle_message(self, message):
+        """
+        Handles a single message from the server.
+
+        Args:
+            message (dict): The message to handle.
+
+        Returns:
+            bool: False once the server has closed the table, True otherwise.
+        """
+        message_type = message.get("type")
+        if message_type == "message":
+            print_with_color(message["text"], Color.MAGENTA)
+        elif message_type == "table":
+            print(5 * '\n')
+            print_with_color("Active Players", Color.GREEN)
+            print_with_color("==================================", Color.DARK_GRAY)
+            for player in message["players"]:
+                print_with_color(player["username"], Color.BRIGHT_MAGENTA)
+                print_with_color('\tChips: ', Color.WHITE, end='')
+                print_with_color(f'{player["chips"]}', Color.GREEN)
+            print_with_color("==================================", Color.DARK_GRAY)
+            print("Pot: ", end="")
+            print_with_color(f'{message["pot"]}', Color.GREEN)
+            if message["board"]:
+                print("Table:")
+                display_cards(message["board"])
+            print_with_color("Your Cards:", Color.YELLOW)
+            display_cards(message["hole_cards"])
+        elif message_type == "decision":
+            if self.decision is not None:
+                self.decision.cancel()
+            self.decision = asyncio.create_task(self.choose_action(message))
+        elif message_type == "timeout":
+            if self.decision is not None:
+                self.decision.cancel()
+                self.decision = None
+            self.stale_input = True
+            print()
+            print_with_color("You ran out of time.", Color.RED)
+        elif message_type == "showdown":
+            for username, cards in message["hands"].items():
+                print_with_color(username, Color.MAGENTA)
+                display_cards(cards)
+            for winner in message["winners"]:
+                print_with_color(winner, Color.MAGENTA, end="")
+                print(" won ", end="")
+                print_with_color(str(message["amount"]), Color.GREEN, end='')
+                print(" with ", end="")
+                print_with_color(message["combination"], Color.GREEN)
+            print_with_color("Game is over", Color.YELLOW)
+        elif message_type == "bye":
+            print_with_color(f'The table is closed. You leave with {message["chips"]} chips.', Color.YELLOW)
+            return False
+        return True
+
+    async def ask(self, prompt):
+        """
+        Waits for a line of user input without blocking the event loop.
+
+        Args:
+            prompt (str): The prompt to display.
+
+        Returns:
+            str: The line entered by the user.
+        """
+        print(prompt, end='', flush=True)
+        return await self.lines.get()
+
+    async def choose_action(self, message):
+        """
+        Asks the user for an action and sends it to the server.
+
+        Args:
+            message (dict): The decision request received from the server.
+        """
+        if self.stale_input:
+            # Lines typed since the last decision ran out of time were meant for that decision.
+            while not self.lines.empty():
+                self.lines.get_nowait()
+            self.stale_input = False
+        if message.get("error"):
+            print_with_color(message["error"], Color.RED)
+        options = message["options"]
+        names = []
+        for index, option in enumerate(options, start=1):
+            name = OPTION_NAMES[option]
+            if option == "call":
+                name += f' ({message["to_call"]})'
+            elif option == "all_in":
+                name += f' {message["chips"]}'
+            elif option in ("raise", "bet") and "max_raise" in message:
+                name += f' ({message["min_raise"]}-{message["max_raise"]})'
+            names.append(f'{index}. {name}')
+        while True:
+            print(f'Choose the action: {" ".join(names)}')
+            choice = await self.ask(">")
+            if choice.isdigit() and 1 <= int(choice) <= len(options):
+                break
+            print_with_color("Invalid choice.", Color.RED)
+
+        reply = {"type": "action", "decision": message["decision"], "action": options[int(choice) - 1]}
+        if reply["action"] in ("raise", "bet"):
+            while True:
+                amount = await self.ask("Amount: ")
+                if amount.isdigit():
+                    reply["amount"] = int(amount)
+                    break
+                print_with_color("Invalid amount.", Color.RED)
+        self.writer.write(encode_message(reply))
+        await self.writer.drain()
+        self.decision = None
+
+
+def display_cards(cards):
+    """
+    Displays the cards received from the server.
+
+    Args:
+        cards (list): The string representations of the cards.
+    """
+    if len(cards) == 0:
+        return
+    print((len(cards)) * "==== ")
+    for card in cards:
+        print(f'|{card}| ', end="")
+    print()
+    print((len(cards)) * "==== ")
+
+
+async def connect(username, host="127.0.0.1", port=7777, path=None):
+    """
+    Connects to a table server and plays until the table closes.
+
+    Args:
+        username (str): The username to join with.
+        host (str): The address of the server.
+        port (int): The port of the server.
+        path (str): The path of the server's Unix socket, used instead of TCP when given.
+    """
+    if path:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    await TableClient(username, reader, writer).play()
+
+
+def run_client(username, host="127.0.0.1", port=7777, path=None):
+    """
+    Runs the command line client until the table closes or the user interrupts it.
+
+    Args:
+        username (str): The username to join with.
+        host (str): The address of the server.
+        port (int): The port of the server.
+        path (str): The path of the server's Unix socket, used instead of TCP when given.
+    """
+    try:
+        asyncio.run(connect(username, host, port, path))
+    except KeyboardInterrupt:
+        pass
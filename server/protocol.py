@@ -0,0 +1,150 @@
+import asyncio
+import concurrent.futures
+import json
+import time
+
+from utils.timed_input import DecisionTimeout
+
+
+class PlayerConnection:
+    """
+    A connection to a remote player speaking the table protocol.
+
+    Every message is a JSON object on a single line. Clients send a "join" message followed by
+    "action" messages, the server sends "message", "table", "decision", "timeout", "showdown" and "bye" messages.
+    Every decision carries an id that the matching action echoes, so a reply arriving after its deadline is ignored.
+
+    Attributes:
+        reader (asyncio.StreamReader): The stream the player's messages are read from.
+        writer (asyncio.StreamWriter): The stream messages to the player are written to.
+        loop (asyncio.AbstractEventLoop): The event loop serving the connection.
+        closed (bool): Whether the player has disconnected.
+
+    Methods:
+        send(message): Sends a message to the player.
+        send_threadsafe(message): Sends a message to the player from a table thread.
+        receive(): Receives the next message from the player.
+        request(message): Sends a message and waits for the player's reply to it.
+        request_threadsafe(message, deadline): Sends a message from a table thread and blocks until the player
+            replies or the deadline passes.
+    """
+
+    def __init__(self, reader, writer):
+        """
+        Initializes a PlayerConnection instance.
+
+        Args:
+            reader (asyncio.StreamReader): The stream the player's messages are read from.
+            writer (asyncio.StreamWriter): The stream messages to the player are written to.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+
+    def send(self, message):
+        """
+        Sends a message to the player. Must be called from the event loop.
+
+        Args:
+            message (dict): The message to send.
+        """
+        if self.closed:
+            return
+        self.writer.write(encode_message(message))
+
+    def send_threadsafe(self, message):
+        """
+        Sends a message to the player from a table thread.
+
+        Args:
+            message (dict): The message to send.
+        """
+        self.loop.call_soon_threadsafe(self.send, message)
+
+    async def receive(self):
+        """
+        Receives the next message from the player.
+
+        Returns:
+            dict: The received message, or None if the player has disconnected.
+        """
+        try:
+            line = await self.reader.readline()
+        except ConnectionError:
+            line = b""
+        if not line:
+            self.closed = True
+            return None
+        return decode_message(line)
+
+    async def request(self, message):
+        """
+        Sends a message and waits for the player's reply to it. Replies to earlier messages are skipped.
+
+        Args:
+            message (dict): The message to send.
+
+        Returns:
+            dict: The player's reply, or None if the player has disconnected.
+        """
+        self.send(message)
+        await self.writer.drain()
+        while True:
+            reply = await self.receive()
+            if reply is None or reply.get("decision") == message.get("decision"):
+                return reply
+
+    def request_threadsafe(self, message, deadline=None):
+        """
+        Sends a message from a table thread and blocks the thread (never the event loop) until the player replies.
+
+        Args:
+            message (dict): The message to send.
+            deadline (float): The time.monotonic() value by which the player must reply, or None to wait forever.
+
+        Returns:
+            dict: The player's reply, or None if the player has disconnected.
+
+        Raises:
+            DecisionTimeout: If the deadline passes before the player replies.
+        """
+        if self.closed:
+            return None
+        future = asyncio.run_coroutine_threadsafe(self.request(message), self.loop)
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise DecisionTimeout()
+
+
+def encode_message(message):
+    """
+    Encodes a message as a single JSON line.
+
+    Args:
+        message (dict): The message to encode.
+
+    Returns:
+        bytes: The encoded message.
+    """
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+def decode_message(line):
+    """
+    Decodes a single JSON line into a message.
+
+    Args:
+        line (bytes): The line to decode.
+
+    Returns:
+        dict: The decoded message, or an empty dict if the line is not valid JSON.
+    """
+    try:
+        message = json.loads(line)
+    except ValueError:
+        return {}
+    return message if isinstance(message, dict) else {}
@@ -0,0 +1,370 @@
+import asyncio
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from game.game import TexasHoldemGame
+from game.table import Table
+from models.account import Account
+from models.deck import StandardDeck
+from models.player import Player, ComputerPlayer
+from server.protocol import PlayerConnection
+from settings import GameSettings
+from utils.TexasHoldemCombinations import HandStrength
+from utils.color import Color, print_with_color
+from utils.rng import make_rng
+from utils.timed_input import DecisionTimeout
+
+
+@dataclass
+class RemotePlayer(Player):
+    """
+      Represents a player connected to the table server over a socket.
+
+      Decisions are requested from the player's client; the table thread waits for the reply
+      while the event loop keeps serving every other table.
+
+      Inherits from:
+          Player
+    """
+    connection: PlayerConnection = field(default=None, repr=False)
+    decisions: int = field(default=0, repr=False)
+    interactive = True
+
+    def to_call_all_in(self, game):
+        self.play_remote(game, ["all_in", "fold"], 0)
+
+    def to_call_or_raise(self, game, diff):
+        self.play_remote(game, ["call", "raise", "fold"], diff)
+
+    def to_check_raise(self, game):
+        self.play_remote(game, ["check", "bet", "fold"], 0)
+
+    def play_remote(self, game, options, to_call):
+        """
+                Asks the remote client for an action until a valid one is received.
+
+                Args:
+                    game (TexasHoldemGame): The current Texas Hold'em game instance.
+                    options (list): The actions the player can choose from.
+                    to_call (int): The amount of chips needed to call.
+
+                A player who has disconnected folds. A player who runs out of time is told so
+                before the game takes the default action.
+        """
+        legal = game.legal_actions(game.current_player_index)
+        error = None
+        while True:
+            self.decisions += 1
+            try:
+                reply = self.connection.request_threadsafe({
+                    "type": "decision",
+                    "decision": self.decisions,
+                    "options": options,
+                    "to_call": to_call,
+                    "chips": self.account.chips,
+                    "min_raise": legal.min_raise,
+                    "max_raise": legal.max_raise,
+                    "error": error,
+                }, self.deadline)
+            except DecisionTimeout:
+                self.connection.send_threadsafe({"type": "timeout"})
+                raise
+            if reply is None:
+                game.make_fold(self)
+                return
+
+            action = reply.get("action")
+            amount = reply.get("amount")
+            if action not in options:
+                error = "Invalid choice."
+            elif action in ("call", "all_in"):
+                game.make_call(self)
+                return
+            elif action == "check":
+                game.make_check(self)
+                return
+            elif action == "fold":
+                game.make_fold(self)
+                return
+            elif not isinstance(amount, int):
+                error = "Invalid amount."
+            elif action == "raise":
+                if game.make_raise(self, amount):
+                    return
+                error = "Invalid Raise."
+            elif game.make_bet(self, amount):
+                return
+            else:
+                error = "Invalid Bet."
+
+
+class NetworkGame(TexasHoldemGame):
+    """
+        A Texas Hold'em game whose table view and announcements are sent to remote players.
+
+        Inherits from:
+            TexasHoldemGame
+    """
+
+    def broadcast(self, message):
+        """
+                Sends a message to every remote player at the table.
+
+                Args:
+                    message (dict): The message to send.
+        """
+        for player in self.players:
+            if isinstance(player, RemotePlayer):
+                player.connection.send_threadsafe(message)
+
+    def announce(self, message, color=Color.MAGENTA):
+        self.broadcast({"type": "message", "text": message})
+
+    def display_table(self):
+        players = [{"username": player.account.username, "chips": player.account.chips}
+                   for player in self.players if player.active]
+        for player in self.players:
+            if isinstance(player, RemotePlayer):
+                player.connection.send_threadsafe({
+                    "type": "table",
+                    "players": players,
+                    "pot": self.pot,
+                    "board": [repr(card) for card in self.community_cards],
+                    "hole_cards": [repr(card) for card in player.hole_cards],
+                })
+
+    def display_winners(self, winners, splitted_pot, score):
+        self.broadcast({
+            "type": "showdown",
+            "winners": [winner.account.username for winner in winners],
+            "amount": splitted_pot,
+            "combination": HandStrength.from_score(score).str,
+            "hands": {player.account.username: [repr(card) for card in player.hole_cards]
+                      for _, player in self.showdown_ranking} if len(self.showdown_ranking) > 1 else {},
+        })
+
+
+class RemoteTable(Table):
+    """
+    A table hosted by the table server. Hands are dealt until no connected remote player has chips left
+    or fewer than two players can continue.
+
+    Inherits from:
+        Table
+    """
+
+    def __init__(self, table_id):
+        """
+        Initializes a RemoteTable instance.
+
+        Args:
+            table_id (int): The identifier of the table on the server.
+        """
+        super().__init__()
+        self.table_id = table_id
+
+    def start_new_game(self, game_settings):
+        self.remove_busted_players(game_settings)
+        self.current_game = NetworkGame(game_settings, self.observers)
+        self.current_game.run()
+        self.games_played += 1
+
+    def check_input_new_game(self):
+        players = self.current_game.players
+        seated = [player for player in players if player.account.chips > 0]
+        humans = [player for player in seated if isinstance(player, RemotePlayer) and not player.connection.closed]
+        return len(seated) >= 2 and len(humans) > 0
+
+
+class TableServer:
+    """
+    An asyncio host running many tables at once for players connecting over a local TCP or Unix socket.
+
+    Every table runs on a worker thread, so bot decisions and hand evaluation never block the event loop,
+    which only moves messages between the tables and the connected players.
+
+    Attributes:
+        players_per_table (int): The number of seats at every table, filled up with computer players.
+        humans_per_table (int): The number of remote players seated together before a table starts.
+        chips_amount (int): The amount of chips every player starts with.
+        small_blind (int): The amount of the small blind at every table.
+        decision_timeout (float): The number of seconds a player has for each decision, or None for no limit.
+        seed (int): The session seed every table's seating and cards are derived from, or None for no seed.
+        executor (ThreadPoolExecutor): The executor running the tables.
+        tables (dict): The running tables by table id.
+        usernames (set): The usernames of the connected players.
+
+    Methods:
+        handle_client(reader, writer): Serves a single connected player.
+        unique_username(username): Returns a username no connected player or computer player uses.
+        seat(player): Seats a player at the next table and waits until that table closes.
+        run_table(table_id, humans): Runs a table until it closes.
+        serve_tcp(host, port): Serves players connecting over TCP.
+        serve_unix(path): Serves players connecting over a Unix socket.
+    """
+
+    def __init__(self, players_per_table=2, humans_per_table=1, chips_amount=100, small_blind=1, max_tables=32,
+                 decision_timeout=None, seed=None):
+        """
+        Initializes a TableServer instance.
+
+        Args:
+            players_per_table (int): The number of seats at every table.
+            humans_per_table (int): The number of remote players seated together before a table starts.
+            chips_amount (int): The amount of chips every player starts with.
+            small_blind (int): The amount of the small blind at every table.
+            max_tables (int): The maximum number of tables running at the same time.
+            decision_timeout (float): The number of seconds a player has for each decision, or None for no limit.
+            seed (int): The session seed every table's seating and cards are derived from, or None for no seed.
+        """
+        self.players_per_table = max(players_per_table, humans_per_table)
+        self.humans_per_table = humans_per_table
+        self.chips_amount = chips_amount
+        self.small_blind = small_blind
+        self.decision_timeout = decision_timeout
+        self.seed = seed
+        self.executor = ThreadPoolExecutor(max_workers=max_tables, thread_name_prefix="table")
+        self.tables = {}
+        self.table_ids = itertools.count(1)
+        self.lobby = []
+        self.lobby_table = None
+        self.usernames = set()
+
+    async def handle_client(self, reader, writer):
+        """
+        Serves a single connected player.
+
+        Args:
+            reader (asyncio.StreamReader): The stream the player's messages are read from.
+            writer (asyncio.StreamWriter): The stream messages to the player are written to.
+        """
+        connection = PlayerConnection(reader, writer)
+        join = await connection.receive()
+        if join and join.get("type") == "join" and join.get("username"):
+            username = self.unique_username(str(join["username"]))
+            self.usernames.add(username)
+            if username != join["username"]:
+                connection.send({"type": "message", "text": f"{join['username']} is taken, you play as {username}."})
+            player = RemotePlayer(Account(username=username, chips=self.chips_amount), connection=connection)
+            try:
+                await self.seat(player)
+            finally:
+                self.usernames.discard(username)
+                connection.send({"type": "bye", "chips": player.account.chips})
+        writer.close()
+
+    def unique_username(self, username):
+        """
+        Returns a username no connected player or computer player uses, since the games tell players apart by
+        username. A taken username gets the first free numbered suffix; the BOT- prefix is kept for computer
+        players.
+
+        Args:
+            username (str): The username the player joined with.
+
+        Returns:
+            str: The username or, if it is taken, a numbered variant of it.
+        """
+        if username.startswith("BOT-"):
+            username = "player"
+        candidate = username
+        suffix = 1
+        while candidate in self.usernames:
+            suffix += 1
+            candidate = f"{username}-{suffix}"
+        return candidate
+
+    async def seat(self, player):
+        """
+        Seats a player at the next table and waits until that table closes.
+
+        Args:
+            player (RemotePlayer): The player to seat.
+        """
+        loop = asyncio.get_running_loop()
+        if self.lobby_table is None:
+            self.lobby_table = loop.create_future()
+        lobby_table = self.lobby_table
+        self.lobby.append(player)
+
+        if len(self.lobby) == self.humans_per_table:
+            humans, self.lobby, self.lobby_table = self.lobby, [], None
+            table_id = next(self.table_ids)
+            lobby_table.set_result(loop.run_in_executor(self.executor, self.run_table, table_id, humans))
+        else:
+            player.connection.send({"type": "message", "text": "Waiting for more players..."})
+
+        await (await lobby_table)
+
+    def run_table(self, table_id, humans):
+        """
+        Runs a table until it closes. Executed on a worker thread.
+
+        Args:
+            table_id (int): The identifier of the table.
+            humans (list): The remote players seated at the table.
+        """
+        table = RemoteTable(table_id)
+        self.tables[table_id] = table
+        players = [ComputerPlayer(Account(username=f"BOT-{table_id}-{i}", chips=self.chips_amount))
+                   for i in range(self.players_per_table - len(humans))]
+        players.extend(humans)
+        make_rng(self.seed, "seating", table_id).shuffle(players)
+        game_settings = GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=self.small_blind,
+                                     big_blind=self.small_blind * 2, headless=True,
+                                     decision_timeout=self.decision_timeout, seed=self.seed, table_id=table_id)
+        try:
+            table.createTable(game_settings)
+        finally:
+            del self.tables[table_id]
+
+    async def serve_tcp(self, host, port):
+        """
+        Serves players connecting over TCP until cancelled.
+
+        Args:
+            host (str): The address to listen on.
+            port (int): The port to listen on.
+        """
+        server = await asyncio.start_server(self.handle_client, host, port)
+        print_with_color(f"Table server listening on {host}:{port}", Color.GREEN)
+        async with server:
+            await server.serve_forever()
+
+    async def serve_unix(self, path):
+        """
+        Serves players connecting over a Unix socket until cancelled.
+
+        Args:
+            path (str): The path of the socket.
+        """
+        server = await asyncio.start_unix_server(self.handle_client, path)
+        print_with_color(f"Table server listening on {path}", Color.GREEN)
+        async with server:
+            await server.serve_forever()
+
+
+def run_server(host="127.0.0.1", port=7777, path=None, players_per_table=2, humans_per_table=1,
+               decision_timeout=None, seed=None):
+    """
+    Runs a table server until interrupted.
+
+    Args:
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+        path (str): The path of a Unix socket to listen on instead of TCP.
+        players_per_table (int): The number of seats at every table.
+        humans_per_table (int): The number of remote players seated together before a table starts.
+        decision_timeout (float): The number of seconds a player has for each decision, or None for no limit.
+        seed (int): The session seed every table's seating and cards are derived from, or None for no seed.
+    """
+    server = TableServer(players_per_table=players_per_table, humans_per_table=humans_per_table,
+                         decision_timeout=decision_timeout, seed=seed)
+    try:
+        if path:
+            asyncio.run(server.serve_unix(path))
+        else:
+            asyncio.run(server.serve_tcp(host, port))
+    except KeyboardInterrupt:
+        pass
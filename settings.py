@@ -1,8 +1,101 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import Enum
 from models.deck import Deck
 from models.player import Player
 from utils.TexasHoldemStates import TexasHoldemState, Action
 
+class Pacing(Enum):
+    """
+    An enumeration representing how fast the interactive CLI moves on.
+
+    Attributes:
+        NORMAL: Pauses between streets and redraws the banner on every screen.
+        FAST: Short pauses and a banner rendered only once.
+        TURBO: No pauses or banner, and streets played only by computer players are shown at once.
+    """
+    NORMAL = {
+        "str": "normal",
+        "street_delay": 0.5,
+        "loading_delay": 0.1,
+        "redraw_banner": True,
+        "show_banner": True,
+    }
+    FAST = {
+        "str": "fast",
+        "street_delay": 0.15,
+        "loading_delay": 0.03,
+        "redraw_banner": False,
+        "show_banner": True,
+    }
+    TURBO = {
+        "str": "turbo",
+        "street_delay": 0,
+        "loading_delay": 0,
+        "redraw_banner": False,
+        "show_banner": False,
+    }
+
+    @property
+    def str(self):
+        """
+        Get the string representation of the pacing.
+
+        Returns:
+            str: The string representation of the pacing.
+        """
+        return self.value["str"]
+
+    @property
+    def street_delay(self):
+        """
+        Get the pause before every street, in seconds.
+
+        Returns:
+            float: The pause before every street.
+        """
+        return self.value["street_delay"]
+
+    @property
+    def loading_delay(self):
+        """
+        Get the pause between loading animation frames, in seconds.
+
+        Returns:
+            float: The pause between loading animation frames.
+        """
+        return self.value["loading_delay"]
+
+    @property
+    def redraw_banner(self):
+        """
+        Get whether the banner is rendered again and the screen cleared by scrolling on every screen.
+
+        Returns:
+            bool: True if the banner is rendered on every screen.
+        """
+        return self.value["redraw_banner"]
+
+    @property
+    def show_banner(self):
+        """
+        Get whether the banner is shown at all.
+
+        Returns:
+            bool: True if the banner is shown.
+        """
+        return self.value["show_banner"]
+
+    @property
+    def batch_bot_streets(self):
+        """
+        Get whether streets without a human player in the hand are played without being displayed.
+
+        Returns:
+            bool: True if streets only computer players take part in are batched.
+        """
+        return self == Pacing.TURBO
+
+
 @dataclass
 class GameSettings:
     """
@@ -14,9 +107,72 @@ class GameSettings:
         dealer (int): The index of the dealer player in the players list.
         small_blind (int): The amount of the small blind in the game.
         big_blind (int): The amount of the big blind in the game.
+        headless (bool): Whether games run without printing the table or pausing between rounds.
+        decision_timeout (float): The number of seconds a player has for each decision, or None for no limit.
+            A player who runs out of time checks if possible and folds otherwise.
+        pacing (Pacing): How fast the game moves on between streets.
+        seed (int): The session seed the deck is shuffled from, or None for unseeded shuffles.
+        table_id (int): The identifier of the table, naming its random stream.
+        hand_number (int): The number of hands dealt at the table before this one, naming the hand's shuffle.
     """
     players: list[Player]
     deck: Deck
     dealer: int
     small_blind: int
     big_blind: int
+    headless: bool = False
+    decision_timeout: float | None = None
+    pacing: Pacing = Pacing.NORMAL
+    seed: int | None = None
+    table_id: int = 0
+    hand_number: int = 0
+
+
+@dataclass
+class BotSettings:
+    """
+    A data class representing how the computer players of the interactive game are created.
+
+    Attributes:
+        strategies (list): The registered strategy of every computer seat, in turn when there are more seats.
+        latency_budget (float): The seconds every computer decision may take before the player checks or folds
+            instead, or None for no limit.
+        policy_path (str): The CFR policy file the "cfr" strategy plays.
+        bucket_table (BucketTable): The card-abstraction buckets the policy was trained with, if any.
+        search_budget (float): The seconds the "mcts" strategy searches every decision for.
+        seed (int): The session seed the random stream of every computer player is derived from, or None for
+            unseeded choices.
+    """
+    strategies: list[str] = field(default_factory=lambda: ["default"])
+    latency_budget: float | None = None
+    policy_path: str = "policy.cfr"
+    bucket_table: object = None
+    search_budget: float = 0.1
+    seed: int | None = None
+
+
+@dataclass
+class TournamentSettings:
+    """
+    A data class representing the settings for a multi-table tournament of computer players.
+
+    Attributes:
+        entrants (int): The number of players entering the tournament.
+        chips (int): The amount of chips every player starts with.
+        seats_per_table (int): The maximum number of players seated at a table.
+        blind_levels (list): The small blind of every level; the big blind is twice the small blind.
+        rounds_per_level (int): The number of scheduling rounds before the blinds go up to the next level.
+        hands_per_round (int): The number of hands every table plays in a scheduling round.
+        workers (int): The number of worker processes running tables, 0 to run every table in this process.
+        history_dir (str): The directory every table records its hand history in, or None to record nothing.
+        seed (int): The session seed seating and every table's cards are derived from, or None for no seed.
+    """
+    entrants: int
+    chips: int = 100
+    seats_per_table: int = 8
+    blind_levels: list[int] = field(default_factory=lambda: [1, 2, 3, 5, 10, 15, 25, 50, 100, 200])
+    rounds_per_level: int = 2
+    hands_per_round: int = 5
+    workers: int = 0
+    history_dir: str | None = None
+    seed: int | None = None
@@ -0,0 +1,140 @@
+import math
+from dataclasses import dataclass
+
+from utils.TexasHoldemCombinations import HandChecker, HandStrength, SCORE_CATEGORY_SHIFT
+
+# The number of buckets the hands of every street are grouped into.
+BUCKETS = 8
+
+# The buckets of the made hands after the flop, indexed by the HandStrength value of the hand.
+_POSTFLOP_BUCKET = [0, 1, 3, 4, 5, 6, 7, 7, 7]
+_TOP_PAIR_BUCKET = 2
+
+
+def chen_score(first, second):
+    """
+    Scores a starting hand with the Chen formula.
+
+    Args:
+        first (int): The card index of the first hole card (see Card.index).
+        second (int): The card index of the second hole card.
+
+    Returns:
+        int: The score, from -1 (7-2 offsuit) to 20 (a pair of aces).
+    """
+    high, low = sorted((first % 13 + 2, second % 13 + 2), reverse=True)
+    points = {14: 10, 13: 8, 12: 7, 11: 6}.get(high, high / 2)
+    if high == low:
+        return math.ceil(max(points * 2, 5))
+    if first // 13 == second // 13:
+        points += 2
+    gap = high - low - 1
+    points -= (0, 1, 2, 4)[gap] if gap < 4 else 5
+    if gap <= 1 and high < 12:
+        points += 1
+    return math.ceil(points)
+
+
+def preflop_bucket(hole_cards):
+    """
+    Returns the bucket of a starting hand, from its Chen score.
+
+    Args:
+        hole_cards: The card indexes of the hole cards.
+
+    Returns:
+        int: The bucket, from 0 (weakest) to BUCKETS - 1.
+    """
+    return (chen_score(*hole_cards) + 1) * BUCKETS // 22
+
+
+def postflop_bucket(hole_cards, board):
+    """
+    Returns the bucket of a hand after the flop, from the made hand it forms with the board: high card,
+    a pair below the top board card, top pair or an overpair, two pair, three of a kind, a straight,
+    a flush and a full house or better. A hand the hole cards do not improve over the board counts as
+    high card.
+
+    Args:
+        hole_cards: The card indexes of the hole cards.
+        board: The card indexes of the community cards.
+
+    Returns:
+        int: The bucket, from 0 (weakest) to BUCKETS - 1.
+    """
+    score = HandChecker.score_indexes(list(hole_cards) + list(board))
+    category = score >> SCORE_CATEGORY_SHIFT
+    if category <= HandStrength.TWO_PAIR.int:
+        if HandChecker.score_indexes(board) >> SCORE_CATEGORY_SHIFT == category:
+            return 0
+        if category == HandStrength.PAIR.int and (score >> 16) & 0xF >= max(card % 13 for card in board) + 2:
+            return _TOP_PAIR_BUCKET
+    return _POSTFLOP_BUCKET[category]
+
+
+def hand_bucket(hole_cards, board):
+    """
+    Returns the bucket of a hand on any street.
+
+    Args:
+        hole_cards: The card indexes of the hole cards.
+        board: The card indexes of the community cards dealt so far.
+
+    Returns:
+        int: The bucket, from 0 (weakest) to BUCKETS - 1.
+    """
+    if not board:
+        return preflop_bucket(hole_cards)
+    return postflop_bucket(hole_cards, board)
+
+
+@dataclass(frozen=True)
+class AbstractGame:
+    """
+    The abstracted heads-up game the solver is trained on.
+
+    The betting follows TexasHoldemGame heads-up: the dealer posts the big blind, the other player posts the
+    small blind and acts first on every street. Every raise puts in the amount to call plus raise_size, at most
+    max_raises times per street, and the cards are only known through their bucket. An information set is the
+    street, the seat (0 for the dealer), the raises made in the street, whether there is a bet to call and
+    the bucket of the player's hand; information sets are numbered so that they index flat arrays.
+
+    Attributes:
+        chips (int): The chips both players start the hand with.
+        small_blind (int): The small blind; the big blind is twice the small blind.
+        raise_size (int): The chips a raise puts in on top of the amount to call.
+        max_raises (int): The number of raises allowed per street.
+        buckets (int): The number of hand buckets on every street.
+
+    Methods:
+        infoset_count: The number of information sets.
+        infoset(street, seat, raises, facing, bucket): Returns the index of an information set.
+    """
+    chips: int = 100
+    small_blind: int = 1
+    raise_size: int = 5
+    max_raises: int = 3
+    buckets: int = BUCKETS
+
+    @property
+    def infoset_count(self):
+        """
+        The number of information sets.
+        """
+        return 4 * 2 * (self.max_raises + 1) * 2 * self.buckets
+
+    def infoset(self, street, seat, raises, facing, bucket):
+        """
+        Returns the index of an information set.
+
+        Args:
+            street (int): The street, 0 for preflop to 3 for the river.
+            seat (int): 0 for the dealer, 1 for the player acting first.
+            raises (int): The raises made in the street, at most max_raises.
+            facing (bool): Whether the player has a bet to call.
+            bucket (int): The bucket of the player's hand.
+
+        Returns:
+            int: The index.
+        """
+        return (((street * 2 + seat) * (self.max_raises + 1) + raises) * 2 + facing) * self.buckets + bucket
@@ -0,0 +1,339 @@
+import os
+import random
+import zlib
+
+import numpy as np
+
+from utils.TexasHoldemCombinations import HandChecker, HandStrength, SCORE_CATEGORY_SHIFT
+from utils.rng import derive_seed
+
+# Situations are grouped by a canonical key before being clustered. Preflop, the key is one of the 169
+# starting hands: pairs on the diagonal of a 13 x 13 grid, suited hands above it and offsuit hands below it.
+# After the flop, the key is a mixed-radix number made of the features below, so every key in
+# [0, POSTFLOP_KEYS) stands for exactly one combination of features.
+PREFLOP_KEYS = 169
+MADE_HANDS = 10  # nothing, bottom pair, middle pair, top pair with a weak kicker, top pair with a good kicker
+# or an overpair, two pair, three of a kind, straight, flush, full house or better
+FLUSH_DRAWS = 2  # none, four to a flush with a hole card
+STRAIGHT_DRAWS = 3  # none, one rank completes a straight, two ranks or more do
+OVERCARDS = 3  # hole cards above the top board card
+BOARD_FLUSHES = 2  # whether three board cards share a suit
+BOARD_PAIRS = 2  # whether the board is paired
+POSTFLOP_KEYS = MADE_HANDS * FLUSH_DRAWS * STRAIGHT_DRAWS * OVERCARDS * BOARD_FLUSHES * BOARD_PAIRS
+
+# The cards the next street deals, by the number of community cards.
+_NEXT_STREET = {0: 3, 3: 1, 4: 1, 5: 0}
+_STREET_NAMES = ("preflop", "flop", "turn", "river")
+_STREET_OF_BOARD = {0: 0, 3: 1, 4: 2, 5: 3}
+# Rank masks of the five-card straights, the wheel included; bit r stands for rank r + 2.
+_STRAIGHTS = [0b11111 << low for low in range(9)] + [(1 << 12) | 0b1111]
+
+
+def preflop_key(hole_cards):
+    """
+    Returns the canonical key of a starting hand.
+
+    Args:
+        hole_cards: The card indexes of the hole cards (see Card.index).
+
+    Returns:
+        int: The key, in [0, PREFLOP_KEYS).
+    """
+    first, second = hole_cards
+    high, low = max(first % 13, second % 13), min(first % 13, second % 13)
+    if first // 13 == second // 13:
+        return low * 13 + high
+    return high * 13 + low
+
+
+def _completes_straight(mask):
+    return any(mask & straight == straight for straight in _STRAIGHTS)
+
+
+def postflop_key(hole_cards, board):
+    """
+    Returns the canonical key of a hand after the flop, from features read off the cards with bit operations
+    and one hand score.
+
+    Args:
+        hole_cards: The card indexes of the hole cards.
+        board: The card indexes of the three to five community cards.
+
+    Returns:
+        int: The key, in [0, POSTFLOP_KEYS).
+    """
+    cards = list(hole_cards) + list(board)
+    score = HandChecker.score_indexes(cards)
+    category = score >> SCORE_CATEGORY_SHIFT
+    board_ranks = sorted((card % 13 + 2 for card in board), reverse=True)
+    hole_ranks = [card % 13 + 2 for card in hole_cards]
+
+    if category <= HandStrength.THREE_OF_A_KIND.int and \
+            HandChecker.score_indexes(board) >> SCORE_CATEGORY_SHIFT == category:
+        made = 0
+    elif category == HandStrength.PAIR.int:
+        pair = (score >> 16) & 0xF
+        if pair > board_ranks[0]:
+            made = 4
+        elif pair == board_ranks[0]:
+            made = 4 if max(rank for rank in hole_ranks if rank != pair) >= 10 else 3
+        else:
+            made = 2 if pair >= board_ranks[1] else 1
+    else:
+        made = (0, 0, 5, 6, 7, 8, 9, 9, 9)[category]
+
+    suit_counts = [0, 0, 0, 0]
+    for card in cards:
+        suit_counts[card // 13] += 1
+    rank_mask = 0
+    for card in cards:
+        rank_mask |= 1 << (card % 13)
+    drawing = len(board) < 5
+    flush_draw = int(drawing and category < HandStrength.FLUSH.int and
+                     any(suit_counts[card // 13] == 4 for card in hole_cards))
+    straight_draw = 0
+    if drawing and category < HandStrength.STRAIGHT.int:
+        completing = sum(1 for rank in range(13) if not rank_mask & (1 << rank) and
+                         _completes_straight(rank_mask | (1 << rank)))
+        straight_draw = min(completing, 2)
+    overcards = sum(1 for rank in hole_ranks if rank > board_ranks[0])
+    board_suits = [0, 0, 0, 0]
+    for card in board:
+        board_suits[card // 13] += 1
+    board_flush = int(max(board_suits) >= 3)
+    board_pair = int(len(set(board_ranks)) < len(board_ranks))
+
+    key = made
+    for value, radix in ((flush_draw, FLUSH_DRAWS), (straight_draw, STRAIGHT_DRAWS), (overcards, OVERCARDS),
+                         (board_flush, BOARD_FLUSHES), (board_pair, BOARD_PAIRS)):
+        key = key * radix + value
+    return key
+
+
+def situation_key(hole_cards, board):
+    """
+    Returns the canonical key of a hand on any street.
+
+    Args:
+        hole_cards: The card indexes of the hole cards.
+        board: The card indexes of the community cards dealt so far.
+
+    Returns:
+        int: The key.
+    """
+    if not board:
+        return preflop_key(hole_cards)
+    return postflop_key(hole_cards, board)
+
+
+def equity_histogram(hole_cards, board, rng, runouts=8, opponents=8, bins=10):
+    """
+    Estimates the distribution of a hand's equity against a random hand over the cards of the next street.
+
+    Args:
+        hole_cards: The card indexes of the hole cards.
+        board: The card indexes of the community cards dealt so far.
+        rng (random.Random): The random number generator.
+        runouts (int): The number of next streets dealt; a single one on the river.
+        opponents (int): The number of opponent hands and boards every equity is estimated from.
+        bins (int): The number of equity bins.
+
+    Returns:
+        np.ndarray: The share of the runouts falling in every equity bin.
+    """
+    score = HandChecker.score_indexes
+    dealt = set(hole_cards) | set(board)
+    unseen = [card for card in range(52) if card not in dealt]
+    next_cards = _NEXT_STREET[len(board)]
+    histogram = np.zeros(bins)
+    for _ in range(runouts if next_cards else 1):
+        runout = list(board) + rng.sample(unseen, next_cards)
+        remaining = [card for card in unseen if card not in runout]
+        equity = 0.0
+        for _ in range(opponents):
+            cards = rng.sample(remaining, 2 + 5 - len(runout))
+            final_board = runout + cards[2:]
+            ours, theirs = score(list(hole_cards) + final_board), score(cards[:2] + final_board)
+            equity += 1.0 if ours > theirs else 0.5 if ours == theirs else 0.0
+        histogram[min(int(equity / opponents * bins), bins - 1)] += 1
+    return histogram / histogram.sum()
+
+
+def cluster(histograms, weights, buckets, iterations=50):
+    """
+    Clusters equity histograms with weighted k-means on their cumulative distributions, which compares them
+    like the earth mover's distance does.
+
+    Args:
+        histograms (np.ndarray): (N, bins) histograms.
+        weights (np.ndarray): (N,) the weight of every histogram.
+        buckets (int): The number of clusters.
+        iterations (int): The number of k-means iterations.
+
+    Returns:
+        np.ndarray: (N,) the cluster of every histogram, numbered by increasing mean equity.
+    """
+    points = np.cumsum(histograms, axis=1)
+    means = histograms @ ((np.arange(histograms.shape[1]) + 0.5) / histograms.shape[1])
+    order = np.argsort(means)
+    # Start from histograms spread evenly over the range of mean equities.
+    centroids = points[order[np.linspace(0, len(order) - 1, buckets).astype(int)]]
+    for _ in range(iterations):
+        distances = ((points[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+        labels = distances.argmin(axis=1)
+        for label in range(buckets):
+            members = labels == label
+            if members.any():
+                centroids[label] = np.average(points[members], axis=0, weights=weights[members])
+    labels = ((points[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+    # A lower cumulative distribution means more equity.
+    ranks = np.argsort(np.argsort(-centroids.sum(axis=1)))
+    return ranks[labels]
+
+
+class BucketTable:
+    """
+    The bucket of every canonical situation of every street, precomputed offline by build.
+
+    A lookup computes the canonical key of the cards and reads one byte, so no equity is estimated in play.
+
+    Attributes:
+        buckets (int): The number of buckets on every street.
+        tables (list): The uint8 bucket of every key of the preflop, flop, turn and river.
+
+    Methods:
+        build(buckets, samples, seed): Computes the buckets of every street.
+        load(path): Loads a bucket table.
+        save(path): Saves the bucket table.
+        bucket(hole_cards, board): Returns the bucket of a hand.
+        digest(): Returns a checksum of the buckets.
+    """
+
+    def __init__(self, buckets, tables):
+        """
+        Initializes a BucketTable instance.
+
+        Args:
+            buckets (int): The number of buckets on every street.
+            tables (list): The uint8 bucket of every key of the preflop, flop, turn and river.
+        """
+        self.buckets = buckets
+        self.tables = tables
+
+    @staticmethod
+    def build(buckets=8, samples=5000, seed=None, runouts=8, opponents=8):
+        """
+        Computes the buckets of every street. Preflop, the equity histogram of every starting hand is
+        estimated samples / PREFLOP_KEYS times; after the flop, random deals are grouped by key and their
+        histograms averaged. The histograms are then clustered into buckets. Keys no deal fell on take the
+        bucket of the sampled key with the same made hand seen most often.
+
+        Args:
+            buckets (int): The number of buckets on every street.
+            samples (int): The number of deals sampled on every street after the flop.
+            seed (int): The seed of the deals, or None for unseeded deals.
+            runouts (int): The next streets dealt for every equity histogram.
+            opponents (int): The opponent hands every equity is estimated from.
+
+        Returns:
+            BucketTable: The table.
+        """
+        tables = []
+        for street, name in enumerate(_STREET_NAMES):
+            rng = random.Random(None if seed is None else derive_seed(seed, "buckets", name))
+            if street == 0:
+                hands = [((high, low + 13) if high != low else (high, high + 13)) for high in range(13)
+                         for low in range(high + 1)] + [(high, low) for high in range(13) for low in range(high)]
+                deals = hands * max(samples // PREFLOP_KEYS, 1)
+                key_count = PREFLOP_KEYS
+            else:
+                board_size = (3, 4, 5)[street - 1]
+                deals = []
+                for _ in range(samples):
+                    cards = rng.sample(range(52), 2 + board_size)
+                    deals.append((cards[:2], cards[2:]))
+                key_count = POSTFLOP_KEYS
+            sums = np.zeros((key_count, 10))
+            counts = np.zeros(key_count)
+            for deal in deals:
+                hole_cards, board = (deal, []) if street == 0 else deal
+                key = situation_key(hole_cards, board)
+                sums[key] += equity_histogram(hole_cards, board, rng, runouts, opponents)
+                counts[key] += 1
+            seen = np.flatnonzero(counts)
+            labels = cluster(sums[seen] / counts[seen, None], counts[seen], min(buckets, len(seen)))
+            table = np.zeros(key_count, dtype=np.uint8)
+            table[seen] = labels
+            if street > 0:
+                BucketTable.fill_unseen(table, counts)
+            tables.append(table)
+        return BucketTable(buckets, tables)
+
+    @staticmethod
+    def fill_unseen(table, counts):
+        """
+        Gives every key no deal fell on the bucket of the most sampled key with the same made hand.
+
+        Args:
+            table (np.ndarray): The bucket of every postflop key, filled in place.
+            counts (np.ndarray): The number of deals of every key.
+        """
+        per_made_hand = POSTFLOP_KEYS // MADE_HANDS
+        fallback = 0
+        for made in range(MADE_HANDS):
+            keys = slice(made * per_made_hand, (made + 1) * per_made_hand)
+            made_counts = counts[keys]
+            if made_counts.any():
+                fallback = table[keys][made_counts.argmax()]
+            table[keys][made_counts == 0] = fallback
+
+    @staticmethod
+    def load(path):
+        """
+        Loads a bucket table.
+
+        Args:
+            path (str): The path of the table.
+
+        Returns:
+            BucketTable: The table.
+        """
+        with np.load(path) as saved:
+            return BucketTable(int(saved["buckets"]), [saved[name] for name in _STREET_NAMES])
+
+    def save(self, path):
+        """
+        Saves the bucket table, replacing the previous file only once the new one is complete.
+
+        Args:
+            path (str): The path of the table.
+        """
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            np.savez(file, buckets=np.int64(self.buckets), **dict(zip(_STREET_NAMES, self.tables)))
+        os.replace(temporary, path)
+
+    def bucket(self, hole_cards, board):
+        """
+        Returns the bucket of a hand in constant time.
+
+        Args:
+            hole_cards: The card indexes of the hole cards.
+            board: The card indexes of the community cards dealt so far.
+
+        Returns:
+            int: The bucket, from 0 (weakest) to buckets - 1.
+        """
+        return int(self.tables[_STREET_OF_BOARD[len(board)]][situation_key(hole_cards, board)])
+
+    def digest(self):
+        """
+        Returns a checksum of the buckets, recorded in the policies trained with the table.
+
+        Returns:
+            int: The CRC-32 of the buckets of every street.
+        """
+        digest = zlib.crc32(self.buckets.to_bytes(2, "little"))
+        for table in self.tables:
+            digest = zlib.crc32(np.ascontiguousarray(table, dtype=np.uint8).tobytes(), digest)
+        return digest
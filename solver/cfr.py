@@ -0,0 +1,273 @@
+import os
+import random
+import time
+
+import numpy as np
+
+from env.holdem_env import FOLD, CALL, RAISE, ACTION_COUNT
+from solver.abstraction import AbstractGame, hand_bucket
+from solver.policy import write_policy
+from utils.TexasHoldemCombinations import HandChecker
+from utils.rng import derive_seed
+
+# The number of community cards visible on every street.
+_BOARD_SIZE = (0, 3, 4, 5)
+_RIVER = 3
+
+
+class CFRTrainer:
+    """
+    Trains a strategy for the abstracted heads-up game with external-sampling Monte Carlo counterfactual
+    regret minimization.
+
+    Every iteration deals one hand and walks the betting tree for one of the seats, in turn: every action of
+    that seat is explored, and the opponent and the cards are sampled. Regrets and strategy sums are kept in
+    flat arrays indexed by information set. The cards of iteration i are drawn from a stream derived from the
+    seed and i, so a run resumed from a checkpoint deals the same hands as an uninterrupted one.
+
+    Attributes:
+        game (AbstractGame): The abstracted game.
+        seed (int): The seed the hands are dealt from, or None for unseeded hands.
+        bucket_table (BucketTable): The precomputed buckets of the hands, or None for the buckets of
+            solver.abstraction.
+        regrets (np.ndarray): (infoset_count, ACTION_COUNT) float64 cumulative regrets, floored at zero.
+        strategy_sums (np.ndarray): (infoset_count, ACTION_COUNT) float64 sums of the strategies played.
+        iterations (int): The number of iterations trained.
+
+    Methods:
+        train(iterations, checkpoint, checkpoint_every): Runs training iterations.
+        iterate(): Runs one training iteration.
+        legal_actions(seat, raises, bets): Returns the actions a seat can take.
+        traverse(traverser, street, seat, raises, acted, bets): Walks the betting tree below a decision.
+        play(traverser, street, seat, raises, acted, bets, action): Applies an action and walks the tree below it.
+        strategy(infoset, legal): Returns the current strategy at an information set.
+        average_strategy(): Returns the average strategy, which converges to the solution.
+        save_checkpoint(path): Saves the training state.
+        from_checkpoint(path, seed, bucket_table): Resumes training from a checkpoint.
+        export_policy(path): Writes the average strategy as a compact policy file.
+    """
+
+    def __init__(self, game=AbstractGame(), seed=None, bucket_table=None):
+        """
+        Initializes a CFRTrainer instance with no iterations trained.
+
+        Args:
+            game (AbstractGame): The abstracted game.
+            seed (int): The seed the hands are dealt from, or None for unseeded hands.
+            bucket_table (BucketTable): The precomputed buckets of the hands, or None for the Chen score and
+                made-hand buckets of solver.abstraction.
+        """
+        if bucket_table is not None and bucket_table.buckets != game.buckets:
+            raise ValueError(f"The bucket table has {bucket_table.buckets} buckets, the game {game.buckets}.")
+        self.game = game
+        self.seed = seed
+        self.bucket_table = bucket_table
+        self.bucket = hand_bucket if bucket_table is None else bucket_table.bucket
+        self.regrets = np.zeros((game.infoset_count, ACTION_COUNT))
+        self.strategy_sums = np.zeros((game.infoset_count, ACTION_COUNT))
+        self.iterations = 0
+        self.rng = random
+        self.hand_buckets = None
+        self.winner = None
+
+    def train(self, iterations, checkpoint=None, checkpoint_every=10000):
+        """
+        Runs training iterations, saving a checkpoint regularly and at the end.
+
+        Args:
+            iterations (int): The number of iterations to run.
+            checkpoint (str): The path of the checkpoint, or None to save none.
+            checkpoint_every (int): The number of iterations between checkpoints.
+
+        Returns:
+            float: The iterations run per second.
+        """
+        begin = time.perf_counter()
+        for _ in range(iterations):
+            self.iterate()
+            if checkpoint is not None and self.iterations % checkpoint_every == 0:
+                self.save_checkpoint(checkpoint)
+        if checkpoint is not None:
+            self.save_checkpoint(checkpoint)
+        elapsed = time.perf_counter() - begin
+        return iterations / elapsed if elapsed else 0.0
+
+    def iterate(self):
+        """
+        Runs one training iteration: deals a hand and walks the betting tree for the seat whose turn it is.
+        """
+        if self.seed is not None:
+            self.rng = random.Random(derive_seed(self.seed, "cfr", self.iterations))
+        deck = self.rng.sample(range(52), 9)
+        holes = (deck[0:2], deck[2:4])
+        board = deck[4:9]
+        self.hand_buckets = [[self.bucket(hole, board[:size]) for size in _BOARD_SIZE] for hole in holes]
+        scores = [HandChecker.score_indexes(hole + board) for hole in holes]
+        self.winner = 0 if scores[0] > scores[1] else 1 if scores[1] > scores[0] else None
+
+        small_blind = self.game.small_blind
+        self.traverse(self.iterations % 2, 0, 1, 0, 0, [small_blind * 2, small_blind])
+        self.iterations += 1
+
+    def legal_actions(self, seat, raises, bets):
+        """
+        Returns the actions a seat can take.
+
+        Args:
+            seat (int): The seat to act.
+            raises (int): The raises made in the street.
+            bets (list): The chips both seats have put in the hand.
+
+        Returns:
+            list: The legal actions among FOLD, CALL and RAISE.
+        """
+        to_call = bets[1 - seat] - bets[seat]
+        legal = [FOLD, CALL] if to_call > 0 else [CALL]
+        if raises < self.game.max_raises and self.game.chips - bets[seat] > to_call:
+            legal.append(RAISE)
+        return legal
+
+    def strategy(self, infoset, legal):
+        """
+        Returns the current strategy at an information set, by regret matching over the legal actions.
+
+        Args:
+            infoset (int): The index of the information set.
+            legal (list): The legal actions.
+
+        Returns:
+            list: The probability of every legal action, in the same order.
+        """
+        regrets = self.regrets[infoset].tolist()
+        positive = [regrets[action] for action in legal]
+        total = sum(positive)
+        if total <= 0:
+            return [1 / len(legal)] * len(legal)
+        return [regret / total for regret in positive]
+
+    def traverse(self, traverser, street, seat, raises, acted, bets):
+        """
+        Walks the betting tree below a decision and updates the regrets of the traverser.
+
+        Args:
+            traverser (int): The seat whose regrets are updated.
+            street (int): The street, 0 for preflop to 3 for the river.
+            seat (int): The seat to act.
+            raises (int): The raises made in the street.
+            acted (int): The actions taken in the street since the last raise.
+            bets (list): The chips both seats have put in the hand.
+
+        Returns:
+            float: The chips the traverser wins or loses from this decision on.
+        """
+        game = self.game
+        other = 1 - seat
+        to_call = bets[other] - bets[seat]
+        legal = self.legal_actions(seat, raises, bets)
+        infoset = game.infoset(street, seat, raises, to_call > 0, self.hand_buckets[seat][street])
+        strategy = self.strategy(infoset, legal)
+
+        if seat != traverser:
+            self.strategy_sums[infoset, legal] += strategy
+            action = self.rng.choices(legal, strategy)[0]
+            return self.play(traverser, street, seat, raises, acted, bets, action)
+
+        values = [self.play(traverser, street, seat, raises, acted, bets, action) for action in legal]
+        value = sum(probability * action_value for probability, action_value in zip(strategy, values))
+        row = self.regrets[infoset]
+        for action, action_value in zip(legal, values):
+            row[action] = max(row[action] + action_value - value, 0.0)
+        return value
+
+    def play(self, traverser, street, seat, raises, acted, bets, action):
+        """
+        Applies an action and walks the tree below it.
+
+        Args:
+            traverser (int): The seat whose regrets are updated.
+            street (int): The street, 0 for preflop to 3 for the river.
+            seat (int): The seat taking the action.
+            raises (int): The raises made in the street.
+            acted (int): The actions taken in the street since the last raise.
+            bets (list): The chips both seats have put in the hand.
+            action (int): FOLD, CALL or RAISE.
+
+        Returns:
+            float: The chips the traverser wins or loses from this action on.
+        """
+        other = 1 - seat
+        if action == FOLD:
+            return -bets[traverser] if seat == traverser else bets[1 - traverser]
+        to_call = bets[other] - bets[seat]
+        stack = self.game.chips - bets[seat]
+        bets = bets[:]
+        if action == RAISE:
+            bets[seat] += min(to_call + self.game.raise_size, stack)
+            return self.traverse(traverser, street, other, raises + 1, 1, bets)
+        bets[seat] += min(to_call, stack)
+        if acted + 1 < 2:
+            return self.traverse(traverser, street, other, raises, acted + 1, bets)
+        # Chips of the bigger bet that a short all-in could not match go back to their owner.
+        bets[0] = bets[1] = min(bets)
+        if street == _RIVER or bets[0] == self.game.chips:
+            if self.winner is None:
+                return 0.0
+            return bets[0] if self.winner == traverser else -bets[0]
+        return self.traverse(traverser, street + 1, 1, 0, 0, bets)
+
+    def average_strategy(self):
+        """
+        Returns the average strategy, which converges to the solution of the abstracted game.
+        Information sets never reached play every action with the same probability.
+
+        Returns:
+            np.ndarray: (infoset_count, ACTION_COUNT) probabilities.
+        """
+        totals = self.strategy_sums.sum(axis=1, keepdims=True)
+        uniform = np.full_like(self.strategy_sums, 1 / ACTION_COUNT)
+        return np.divide(self.strategy_sums, totals, out=uniform, where=totals > 0)
+
+    def save_checkpoint(self, path):
+        """
+        Saves the training state, replacing the previous checkpoint only once the new one is complete.
+
+        Args:
+            path (str): The path of the checkpoint.
+        """
+        game = self.game
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            np.savez(file, regrets=self.regrets, strategy_sums=self.strategy_sums,
+                     iterations=np.int64(self.iterations),
+                     game=np.array([game.chips, game.small_blind, game.raise_size, game.max_raises, game.buckets]))
+        os.replace(temporary, path)
+
+    @staticmethod
+    def from_checkpoint(path, seed=None, bucket_table=None):
+        """
+        Resumes training from a checkpoint.
+
+        Args:
+            path (str): The path of the checkpoint.
+            seed (int): The seed the training was started with.
+            bucket_table (BucketTable): The bucket table the training was started with, if any.
+
+        Returns:
+            CFRTrainer: The trainer, in the saved state.
+        """
+        with np.load(path) as checkpoint:
+            trainer = CFRTrainer(AbstractGame(*checkpoint["game"].tolist()), seed, bucket_table)
+            trainer.regrets[:] = checkpoint["regrets"]
+            trainer.strategy_sums[:] = checkpoint["strategy_sums"]
+            trainer.iterations = int(checkpoint["iterations"])
+        return trainer
+
+    def export_policy(self, path):
+        """
+        Writes the average strategy as a compact policy file, to be played by CFRPlayer with the same bucket
+        table.
+
+        Args:
+            path (str): The path of the policy file.
+        """
+        write_policy(path, self.game, self.average_strategy(), self.bucket_table)
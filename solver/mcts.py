@@ -0,0 +1,410 @@
+import math
+import random
+import time
+from dataclasses import dataclass, field
+
+from env.holdem_env import FOLD, CALL, RAISE
+from models.player import Player
+from utils.TexasHoldemCombinations import HandChecker
+from utils.TexasHoldemStates import Action
+from utils.instrumentation import COUNTERS
+
+# The search action every logged game action counts as.
+_SEARCH_ACTION = {Action.FOLD: FOLD, Action.CHECK: CALL, Action.CALL: CALL, Action.BET: RAISE, Action.RAISE: RAISE}
+_RIVER = 3
+
+
+class SearchState:
+    """
+    A compact copy of a TexasHoldemGame that rollouts can play quickly, with cards as card indexes.
+
+    The betting follows TexasHoldemGame: a street ends once the player who acted last before the latest raise
+    has acted, and the pot is split between the best hands at showdown. A raise puts in the amount to call
+    plus a fixed raise size.
+
+    Attributes:
+        stacks (list): The chips behind of every seat.
+        bets (list): The chips every seat has put in the hand.
+        active (list): Whether every seat is still in the hand.
+        holes (list): The hole cards of every seat.
+        board (list): The community cards.
+        deck (list): The cards still to be dealt.
+        street (int): The street, 0 for preflop to 3 for the river.
+        to_act (int): The seat to act.
+        last (int): The seat whose action ends the street.
+        raises (int): The raises made in the street.
+        highest (int): The highest bet in the hand.
+        pot (int): The chips in the pot.
+        dealer (int): The seat of the dealer.
+        finished (bool): Whether the pot has been awarded.
+
+    Methods:
+        from_game(game): Copies the state of a game.
+        copy(): Returns an independent copy of the state.
+        legal_actions(max_raises): Returns the actions the seat to act can take.
+        apply(action, raise_size): Applies an action of the seat to act.
+        next_turn(seat): Gives the turn to the first seat from the given one that can act.
+        end_street(): Deals the next street or goes to showdown.
+        showdown(): Deals the rest of the board and awards the pot.
+    """
+    __slots__ = ("stacks", "bets", "active", "holes", "board", "deck", "street", "to_act", "last", "raises",
+                 "highest", "pot", "dealer", "finished")
+
+    @staticmethod
+    def from_game(game):
+        """
+        Copies the state of a game. The deck and the hole cards of the players are left empty.
+
+        Args:
+            game (TexasHoldemGame): The game.
+
+        Returns:
+            SearchState: The state.
+        """
+        state = SearchState()
+        state.stacks = [player.account.chips for player in game.players]
+        state.bets = [game.players_bet[player.account.username] for player in game.players]
+        state.active = [player.active for player in game.players]
+        state.holes = [[] for _ in game.players]
+        state.board = [card.index for card in game.community_cards]
+        state.deck = []
+        state.street = max(len(game.community_cards) - 2, 0)
+        state.to_act = game.current_player_index
+        state.last = game.last_state_player_index
+        state.raises = game.street_raises
+        state.highest = game.highest_bet
+        state.pot = game.pot
+        state.dealer = game.curr_game_settings.dealer
+        state.finished = False
+        return state
+
+    def copy(self):
+        """
+        Returns an independent copy of the state. Cards are never changed in place, so they are shared.
+
+        Returns:
+            SearchState: The copy.
+        """
+        state = SearchState()
+        state.stacks = self.stacks[:]
+        state.bets = self.bets[:]
+        state.active = self.active[:]
+        state.holes = self.holes
+        state.board = self.board
+        state.deck = self.deck
+        state.street = self.street
+        state.to_act = self.to_act
+        state.last = self.last
+        state.raises = self.raises
+        state.highest = self.highest
+        state.pot = self.pot
+        state.dealer = self.dealer
+        state.finished = self.finished
+        return state
+
+    def legal_actions(self, max_raises):
+        """
+        Returns the actions the seat to act can take.
+
+        Args:
+            max_raises (int): The number of raises allowed per street.
+
+        Returns:
+            list: The legal actions among FOLD, CALL and RAISE.
+        """
+        seat = self.to_act
+        to_call = self.highest - self.bets[seat]
+        legal = [FOLD, CALL] if to_call > 0 else [CALL]
+        if self.raises < max_raises and self.stacks[seat] > to_call:
+            legal.append(RAISE)
+        return legal
+
+    def apply(self, action, raise_size):
+        """
+        Applies an action of the seat to act, then moves on to the next seat, street or the end of the hand.
+
+        Args:
+            action (int): FOLD, CALL or RAISE.
+            raise_size (int): The chips a raise puts in on top of the amount to call.
+        """
+        seat = self.to_act
+        if action == FOLD:
+            self.active[seat] = False
+            if self.active.count(True) == 1:
+                self.stacks[self.active.index(True)] += self.pot
+                self.finished = True
+                return
+        else:
+            to_call = self.highest - self.bets[seat]
+            put = min(to_call + raise_size if action == RAISE else to_call, self.stacks[seat])
+            self.stacks[seat] -= put
+            self.bets[seat] += put
+            self.pot += put
+            if action == RAISE:
+                self.highest = max(self.highest, self.bets[seat])
+                self.raises += 1
+                self.last = (seat - 1) % len(self.stacks)
+        if seat == self.last:
+            self.end_street()
+        else:
+            self.next_turn((seat + 1) % len(self.stacks))
+
+    def next_turn(self, seat):
+        """
+        Gives the turn to the first seat from the given one that can act, or ends the street on the way.
+
+        Args:
+            seat (int): The first seat to consider.
+        """
+        while True:
+            if self.active[seat] and self.stacks[seat] > 0:
+                self.to_act = seat
+                return
+            if seat == self.last:
+                self.end_street()
+                return
+            seat = (seat + 1) % len(self.stacks)
+
+    def end_street(self):
+        """
+        Deals the next street, or goes to showdown after the river or once at most one player can still bet.
+        """
+        if self.street == _RIVER or sum(1 for seat, active in enumerate(self.active)
+                                         if active and self.stacks[seat] > 0) < 2:
+            self.showdown()
+            return
+        self.street += 1
+        dealt = 3 if self.street == 1 else 1
+        self.board = self.board + self.deck[:dealt]
+        self.deck = self.deck[dealt:]
+        self.raises = 0
+        self.last = self.dealer
+        self.next_turn((self.dealer + 1) % len(self.stacks))
+
+    def showdown(self):
+        """
+        Deals the rest of the board and splits the pot between the best hands.
+        """
+        missing = 5 - len(self.board)
+        board = self.board + self.deck[:missing]
+        score = HandChecker.score_indexes
+        scores = [score(self.holes[seat] + board) if active else -1 for seat, active in enumerate(self.active)]
+        best = max(scores)
+        seats = len(self.stacks)
+        winners = sorted((seat for seat, seat_score in enumerate(scores) if seat_score == best),
+                         key=lambda seat: (seat - self.dealer - 1) % seats)
+        share, odd_chips = divmod(self.pot, len(winners))
+        # As in the game, the odd chips go to the winners closest to the dealer's left, one each.
+        for position, seat in enumerate(winners):
+            self.stacks[seat] += share + (position < odd_chips)
+        self.finished = True
+
+
+class SearchNode:
+    """
+    A node of the search tree, reached by a sequence of actions. The cards are sampled again on every
+    iteration, so a node stands for every deal the actions can be taken in.
+
+    Attributes:
+        children (dict): The child node reached by every action tried.
+        visits (int): The number of iterations that went through the node.
+        value (float): The sum of the payoffs, in units of the root pot, of the player whose action led here.
+
+    Methods:
+        size(): Returns the number of nodes of the subtree.
+    """
+    __slots__ = ("children", "visits", "value")
+
+    def __init__(self):
+        """
+        Initializes a SearchNode instance that was never visited.
+        """
+        self.children = {}
+        self.visits = 0
+        self.value = 0.0
+
+    def size(self):
+        """
+        Returns the number of nodes of the subtree.
+
+        Returns:
+            int: The number of nodes, this one included.
+        """
+        return 1 + sum(child.size() for child in self.children.values())
+
+
+@dataclass
+class MCTSPlayer(Player):
+    """
+    A computer player choosing its actions with Monte Carlo tree search under a wall-clock budget.
+
+    Every iteration deals the hole cards of the opponents and the rest of the board at random from the unseen
+    cards, walks the tree with UCT, adds one node and plays the hand out with a random rollout. The tree of a
+    decision is kept, and the next decision in the same hand starts from the node the actions taken since
+    lead to. Rollouts per second and tree sizes are reported through the instrumentation counters.
+
+    Attributes:
+        budget (float): The seconds every decision searches for.
+        exploration (float): The UCT exploration constant.
+        raise_size (int): The chips a raise puts in on top of the amount to call.
+        max_raises (int): The number of raises per street the search considers.
+        rng: The random number generator of the search.
+
+    Methods:
+        search(game): Searches from the state of a game and returns the root of the tree.
+        iterate(root, state, scale): Runs one iteration of the search.
+        uct(child, log_visits): Returns the UCT score of a child node.
+        rollout(state): Plays a hand out with random actions.
+        subtree(game): Returns the node of the previous tree the game's state is in, if any.
+
+    Inherits from:
+        Player
+    """
+    budget: float = 0.1
+    exploration: float = 1.4
+    raise_size: int = 5
+    max_raises: int = 3
+    rng: random.Random = field(default=random, repr=False)
+    tree: SearchNode = field(default=None, init=False, repr=False)
+    tree_game: object = field(default=None, init=False, repr=False)
+    tree_actions: int = field(default=0, init=False, repr=False)
+
+    def decide(self, game):
+        root = self.search(game)
+        action = max(root.children, key=lambda child: root.children[child].visits)
+        self.tree, self.tree_game, self.tree_actions = root, game, len(game.actions)
+
+        legal = game.legal_actions(game.current_player_index)
+        if action == RAISE and legal.can_raise:
+            game.make_raise(self, min(max(legal.call_amount + self.raise_size, legal.min_raise), legal.max_raise))
+        elif action == FOLD and legal.call_amount > 0:
+            game.make_fold(self)
+        elif legal.can_call:
+            game.make_call(self)
+        else:
+            game.make_check(self)
+
+    def search(self, game):
+        """
+        Searches from the state of a game until the budget or the decision's deadline runs out.
+
+        Args:
+            game (TexasHoldemGame): The game.
+
+        Returns:
+            SearchNode: The root of the tree.
+        """
+        start = time.perf_counter()
+        root = self.subtree(game)
+        if root is None:
+            root = SearchNode()
+        else:
+            COUNTERS.add("mcts.reused_visits", root.visits)
+        state = SearchState.from_game(game)
+        seat = game.current_player_index
+        state.holes[seat] = [card.index for card in self.hole_cards]
+        seen = set(state.holes[seat] + state.board)
+        unseen = [index for index in range(52) if index not in seen]
+        scale = max(state.pot, 1)
+
+        rollouts = 0
+        budget = self.budget
+        if self.deadline is not None:
+            # Stop in time for the decision's deadline, leaving a tenth of what remains to act.
+            budget = min(budget, 0.9 * (self.deadline - time.monotonic()))
+        deadline = start + budget
+        while rollouts == 0 or time.perf_counter() < deadline:
+            self.rng.shuffle(unseen)
+            sample = state.copy()
+            sample.holes = [holes if position == seat else unseen[2 * position:2 * position + 2]
+                            for position, holes in enumerate(state.holes)]
+            sample.deck = unseen[2 * len(state.holes):]
+            self.iterate(root, sample, scale)
+            rollouts += 1
+
+        elapsed = time.perf_counter() - start
+        COUNTERS.add("mcts.decisions")
+        COUNTERS.add("mcts.rollouts", rollouts)
+        COUNTERS.set("mcts.rollouts_per_second", int(rollouts / elapsed))
+        COUNTERS.set("mcts.tree_size", root.size())
+        return root
+
+    def iterate(self, root, state, scale):
+        """
+        Runs one iteration of the search: selection, expansion, rollout and backpropagation.
+
+        Args:
+            root (SearchNode): The root of the tree.
+            state (SearchState): The state at the root, with the cards of this iteration dealt.
+            scale (float): The chips payoffs are divided by.
+        """
+        start = state.stacks[:]
+        path = [(root, None)]
+        node = root
+        while not state.finished:
+            legal = state.legal_actions(self.max_raises)
+            untried = [action for action in legal if action not in node.children]
+            actor = state.to_act
+            if untried:
+                action = self.rng.choice(untried)
+                node.children[action] = SearchNode()
+                state.apply(action, self.raise_size)
+                node = node.children[action]
+                path.append((node, actor))
+                break
+            log_visits = math.log(node.visits)
+            action = max(legal, key=lambda option: self.uct(node.children[option], log_visits))
+            state.apply(action, self.raise_size)
+            node = node.children[action]
+            path.append((node, actor))
+        self.rollout(state)
+
+        for node, actor in path:
+            node.visits += 1
+            if actor is not None:
+                node.value += (state.stacks[actor] - start[actor]) / scale
+
+    def uct(self, child, log_visits):
+        """
+        Returns the UCT score of a child node.
+
+        Args:
+            child (SearchNode): The child.
+            log_visits (float): The natural logarithm of the visits of its parent.
+
+        Returns:
+            float: The score.
+        """
+        return child.value / child.visits + self.exploration * math.sqrt(log_visits / child.visits)
+
+    def rollout(self, state):
+        """
+        Plays a hand out with random actions: folds are rare and raises rarer than calls.
+
+        Args:
+            state (SearchState): The state to play out, changed in place.
+        """
+        choices = self.rng.choices
+        while not state.finished:
+            legal = state.legal_actions(self.max_raises)
+            weights = (1, 3, 1) if len(legal) == 3 else (1, 4) if legal[0] == FOLD else (4, 1)
+            state.apply(choices(legal, weights[:len(legal)])[0], self.raise_size)
+
+    def subtree(self, game):
+        """
+        Returns the node of the tree of the previous decision that the actions taken since lead to.
+
+        Args:
+            game (TexasHoldemGame): The game.
+
+        Returns:
+            SearchNode: The node, or None in a new hand or when the actions left the tree.
+        """
+        node = self.tree
+        if node is None or self.tree_game is not game:
+            return None
+        for seat, action in game.actions[self.tree_actions:]:
+            node = node.children.get(_SEARCH_ACTION[action])
+            if node is None:
+                return None
+        return node
@@ -0,0 +1,84 @@
+import random
+from dataclasses import dataclass, field
+
+from env.holdem_env import FOLD, CALL, RAISE
+from models.player import Player
+from solver.abstraction import hand_bucket
+from solver.buckets import BucketTable
+from solver.policy import Policy
+
+
+@dataclass
+class CFRPlayer(Player):
+    """
+    A computer player following a strategy trained by CFRTrainer.
+
+    Every decision maps the game to an information set of the abstracted game, looks up its action weights
+    in the policy and samples an action among the legal ones. The abstraction is heads-up: at a bigger table
+    the player counts as the dealer only in the dealer's seat and as acting first anywhere else.
+
+    Attributes:
+        policy (Policy): The policy played.
+        bucket_table (BucketTable): The bucket table the policy was trained with, or None for the buckets of
+            solver.abstraction.
+        rng: The random number generator actions are sampled with.
+
+    Methods:
+        load(account, path, bucket_table, rng): Creates a player playing a policy file.
+
+    Inherits from:
+        Player
+    """
+    policy: Policy = field(default=None, repr=False)
+    bucket_table: BucketTable = field(default=None, repr=False)
+    rng: random.Random = field(default=random, repr=False)
+
+    @staticmethod
+    def load(account, path, bucket_table=None, rng=random):
+        """
+        Creates a player playing a policy file.
+
+        Args:
+            account (Account): The player's account.
+            path (str): The path of the policy file.
+            bucket_table (BucketTable): The bucket table the policy was trained with, if any.
+            rng: The random number generator actions are sampled with.
+
+        Returns:
+            CFRPlayer: The player.
+
+        Raises:
+            ValueError: If the policy was not trained with the bucket table.
+        """
+        policy = Policy.load(path)
+        policy.check_bucket_table(bucket_table)
+        return CFRPlayer(account, policy=policy, bucket_table=bucket_table, rng=rng)
+
+    def decide(self, game):
+        seat = game.current_player_index
+        legal = game.legal_actions(seat)
+        abstract_game = self.policy.game
+        street = max(len(game.community_cards) - 2, 0)
+        bucket = (hand_bucket if self.bucket_table is None else self.bucket_table.bucket)(
+            [card.index for card in self.hole_cards], [card.index for card in game.community_cards])
+        raises = min(game.street_raises, abstract_game.max_raises)
+        position = 0 if seat == game.curr_game_settings.dealer else 1
+        weights = self.policy.weights(abstract_game.infoset(street, position, raises, legal.call_amount > 0, bucket))
+
+        if legal.call_amount == 0:
+            weights[FOLD] = 0
+        if not legal.can_raise or raises == abstract_game.max_raises:
+            weights[RAISE] = 0
+        if not any(weights):
+            weights[CALL] = 1
+        action = self.rng.choices((FOLD, CALL, RAISE), weights)[0]
+
+        if action == RAISE:
+            game.make_raise(self, min(max(legal.call_amount + abstract_game.raise_size, legal.min_raise),
+                                      legal.max_raise))
+        elif action == FOLD:
+            game.make_fold(self)
+        elif legal.can_call:
+            game.make_call(self)
+        else:
+            game.make_check(self)
@@ -0,0 +1,119 @@
+import struct
+
+import numpy as np
+
+from env.holdem_env import ACTION_COUNT
+from solver.abstraction import AbstractGame
+
+# A policy file starts with a header naming the abstracted game and the card abstraction it was trained with,
+# followed by one row of ACTION_COUNT bytes per information set: the probability of every action, scaled to
+# 0 - 255.
+POLICY_MAGIC = b"CFRP"
+POLICY_VERSION = 2
+POLICY_HEADER = struct.Struct("<4sHIIIHHBI")
+# The card abstractions a policy can be trained with: the Chen score and made-hand buckets of
+# solver.abstraction, or a BucketTable, recorded with its digest.
+HAND_BUCKETS = 0
+BUCKET_TABLE = 1
+
+
+def write_policy(path, game, strategy, bucket_table=None):
+    """
+    Writes a strategy as a compact policy file.
+
+    Args:
+        path (str): The path of the policy file.
+        game (AbstractGame): The abstracted game the strategy plays.
+        strategy (np.ndarray): (infoset_count, ACTION_COUNT) action probabilities.
+        bucket_table (BucketTable): The bucket table the strategy was trained with, or None for the buckets of
+            solver.abstraction.
+    """
+    table = np.rint(np.asarray(strategy) * 255).astype(np.uint8)
+    abstraction, digest = (HAND_BUCKETS, 0) if bucket_table is None else (BUCKET_TABLE, bucket_table.digest())
+    with open(path, "wb") as file:
+        file.write(POLICY_HEADER.pack(POLICY_MAGIC, POLICY_VERSION, game.chips, game.small_blind,
+                                      game.raise_size, game.max_raises, game.buckets, abstraction, digest))
+        file.write(table.tobytes())
+
+
+class Policy:
+    """
+    A strategy read from a policy file. The action table is memory-mapped, so loading a policy costs
+    nothing and processes playing the same policy share its pages.
+
+    Attributes:
+        game (AbstractGame): The abstracted game the policy plays.
+        table (np.memmap): (infoset_count, ACTION_COUNT) uint8 action weights.
+        bucket_digest (int): The digest of the bucket table the policy was trained with, or None if it was
+            trained with the buckets of solver.abstraction.
+
+    Methods:
+        load(path): Loads a policy file.
+        check_bucket_table(bucket_table): Checks that a bucket table is the one the policy was trained with.
+        weights(infoset): Returns the action weights at an information set.
+    """
+
+    def __init__(self, game, table, bucket_digest=None):
+        """
+        Initializes a Policy instance.
+
+        Args:
+            game (AbstractGame): The abstracted game the policy plays.
+            table (np.ndarray): (infoset_count, ACTION_COUNT) uint8 action weights.
+            bucket_digest (int): The digest of the bucket table the policy was trained with, or None.
+        """
+        self.game = game
+        self.table = table
+        self.bucket_digest = bucket_digest
+
+    @staticmethod
+    def load(path):
+        """
+        Loads a policy file.
+
+        Args:
+            path (str): The path of the policy file.
+
+        Returns:
+            Policy: The policy.
+        """
+        with open(path, "rb") as file:
+            magic, version, *fields, abstraction, digest = POLICY_HEADER.unpack(file.read(POLICY_HEADER.size))
+        if magic != POLICY_MAGIC or version != POLICY_VERSION:
+            raise ValueError(f"{path} is not a version {POLICY_VERSION} policy file.")
+        game = AbstractGame(*fields)
+        table = np.memmap(path, dtype=np.uint8, mode="r", offset=POLICY_HEADER.size,
+                          shape=(game.infoset_count, ACTION_COUNT))
+        return Policy(game, table, digest if abstraction == BUCKET_TABLE else None)
+
+    def check_bucket_table(self, bucket_table):
+        """
+        Checks that a bucket table is the one the policy was trained with, so the information sets played are
+        the ones trained.
+
+        Args:
+            bucket_table (BucketTable): The bucket table the policy is played with, or None for the buckets of
+                solver.abstraction.
+
+        Raises:
+            ValueError: If the policy was trained with another card abstraction.
+        """
+        if bucket_table is None:
+            if self.bucket_digest is not None:
+                raise ValueError("The policy was trained with a bucket table, which is needed to play it.")
+        elif self.bucket_digest is None:
+            raise ValueError("The policy was trained without a bucket table, which cannot be used to play it.")
+        elif bucket_table.buckets != self.game.buckets or bucket_table.digest() != self.bucket_digest:
+            raise ValueError("The policy was trained with another bucket table.")
+
+    def weights(self, infoset):
+        """
+        Returns the action weights at an information set.
+
+        Args:
+            infoset (int): The index of the information set.
+
+        Returns:
+            list: The weight of FOLD, CALL and RAISE, from 0 to 255.
+        """
+        return self.table[infoset].tolist()
@@ -0,0 +1,235 @@
+import os
+import random
+
+import numpy as np
+
+from solver.buckets import PREFLOP_KEYS, preflop_key
+from utils.TexasHoldemCombinations import HandChecker
+from utils.rng import derive_seed
+
+# The charts cover effective stacks of 1 to MAX_STACK big blinds and pushes with 1 (small blind against big
+# blind) to MAX_BEHIND players left to act.
+MAX_STACK = 20
+MAX_BEHIND = 7
+# Computer players switch to the charts at or below this effective stack, in big blinds.
+PUSH_FOLD_STACK = 15
+CHARTS_PATH = os.path.join(os.path.dirname(__file__), "push_fold.npz")
+
+_charts = None
+
+
+def starting_hands():
+    """
+    Returns the card-index pairs of every starting hand, grouped by canonical key (see preflop_key).
+
+    Returns:
+        list: The hole cards of every key, 6 for pairs, 4 for suited and 12 for offsuit hands.
+    """
+    hands = [[] for _ in range(PREFLOP_KEYS)]
+    for first in range(52):
+        for second in range(first + 1, 52):
+            hands[preflop_key((first, second))].append((first, second))
+    return hands
+
+
+def preflop_equities(samples=200, seed=None):
+    """
+    Estimates the all-in equity of every starting hand against every other one by dealing random boards.
+
+    Args:
+        samples (int): The boards dealt for every pair of hands.
+        seed (int): The seed of the deals, or None for unseeded deals.
+
+    Returns:
+        np.ndarray: (PREFLOP_KEYS, PREFLOP_KEYS) equity of the row hand against the column hand.
+    """
+    rng = random.Random(None if seed is None else derive_seed(seed, "preflop-equities"))
+    score = HandChecker.score_indexes
+    hands = starting_hands()
+    equities = np.full((PREFLOP_KEYS, PREFLOP_KEYS), 0.5)
+    for first in range(PREFLOP_KEYS):
+        for second in range(first + 1, PREFLOP_KEYS):
+            won = 0.0
+            for _ in range(samples):
+                ours = rng.choice(hands[first])
+                theirs = rng.choice(hands[second])
+                while theirs[0] in ours or theirs[1] in ours:
+                    theirs = rng.choice(hands[second])
+                dead = ours + theirs
+                board = []
+                while len(board) < 5:
+                    card = rng.randrange(52)
+                    if card not in dead and card not in board:
+                        board.append(card)
+                our_score, their_score = score(list(ours) + board), score(list(theirs) + board)
+                won += 1.0 if our_score > their_score else 0.5 if our_score == their_score else 0.0
+            equities[first, second] = won / samples
+            equities[second, first] = 1.0 - won / samples
+    return equities
+
+
+def solve(equities, weights, stack, behind, iterations=400):
+    """
+    Finds the push and call ranges of an all-in preflop at an effective stack by fictitious play.
+
+    The pusher is the small blind when behind is 1, and otherwise sits before the blinds with behind players
+    left to act, every one of them calling with the same range. Only the first caller is played; the small
+    blind is dead money when the pusher is not the small blind.
+
+    Args:
+        equities (np.ndarray): (PREFLOP_KEYS, PREFLOP_KEYS) all-in equities.
+        weights (np.ndarray): (PREFLOP_KEYS,) share of the deals every starting hand is dealt in.
+        stack (int): The effective stack, in big blinds.
+        behind (int): The number of players left to act after the pusher.
+        iterations (int): The number of fictitious-play iterations.
+
+    Returns:
+        tuple: The push and call frequency of every starting hand.
+    """
+    push = np.ones(PREFLOP_KEYS)
+    call = np.ones(PREFLOP_KEYS)
+    fold_value = -0.5 if behind == 1 else 0.0
+    dead = 0.0 if behind == 1 else 0.5
+    won_uncalled = 1.0 if behind == 1 else 1.5
+    for iteration in range(1, iterations + 1):
+        calling = weights * call
+        no_call = (1.0 - calling.sum()) ** behind
+        equity_called = equities @ calling / max(calling.sum(), 1e-12)
+        push_value = no_call * won_uncalled + (1 - no_call) * (equity_called * (2 * stack + dead) - stack)
+        pushing = weights * push
+        equity_pushed = equities @ pushing / max(pushing.sum(), 1e-12)
+        call_value = equity_pushed * (2 * stack + dead) - stack
+        push += ((push_value > fold_value) - push) / (iteration + 1)
+        call += ((call_value > -1.0) - call) / (iteration + 1)
+    return push, call
+
+
+class PushFoldCharts:
+    """
+    Push and call charts of all-in preflop play at short stacks, precomputed by build.
+
+    Attributes:
+        push (np.ndarray): (MAX_STACK, MAX_BEHIND, PREFLOP_KEYS) bool, whether to push every starting hand.
+        call (np.ndarray): (MAX_STACK, MAX_BEHIND, PREFLOP_KEYS) bool, whether to call a push with every
+            starting hand, by the number of players that were left to act after the pusher.
+
+    Methods:
+        build(samples, seed): Computes the charts.
+        load(path): Loads charts.
+        save(path): Saves the charts.
+        should_push(stack, behind, hole_cards): Looks up whether to push.
+        should_call(stack, behind, hole_cards): Looks up whether to call a push.
+    """
+
+    def __init__(self, push, call):
+        """
+        Initializes a PushFoldCharts instance.
+
+        Args:
+            push (np.ndarray): (MAX_STACK, MAX_BEHIND, PREFLOP_KEYS) bool push chart.
+            call (np.ndarray): (MAX_STACK, MAX_BEHIND, PREFLOP_KEYS) bool call chart.
+        """
+        self.push = push
+        self.call = call
+
+    @staticmethod
+    def build(samples=200, seed=None):
+        """
+        Computes the charts of every effective stack and number of players left to act.
+
+        Args:
+            samples (int): The boards dealt for every pair of starting hands.
+            seed (int): The seed of the deals, or None for unseeded deals.
+
+        Returns:
+            PushFoldCharts: The charts.
+        """
+        equities = preflop_equities(samples, seed)
+        weights = np.array([len(hands) for hands in starting_hands()]) / 1326
+        push = np.zeros((MAX_STACK, MAX_BEHIND, PREFLOP_KEYS), dtype=bool)
+        call = np.zeros((MAX_STACK, MAX_BEHIND, PREFLOP_KEYS), dtype=bool)
+        for stack in range(1, MAX_STACK + 1):
+            for behind in range(1, MAX_BEHIND + 1):
+                push_frequency, call_frequency = solve(equities, weights, stack, behind)
+                push[stack - 1, behind - 1] = push_frequency >= 0.5
+                call[stack - 1, behind - 1] = call_frequency >= 0.5
+        return PushFoldCharts(push, call)
+
+    @staticmethod
+    def load(path=CHARTS_PATH):
+        """
+        Loads charts.
+
+        Args:
+            path (str): The path of the charts.
+
+        Returns:
+            PushFoldCharts: The charts.
+        """
+        with np.load(path) as saved:
+            return PushFoldCharts(saved["push"], saved["call"])
+
+    def save(self, path=CHARTS_PATH):
+        """
+        Saves the charts.
+
+        Args:
+            path (str): The path of the charts.
+        """
+        with open(path, "wb") as file:
+            np.savez_compressed(file, push=self.push, call=self.call)
+
+    @staticmethod
+    def index(stack, behind):
+        """
+        Returns the chart row of an effective stack and a number of players left to act.
+
+        Args:
+            stack (float): The effective stack, in big blinds.
+            behind (int): The number of players left to act after the pusher.
+
+        Returns:
+            tuple: The stack and position indexes.
+        """
+        return min(max(round(stack), 1), MAX_STACK) - 1, min(max(behind, 1), MAX_BEHIND) - 1
+
+    def should_push(self, stack, behind, hole_cards):
+        """
+        Looks up whether to push all-in.
+
+        Args:
+            stack (float): The effective stack, in big blinds.
+            behind (int): The number of players left to act after the player.
+            hole_cards: The card indexes of the hole cards.
+
+        Returns:
+            bool: True to push, False to fold.
+        """
+        return bool(self.push[self.index(stack, behind) + (preflop_key(hole_cards),)])
+
+    def should_call(self, stack, behind, hole_cards):
+        """
+        Looks up whether to call an all-in push.
+
+        Args:
+            stack (float): The effective stack, in big blinds.
+            behind (int): The number of players that were left to act after the pusher.
+            hole_cards: The card indexes of the hole cards.
+
+        Returns:
+            bool: True to call, False to fold.
+        """
+        return bool(self.call[self.index(stack, behind) + (preflop_key(hole_cards),)])
+
+
+def push_fold_charts():
+    """
+    Returns the charts shipped with the solver, loaded once per process.
+
+    Returns:
+        PushFoldCharts: The charts, or None if the chart file is missing.
+    """
+    global _charts
+    if _charts is None and os.path.exists(CHARTS_PATH):
+        _charts = PushFoldCharts.load()
+    return _charts
@@ -2,6 +2,23 @@ import unittest
 from tests_hand_checker import TestHandChecker
 from tests_card import TestCard
 from tests_deck import TestStandardDeck
+from tests_tournament import TestTournament
+from tests_history import TestHandHistory
+from tests_replay import TestReplay
+from tests_game import TestLegalActions, TestDecisionTimeouts, TestShowdown
+from tests_timed_input import TestTimedInput
+from tests_pacing import TestPacing
+from tests_env import TestHoldemEnv, TestVectorHoldemEnv
+from tests_encoder import TestObservationEncoder
+from tests_decision_context import TestDecisionContext
+from tests_solver import TestCFRSolver, TestBucketTable, TestPushFoldCharts
+from tests_mcts import TestMCTSPlayer
+from tests_opponent_stats import TestOpponentStats
+from tests_strategies import TestStrategies
+from tests_combo_ranking import TestComboRanking
+from tests_live_equity import TestLiveEquity
+from tests_board_texture import TestBoardTexture
+from tests_server import TestProtocol, TestTableServer
 
 
 def suite():
@@ -9,6 +26,29 @@ def suite():
     _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestHandChecker))
     _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestCard))
     _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestStandardDeck))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestTournament))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestHandHistory))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestReplay))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestLegalActions))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestDecisionTimeouts))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestShowdown))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestTimedInput))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestPacing))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestHoldemEnv))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestVectorHoldemEnv))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestObservationEncoder))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestDecisionContext))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestCFRSolver))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestBucketTable))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestPushFoldCharts))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestMCTSPlayer))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestOpponentStats))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestStrategies))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestComboRanking))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestLiveEquity))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestBoardTexture))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestProtocol))
+    _suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestTableServer))
     return _suite
 
 
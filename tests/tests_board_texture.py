@@ -0,0 +1,56 @@
+import unittest
+
+from game.board_texture import (ACE, CONNECTED, FLUSH_DRAW, FLUSH_POSSIBLE, HIGH, HIGH_CARD_MASK, LOW, MIDDLE,
+                                MONOTONE, PAIRED, STRAIGHT_POSSIBLE, TRIPS, TWO_PAIRED, TWO_TONE, board_texture,
+                                describe, high_card_class)
+from game.game import TexasHoldemGame
+from models.account import Account
+from models.card import Card, Rank, Suit
+from models.deck import StandardDeck
+from models.player import ComputerPlayer
+from settings import GameSettings
+
+
+def board(*cards):
+    return [Card(rank, suit).index for rank, suit in cards]
+
+
+class TestBoardTexture(unittest.TestCase):
+
+    def test_dry_board(self):
+        texture = board_texture(board((Rank.KING, Suit.HEARTS), (Rank.SEVEN, Suit.CLUBS), (Rank.TWO, Suit.SPADES)))
+        self.assertEqual(texture & ~HIGH_CARD_MASK, 0)
+        self.assertEqual(high_card_class(texture), HIGH)
+        self.assertEqual(describe(texture), "king/queen high")
+
+    def test_wet_board(self):
+        texture = board_texture(board((Rank.NINE, Suit.HEARTS), (Rank.TEN, Suit.HEARTS), (Rank.JACK, Suit.CLUBS)))
+        for flag in (TWO_TONE, FLUSH_DRAW, CONNECTED, STRAIGHT_POSSIBLE):
+            self.assertTrue(texture & flag)
+        self.assertFalse(texture & (PAIRED | FLUSH_POSSIBLE | MONOTONE))
+        self.assertEqual(high_card_class(texture), MIDDLE)
+        self.assertEqual(describe(texture), "two-tone, flush draw, connected, straight possible, nine to jack high")
+
+    def test_monotone_and_paired_boards(self):
+        texture = board_texture(board((Rank.ACE, Suit.SPADES), (Rank.FIVE, Suit.SPADES), (Rank.THREE, Suit.SPADES)))
+        self.assertTrue(texture & MONOTONE and texture & FLUSH_POSSIBLE and texture & STRAIGHT_POSSIBLE)
+        self.assertEqual(high_card_class(texture), ACE)
+        self.assertTrue(describe(texture).endswith(", ace high"))
+        # The river does not leave a flush draw.
+        texture = board_texture(board((Rank.EIGHT, Suit.SPADES), (Rank.EIGHT, Suit.HEARTS), (Rank.FOUR, Suit.CLUBS),
+                                      (Rank.FOUR, Suit.HEARTS), (Rank.EIGHT, Suit.DIAMONDS)))
+        self.assertTrue(texture & PAIRED and texture & TWO_PAIRED and texture & TRIPS and texture & TWO_TONE)
+        self.assertFalse(texture & FLUSH_DRAW)
+        self.assertEqual(high_card_class(texture), LOW)
+        self.assertEqual(describe(texture), "trips, two paired, two-tone, eight high or lower")
+        # An ace next to a two.
+        self.assertTrue(board_texture(board((Rank.ACE, Suit.SPADES), (Rank.TWO, Suit.HEARTS),
+                                            (Rank.NINE, Suit.CLUBS))) & CONNECTED)
+
+    def test_texture_is_computed_when_cards_are_dealt(self):
+        players = [ComputerPlayer(Account(username=f"BOT-{i}", chips=100)) for i in range(3)]
+        game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                            big_blind=2, headless=True, seed=11))
+        self.assertEqual(game.board_texture, 0)
+        game.run()
+        self.assertEqual(game.board_texture, board_texture([card.index for card in game.community_cards]))
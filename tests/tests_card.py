@@ -32,3 +32,8 @@ class TestCard(unittest.TestCase):
         self.assertEqual(Rank.FIVE.int, 5)
         self.assertEqual(Rank.JACK.int, 11)
         self.assertEqual(Rank.ACE.int, 14)
+
+    def test_card_index(self):
+        deck_cards = [Card(rank, suit) for suit in Suit for rank in Rank]
+        self.assertEqual([card.index for card in deck_cards], list(range(52)))
+        self.assertEqual([Card.from_index(index) for index in range(52)], deck_cards)
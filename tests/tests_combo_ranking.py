@@ -0,0 +1,128 @@
+import contextlib
+import io
+import random
+import unittest
+from itertools import combinations
+
+import numpy as np
+
+from game.combo_ranking import ComboRanking, preflop_percentiles, preflop_ranking
+from game.decision_context import DecisionContext
+from game.game import TexasHoldemGame
+from models.account import Account
+from models.card import Card
+from models.deck import StandardDeck
+from models.player import ComputerPlayer, HumanPlayer
+from settings import GameSettings
+from utils.TexasHoldemCombinations import HandChecker
+
+
+def reference_strength(hole, board):
+    """
+    Counts the opponent pairs a hand is not behind by scoring every one of them.
+    """
+    ours = HandChecker.score_indexes(hole + board)
+    remaining = [index for index in range(52) if index not in hole + board]
+    pairs = list(combinations(remaining, 2))
+    not_behind = sum(HandChecker.score_indexes(list(pair) + board) <= ours for pair in pairs)
+    return not_behind / len(pairs) / 2
+
+
+class TestComboRanking(unittest.TestCase):
+
+    def test_strength_counts_every_opponent_pair(self):
+        rng = random.Random(4)
+        for size in (0, 3, 4, 5):
+            cards = rng.sample(range(52), size + 2)
+            ranking = ComboRanking(cards[2:])
+            self.assertEqual(len(ranking.combos), (52 - size) * (51 - size) // 2)
+            self.assertTrue((ranking.scores[:-1] <= ranking.scores[1:]).all())
+            self.assertAlmostEqual(ranking.strength(cards[:2]), reference_strength(cards[:2], cards[2:]))
+
+    def test_blocked_pairs_are_subtracted(self):
+        rng = random.Random(5)
+        cards = rng.sample(range(52), 7)
+        ranking = ComboRanking(cards[2:])
+        for share in (None, 0.3):
+            weights = ranking.range_weights(share)
+            for _ in range(20):
+                hole = rng.sample([index for index in range(52) if index not in cards[2:]], 2)
+                hero = HandChecker.score_indexes(hole + cards[2:])
+                live = ~np.isin(ranking.combos, hole).any(axis=1) * weights
+                expected = live[ranking.scores <= hero].sum() / live.sum() / 2
+                self.assertAlmostEqual(ranking.strength(hole, [share]), expected)
+
+    def test_strength_against_several_opponents(self):
+        ranking = ComboRanking([0, 14, 29])
+        hole = [12, 25]
+        heads_up = ranking.strength(hole)
+        self.assertAlmostEqual(ranking.strength(hole, [None] * 3), (2 * heads_up) ** 3 / 2)
+        self.assertLess(ranking.strength(hole, [None] * 3), heads_up)
+
+    def test_ranges_are_made_of_the_best_starting_hands(self):
+        percentiles = preflop_percentiles()
+        # A pair of aces, then seven-deuce offsuit.
+        self.assertEqual(percentiles[12, 25], 0.0)
+        self.assertGreater(percentiles[5, 13], 0.95)
+        ranking = ComboRanking([])
+        weights = ranking.range_weights(0.05)
+        in_range = {tuple(sorted(pair)) for pair, weight in zip(ranking.combos.tolist(), weights) if weight}
+        self.assertIn((12, 25), in_range)
+        self.assertNotIn((0, 18), in_range)
+        # A pair of queens is ahead of most hands, but not of the top 5%.
+        queens = [10, 23]
+        self.assertLess(ranking.strength(queens, [0.05]), ranking.strength(queens))
+        self.assertEqual(ranking.strength(queens, [1.0]), ranking.strength(queens))
+
+    def test_ranking_is_built_once_per_street(self):
+        player = ComputerPlayer(Account(username="BOT-0", chips=100))
+        player.hole_cards = [Card.from_index(12), Card.from_index(25)]
+        flop = [Card.from_index(index) for index in (0, 14, 29)]
+        context = DecisionContext()
+        ranking = context.combo_ranking(flop)
+        context.multiway_strength(player, flop, [None, None])
+        self.assertIs(context.combo_ranking(flop), ranking)
+        turn = flop + [Card.from_index(44)]
+        self.assertEqual(context.combo_ranking(turn).board, (0, 14, 29, 44))
+        self.assertIs(context.combo_ranking([]), preflop_ranking())
+        self.assertIs(DecisionContext().combo_ranking([]), preflop_ranking())
+
+    def test_computer_players_measure_strength_against_live_opponents(self):
+        players = [ComputerPlayer(Account(username=f"BOT-{i}", chips=100)) for i in range(4)]
+        game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                            big_blind=2, headless=True))
+        players[0].hole_cards = [Card.from_index(10), Card.from_index(23)]
+        multiway = players[0].hand_strength(game)
+        for player in players[2:]:
+            player.active = False
+        heads_up = players[0].hand_strength(game)
+        self.assertAlmostEqual(multiway, (2 * heads_up) ** 3 / 2, places=2)
+
+    def test_standing_counts_the_better_holdings(self):
+        rng = random.Random(6)
+        cards = rng.sample(range(52), 6)
+        hole, board = cards[:2], cards[2:]
+        standing = ComboRanking(board).standing(hole)
+        ours = HandChecker.score_indexes(hole + board)
+        remaining = [index for index in range(52) if index not in cards]
+        better = [score for score in (HandChecker.score_indexes(list(pair) + board)
+                                      for pair in combinations(remaining, 2)) if score > ours]
+        self.assertEqual(standing.score, ours)
+        self.assertEqual(standing.better_combos, len(better))
+        self.assertEqual(standing.better_values, len(set(better)))
+        self.assertAlmostEqual(standing.percentile, 2 * reference_strength(hole, board))
+        # The ten of spades completes a royal flush on the ace, king, queen and jack of spades.
+        self.assertEqual(ComboRanking([51, 50, 49, 48, 13]).standing([47, 0]).better_values, 0)
+
+    def test_human_player_sees_the_standing(self):
+        human = HumanPlayer(Account(username="human", chips=100))
+        players = [ComputerPlayer(Account(username="BOT-0", chips=100)), human]
+        game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                            big_blind=2))
+        human.hole_cards = [Card.from_index(47), Card.from_index(0)]
+        game.community_cards = [Card.from_index(index) for index in (51, 50, 49, 48, 13)]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            game.display_human_player()
+        self.assertIn("100%", output.getvalue())
+        self.assertIn("you hold the nuts", output.getvalue())
@@ -0,0 +1,80 @@
+import contextlib
+import io
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from game.combo_ranking import ComboRanking
+from game.decision_context import DecisionContext
+from game.game import TexasHoldemGame
+from models.account import Account
+from models.card import Card
+from models.deck import StandardDeck
+from models.player import ComputerPlayer, HumanPlayer
+from settings import GameSettings
+
+
+class TestDecisionContext(unittest.TestCase):
+
+    def setUp(self):
+        self.player = ComputerPlayer(Account(username="BOT-0", chips=100))
+        self.player.hole_cards = [Card.from_index(12), Card.from_index(25)]
+        self.board = [Card.from_index(index) for index in (0, 14, 29)]
+
+    def expected(self, board):
+        return ComboRanking([card.index for card in board]).strength([12, 25])
+
+    def test_strength_is_computed_once_per_street(self):
+        context = DecisionContext()
+        first = context.hand_strength(self.player, self.board)
+        second = context.hand_strength(self.player, self.board)
+        self.assertEqual(first, second)
+        self.assertEqual(first, self.expected(self.board))
+        self.assertEqual((context.computed, context.reused), (1, 1))
+
+    def test_new_card_invalidates_strength(self):
+        context = DecisionContext()
+        context.hand_strength(self.player, self.board)
+        turn = self.board + [Card.from_index(44)]
+        self.assertEqual(context.hand_strength(self.player, turn), self.expected(turn))
+        self.assertEqual((context.computed, context.reused), (2, 0))
+
+    def test_prefetched_strength_is_collected(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            context = DecisionContext(executor)
+            context.prefetch(self.board)
+            self.assertIsNotNone(context.pending)
+            strength = context.hand_strength(self.player, self.board)
+        self.assertEqual(strength, self.expected(self.board))
+        self.assertEqual((context.computed, context.prefetched), (1, 1))
+        self.assertIsNone(context.pending)
+
+    def test_new_street_drops_speculation(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            context = DecisionContext(executor)
+            context.prefetch(self.board)
+            turn = self.board + [Card.from_index(44)]
+            self.assertEqual(context.hand_strength(self.player, turn), self.expected(turn))
+        self.assertEqual(context.prefetched, 0)
+
+    def test_standing_waits_for_the_speculative_build_without_blocking(self):
+        human = HumanPlayer(Account(username="human", chips=100))
+        human.hole_cards = self.player.hole_cards
+        game = TexasHoldemGame(GameSettings(players=[self.player, human], deck=StandardDeck(), dealer=0,
+                                            small_blind=1, big_blind=2))
+        game.community_cards = self.board
+        game.decision_context.check_board(self.board)
+        future = game.decision_context.pending = Future()
+        self.assertIsNone(game.decision_context.ready_ranking(self.board))
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            game.display_standing(human)
+            future.set_result(ComboRanking([0, 14, 29]))
+            game.display_standing(human)
+            # The standing is shown once per street.
+            game.display_standing(human)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("calculating", lines[0])
+        self.assertIn("Percentile: ", lines[1])
+        self.assertIs(game.decision_context.ranking, future.result())
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from models.card import Card
@@ -16,6 +17,12 @@ class TestStandardDeck(unittest.TestCase):
         deck.shuffle()
         self.assertNotEqual(deck.cards, original_order)
 
+    def test_standard_deck_seeded_shuffle(self):
+        first, second = StandardDeck(), StandardDeck()
+        first.shuffle(random.Random(7))
+        second.shuffle(random.Random(7))
+        self.assertEqual(first.cards, second.cards)
+
     def test_standard_deck_deal_card(self):
         deck = StandardDeck()
         card = deck.deal_card()
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+
+from env.encoder import (BOARD, FEATURE_COUNT, HOLE_CARDS, NO_CARD, OWN_STACK, POSITION, POT, STREET, TO_CALL,
+                         ObservationEncoder, StateBatch, write_game_state)
+from game.game import TexasHoldemGame
+from models.account import Account
+from models.card import Card
+from models.deck import StandardDeck
+from models.player import ComputerPlayer
+from settings import GameSettings
+from utils.TexasHoldemStates import TexasHoldemState
+
+
+class TestObservationEncoder(unittest.TestCase):
+
+    def setUp(self):
+        players = [ComputerPlayer(Account(username=f"BOT-{i}", chips=100)) for i in range(3)]
+        self.game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                                 big_blind=2, headless=True))
+        players[1].hole_cards = [Card.from_index(0), Card.from_index(51)]
+        self.game.community_cards = [Card.from_index(5), Card.from_index(6), Card.from_index(7)]
+        self.game.state = TexasHoldemState.FLOP
+        self.game.collect_blind(1, 1)
+        self.game.collect_blind(2, 2)
+
+    def test_game_state_layout(self):
+        batch = StateBatch.allocate(4)
+        write_game_state(self.game, 1, batch, 2)
+        observation = ObservationEncoder(4).encode(batch)[2]
+
+        self.assertEqual(observation.shape, (FEATURE_COUNT,))
+        self.assertEqual(list(np.flatnonzero(observation[HOLE_CARDS])), [0, 51])
+        self.assertEqual(list(np.flatnonzero(observation[BOARD])), [5, 6, 7])
+        self.assertEqual(list(observation[STREET]), [0, 1, 0, 0])
+        self.assertAlmostEqual(observation[POT], 0.03)
+        self.assertAlmostEqual(observation[OWN_STACK], 0.99)
+        self.assertAlmostEqual(observation[TO_CALL], 0.01)
+        self.assertEqual(observation[POSITION], 1)
+
+    def test_encoding_reuses_the_output(self):
+        encoder = ObservationEncoder(8)
+        batch = StateBatch.allocate(8)
+        batch.hole_cards[:] = [3, 4]
+        first = encoder.encode(batch)
+        batch.hole_cards[:] = NO_CARD
+        second = encoder.encode(batch)
+        self.assertIs(first.base, second.base)
+        self.assertEqual(second[:, HOLE_CARDS].sum(), 0)
+        planes = ObservationEncoder.encode_cards(batch, np.zeros((8, 2, 52), dtype=np.uint8))
+        self.assertEqual(planes.sum(), 0)
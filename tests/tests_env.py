@@ -0,0 +1,73 @@
+import unittest
+
+import numpy as np
+
+from env.encoder import FEATURE_COUNT
+from env.holdem_env import HoldemEnv, CALL, FOLD, RAISE
+from env.vector_env import VectorHoldemEnv
+
+
+class TestHoldemEnv(unittest.TestCase):
+
+    def test_hand_is_zero_sum(self):
+        env = HoldemEnv(seed=3)
+        for _ in range(5):
+            observation = env.reset()
+            self.assertEqual(observation.shape, (FEATURE_COUNT,))
+            done = False
+            while not done:
+                observation, reward, done, info = env.step(RAISE)
+            opponent = env.game.players[1 - env.game.players.index(env.agent)]
+            self.assertEqual(reward, env.chips - opponent.account.chips)
+
+    def test_seed_repeats_hands(self):
+        observations = [HoldemEnv(seed=9).reset() for _ in range(2)]
+        np.testing.assert_array_equal(observations[0], observations[1])
+
+
+class TestVectorHoldemEnv(unittest.TestCase):
+
+    def test_fold_loses_the_blind(self):
+        env = VectorHoldemEnv(8, seed=1)
+        env.reset()
+        blinds = np.where(env.dealer == 0, 2, 1)
+        observations, rewards, dones, info = env.step(np.full(8, FOLD))
+        self.assertTrue(dones.all())
+        np.testing.assert_array_equal(rewards, -blinds)
+
+    def test_chips_are_conserved(self):
+        env = VectorHoldemEnv(32, seed=2)
+        env.reset()
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            env.step(rng.integers(0, 3, 32))
+            np.testing.assert_array_equal((env.stacks + env.bets).sum(axis=1), 200)
+            self.assertTrue((env.to_act == 0).all())
+
+    def test_showdown_uses_hand_scores(self):
+        env = VectorHoldemEnv(1, seed=5)
+        env.reset()
+        # Seat 0 holds two aces, seat 1 two kings, on a board without help for either.
+        env.deck[0, :9] = [12, 25, 11, 24, 0, 14, 29, 44, 7]
+        rewards = np.zeros(1)
+        for _ in range(4):
+            observations, step_rewards, dones, info = env.step([CALL])
+            rewards += step_rewards
+        self.assertTrue(dones[0])
+        self.assertGreater(rewards[0], 0)
+
+    def test_odd_chip_of_a_split_pot(self):
+        env = VectorHoldemEnv(2, seed=5)
+        env.reset()
+        # A royal flush on the board splits the pot whatever the hole cards.
+        env.deck[:, :9] = [0, 1, 13, 14, 8, 9, 10, 11, 12]
+        env.bets[:] = [3, 2]
+        env.stacks[:] = [97, 98]
+        env.showdown(np.arange(2))
+        np.testing.assert_array_equal(env.stacks.sum(axis=1), 200)
+        # The seat left of the dealer gets the odd chip.
+        for game in range(2):
+            odd_seat = 1 - env.dealer[game]
+            expected = [97 + 2, 98 + 2]
+            expected[odd_seat] += 1
+            np.testing.assert_array_equal(env.stacks[game], expected)
@@ -0,0 +1,115 @@
+import time
+import unittest
+
+from game.game import TexasHoldemGame
+from models.account import Account
+from models.card import Card, Rank, Suit
+from models.deck import StandardDeck
+from models.player import ComputerPlayer
+from settings import GameSettings
+from utils.timed_input import check_deadline
+
+
+class TestLegalActions(unittest.TestCase):
+
+    def setUp(self):
+        self.players = [ComputerPlayer(Account(username=f"BOT-{i}", chips=chips))
+                        for i, chips in enumerate((100, 100, 3))]
+        self.game = TexasHoldemGame(GameSettings(players=self.players, deck=StandardDeck(), dealer=0,
+                                                 small_blind=1, big_blind=2, headless=True))
+        self.game.collect_blind(1, 1)
+        self.game.collect_blind(2, 2)
+        self.game.current_player_index = 0
+        self.game.last_state_player_index = 1
+
+    def test_facing_the_big_blind(self):
+        legal = self.game.legal_actions(0)
+        self.assertTrue(legal.can_fold)
+        self.assertFalse(legal.can_check)
+        self.assertTrue(legal.can_call)
+        self.assertEqual((legal.call_amount, legal.min_raise, legal.max_raise), (2, 3, 100))
+
+    def test_raise_updates_the_bet_to_call(self):
+        self.assertFalse(self.game.make_raise(self.players[0], 2))
+        self.assertTrue(self.game.make_raise(self.players[0], 10))
+        self.assertEqual(self.game.highest_bet, 10)
+        self.assertEqual(self.game.legal_actions(1).call_amount, 9)
+
+    def test_short_stack_can_only_call_all_in(self):
+        self.game.make_raise(self.players[0], 10)
+        legal = self.game.legal_actions(2)
+        self.assertTrue(legal.all_in_call)
+        self.assertEqual((legal.call_amount, legal.max_raise), (1, 0))
+
+    def test_folded_player_has_no_actions(self):
+        self.game.make_fold(self.players[0])
+        self.assertFalse(any(self.game.legal_actions(0)[:3]))
+
+    def test_big_blind_can_check(self):
+        self.game.make_call(self.players[0])
+        self.game.make_call(self.players[1])
+        legal = self.game.legal_actions(2)
+        self.assertTrue(legal.can_check)
+        self.assertEqual(legal.call_amount, 0)
+
+
+class SlowPlayer(ComputerPlayer):
+    """
+    A computer player that thinks past any deadline.
+    """
+
+    def decide(self, game):
+        time.sleep(0.02)
+        check_deadline(self.deadline)
+        game.make_call(self)
+
+
+class TestDecisionTimeouts(unittest.TestCase):
+
+    def setUp(self):
+        self.players = [SlowPlayer(Account(username=f"BOT-{i}", chips=100)) for i in range(3)]
+        self.game = TexasHoldemGame(GameSettings(players=self.players, deck=StandardDeck(), dealer=0,
+                                                 small_blind=1, big_blind=2, headless=True, decision_timeout=0.01))
+        self.game.collect_blind(1, 1)
+        self.game.collect_blind(2, 2)
+        self.game.current_player_index = 0
+        self.game.last_state_player_index = 1
+
+    def test_timeout_folds_facing_a_bet(self):
+        self.players[0].choose_action(self.game)
+        self.assertFalse(self.players[0].active)
+        self.assertEqual(self.game.timeouts, ["BOT-0"])
+        self.assertIsNone(self.players[0].deadline)
+
+    def test_timeout_checks_when_possible(self):
+        self.game.make_call(self.players[0])
+        self.game.make_call(self.players[1])
+        self.game.current_player_index = 2
+        self.players[2].choose_action(self.game)
+        self.assertTrue(self.players[2].active)
+        self.assertEqual(self.game.timeouts, ["BOT-2"])
+        self.assertEqual(self.players[2].account.chips, 98)
+
+    def test_decision_within_the_limit(self):
+        self.game.curr_game_settings.decision_timeout = 5
+        self.players[0].choose_action(self.game)
+        self.assertTrue(self.players[0].active)
+        self.assertEqual(self.game.timeouts, [])
+        self.assertEqual(self.game.amount_to_call(self.players[0]), 0)
+
+
+class TestShowdown(unittest.TestCase):
+
+    def test_odd_chips_of_a_split_pot(self):
+        players = [ComputerPlayer(Account(username=f"BOT-{i}", chips=0)) for i in range(4)]
+        game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=1, small_blind=1,
+                                            big_blind=2, headless=True))
+        # A royal flush on the board splits the pot between every player.
+        game.community_cards = [Card(rank, Suit.HEARTS) for rank in (Rank.TEN, Rank.JACK, Rank.QUEEN, Rank.KING,
+                                                                     Rank.ACE)]
+        for player, rank in zip(players, (Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE)):
+            player.hole_cards = [Card(rank, Suit.CLUBS), Card(rank, Suit.SPADES)]
+        game.pot = 10
+        game.determine_winner()
+        # The two odd chips go to the seats left of the dealer.
+        self.assertEqual([player.account.chips for player in players], [2, 2, 3, 3])
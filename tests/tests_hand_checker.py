@@ -141,3 +141,56 @@ class TestHandChecker(unittest.TestCase):
     def test_get_straight_flush(self):
         self.assertEqual(HandChecker.get_straight_flush(self.combinations_dict[HandStrength.STRAIGHT_FLUSH]),
                          (self.combinations_dict[HandStrength.STRAIGHT_FLUSH]))
+
+    def test_score_hand_orders_combinations(self):
+        order = [HandStrength.HIGH_CARD, HandStrength.PAIR, HandStrength.TWO_PAIR, HandStrength.THREE_OF_A_KIND,
+                 HandStrength.STRAIGHT, HandStrength.FLUSH, HandStrength.FULL_HOUSE, HandStrength.FOUR_OF_A_KIND,
+                 HandStrength.STRAIGHT_FLUSH]
+        scores = [HandChecker.score_hand(self.combinations_dict[strength]) for strength in order]
+        self.assertEqual(scores, sorted(scores))
+        for strength, score in zip(order, scores):
+            self.assertEqual(HandStrength.from_score(score), strength)
+
+    def test_score_hand_wheel(self):
+        wheel = [Card(rank=Rank.ACE, suit=Suit.HEARTS), Card(rank=Rank.TWO, suit=Suit.CLUBS),
+                 Card(rank=Rank.THREE, suit=Suit.DIAMONDS), Card(rank=Rank.FOUR, suit=Suit.SPADES),
+                 Card(rank=Rank.FIVE, suit=Suit.HEARTS)]
+        score = HandChecker.score_hand(wheel)
+        self.assertEqual(HandStrength.from_score(score), HandStrength.STRAIGHT)
+        self.assertLess(score, HandChecker.score_hand(self.combinations_dict[HandStrength.STRAIGHT]))
+
+    def test_rank_hands_kickers(self):
+        board = [Card(rank=Rank.KING, suit=Suit.HEARTS), Card(rank=Rank.KING, suit=Suit.CLUBS),
+                 Card(rank=Rank.SEVEN, suit=Suit.DIAMONDS), Card(rank=Rank.FOUR, suit=Suit.SPADES),
+                 Card(rank=Rank.TWO, suit=Suit.HEARTS)]
+        ace_kicker = [Card(rank=Rank.ACE, suit=Suit.SPADES), Card(rank=Rank.NINE, suit=Suit.CLUBS)]
+        queen_kicker = [Card(rank=Rank.QUEEN, suit=Suit.SPADES), Card(rank=Rank.NINE, suit=Suit.DIAMONDS)]
+        scores = HandChecker.rank_hands([ace_kicker + board, queen_kicker + board])
+        self.assertGreater(scores[0], scores[1])
+
+    def test_get_score_cards(self):
+        cards = self.combinations_dict[HandStrength.FULL_HOUSE]
+        score = HandChecker.score_hand(cards)
+        self.assertEqual(HandChecker.get_score_cards(cards, score), HandChecker.get_full_house(cards))
+
+    def test_find_outs(self):
+        # Ace and king of spades on the two and seven of spades and the ten of clubs: nine spades to a flush,
+        # three aces and three kings to a pair.
+        outs = HandChecker.find_outs([51, 50], [39, 44, 34])
+        self.assertEqual({category: len(cards) for category, cards in outs.by_category.items()},
+                         {HandStrength.FLUSH: 9, HandStrength.PAIR: 6})
+        self.assertEqual((len(outs.clean), outs.tainted), (15, []))
+        # Against a set of sevens the pairs are dead, and the ten of spades fills the opponent up.
+        outs = HandChecker.find_outs([51, 50], [39, 44, 34], [5, 18])
+        self.assertEqual(outs.tainted, [47])
+        self.assertEqual(sorted(outs.dead), [11, 12, 24, 25, 37, 38])
+        self.assertEqual((len(outs.clean), outs.count), (8, 9))
+        self.assertEqual({category: len(cards) for category, cards in outs.by_category.items()},
+                         {HandStrength.FLUSH: 9})
+        self.assertEqual(HandChecker.find_outs([51, 50], []).count, 0)
+
+    def test_board_pairs_are_not_outs(self):
+        # Ace and king of diamonds on the two of hearts, the seven of clubs and the nine of spades: a two,
+        # seven or nine pairs the board for everyone.
+        outs = HandChecker.find_outs([25, 24], [0, 31, 46])
+        self.assertEqual(sorted(index % 13 for index in outs.by_category[HandStrength.PAIR]), [11] * 3 + [12] * 3)
@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+
+from game.history import HandHistoryRecorder, read_hand_history
+from game.table import Table
+from models.account import Account
+from models.card import Card
+from models.deck import StandardDeck
+from models.player import ComputerPlayer
+from settings import GameSettings
+
+
+class RecordedTable(Table):
+
+    def __init__(self, hands, observers):
+        super().__init__(observers)
+        self.hands = hands
+
+    def check_input_new_game(self):
+        return self.games_played < self.hands and all(player.account.chips > 0
+                                                      for player in self.current_game.players)
+
+
+class TestHandHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.players = [ComputerPlayer(Account(username="BOT-0", chips=100)),
+                        ComputerPlayer(Account(username="BOT-1", chips=100))]
+
+    def play(self, recorder, hands):
+        game_settings = GameSettings(players=self.players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                     big_blind=2, headless=True)
+        RecordedTable(hands, [recorder]).createTable(game_settings)
+        recorder.close()
+
+    def test_records_are_read_back(self):
+        self.play(HandHistoryRecorder(self.directory, batch_size=2), 5)
+        records = list(read_hand_history(self.directory))
+
+        self.assertEqual([record.hand_id for record in records], list(range(len(records))))
+        for previous, record in zip(records, records[1:]):
+            self.assertEqual(previous.final_chips, record.starting_chips)
+        last = records[-1]
+        self.assertEqual(list(last.final_chips), [player.account.chips for player in self.players])
+        self.assertEqual(last.usernames, ("BOT-0", "BOT-1"))
+        self.assertEqual(sorted(last.deck), list(range(52)))
+        dealt = [Card.from_index(index) for index in last.deck[::-1][:4]]
+        self.assertEqual(dealt, [Card.from_index(index) for pair in last.hole_cards for index in pair])
+
+    def test_segments_rotate_and_continue(self):
+        self.play(HandHistoryRecorder(self.directory, batch_size=1, segment_bytes=1), 3)
+        recorded = len(list(read_hand_history(self.directory)))
+        recorder = HandHistoryRecorder(self.directory, batch_size=1, segment_bytes=1)
+        self.assertEqual(recorder.next_hand_id, recorded)
+        self.play(recorder, 2)
+        records = list(read_hand_history(self.directory))
+        self.assertEqual([record.hand_id for record in records], list(range(len(records))))
+        self.assertGreater(len(records), recorded)
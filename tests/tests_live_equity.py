@@ -0,0 +1,90 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from game.game import TexasHoldemGame
+from game.live_equity import LiveEquity
+from models.account import Account
+from models.card import Card
+from models.deck import StandardDeck
+from models.player import ComputerPlayer, HumanPlayer, Player
+from settings import GameSettings
+
+
+class TestLiveEquity(unittest.TestCase):
+
+    def test_estimate_converges(self):
+        equity = LiveEquity(max_samples=2000)
+        # A pair of aces against one random hand wins about 85% of the time.
+        equity.start([12, 25], [], 1)
+        equity.wait(30)
+        value, samples = equity.estimate()
+        self.assertEqual(samples, 2000)
+        self.assertAlmostEqual(value, 0.85, delta=0.04)
+
+    def test_same_hand_keeps_the_worker(self):
+        equity = LiveEquity(max_samples=10 ** 9)
+        equity.start([12, 25], [0, 14, 29], 2)
+        thread = equity.thread
+        equity.start([12, 25], [0, 14, 29], 2)
+        self.assertIs(equity.thread, thread)
+        equity.start([12, 25], [0, 14, 29], 1)
+        self.assertIsNot(equity.thread, thread)
+        equity.cancel()
+        equity.wait(5)
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(equity.thread.is_alive())
+
+    def test_cancelled_batches_are_dropped(self):
+        # A batch takes a moment, so the cancel lands while the worker samples it, or before it starts.
+        equity = LiveEquity(batch=5000)
+        equity.start([12, 25], [], 3)
+        equity.cancel()
+        equity.wait(30)
+        self.assertFalse(equity.thread.is_alive())
+        self.assertIsNone(equity.estimate())
+
+    def test_paused_estimate_resumes(self):
+        equity = LiveEquity(batch=500, max_samples=2000)
+        equity.start([12, 25], [], 1)
+        equity.pause()
+        equity.wait(30)
+        self.assertFalse(equity.thread.is_alive())
+        paused = equity.estimate()
+        paused_samples = 0 if paused is None else paused[1]
+        self.assertLess(paused_samples, 2000)
+        # The same hand picks the totals up where the paused worker left them.
+        equity.start([12, 25], [], 1)
+        equity.wait(30)
+        self.assertEqual(equity.estimate()[1], 2000)
+
+    def test_human_decision_pauses_the_estimate(self):
+        human = HumanPlayer(Account(username="human", chips=100))
+        players = [ComputerPlayer(Account(username="BOT-0", chips=100)), human]
+        game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                            big_blind=2))
+        human.hole_cards = [Card.from_index(12), Card.from_index(25)]
+        game.live_equity = LiveEquity(max_samples=10 ** 9)
+        with contextlib.redirect_stdout(io.StringIO()), mock.patch.object(Player, "decide"):
+            human.decide(game)
+        game.live_equity.wait(30)
+        self.assertFalse(game.live_equity.thread.is_alive())
+        self.assertIsNotNone(game.live_equity.key)
+
+    def test_table_shows_a_placeholder_then_the_estimate(self):
+        human = HumanPlayer(Account(username="human", chips=100))
+        players = [ComputerPlayer(Account(username="BOT-0", chips=100)), human]
+        game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                            big_blind=2))
+        human.hole_cards = [Card.from_index(12), Card.from_index(25)]
+        game.live_equity = LiveEquity(batch=2000, max_samples=2000)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            game.display_equity(human)
+            game.live_equity.wait(30)
+            game.display_equity(human)
+        first, second = output.getvalue().splitlines()
+        self.assertIn("calculating", first)
+        self.assertIn("(2000 deals)", second)
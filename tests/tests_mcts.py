@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from env.holdem_env import CallingPlayer
+from game.game import TexasHoldemGame
+from models.account import Account
+from models.deck import StandardDeck
+from settings import GameSettings
+from solver.mcts import MCTSPlayer, SearchState
+from utils.instrumentation import COUNTERS
+
+
+class TestMCTSPlayer(unittest.TestCase):
+
+    def play(self, players, hands):
+        for hand in range(hands):
+            game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=hand % len(players),
+                                                small_blind=1, big_blind=2, headless=True, seed=7,
+                                                hand_number=hand))
+            game.run()
+
+    def test_rollouts_award_the_pot(self):
+        players = [CallingPlayer(Account(username=f"BOT-{i}", chips=100)) for i in range(3)]
+        game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                            big_blind=2, headless=True))
+        game.collect_blind(1, 1)
+        game.collect_blind(2, 2)
+        game.current_player_index, game.last_state_player_index = 0, 1
+        searcher = MCTSPlayer(Account(username="MCTS", chips=100), rng=random.Random(1))
+        for _ in range(50):
+            state = SearchState.from_game(game)
+            cards = random.sample(range(52), 11)
+            state.holes = [cards[0:2], cards[2:4], cards[4:6]]
+            state.deck = cards[6:]
+            searcher.rollout(state)
+            self.assertTrue(state.finished)
+            self.assertEqual(sum(state.stacks), 300)
+
+    def test_odd_chips_of_a_split_pot(self):
+        state = SearchState()
+        state.stacks, state.active, state.dealer, state.pot = [0, 0, 0, 0], [True] * 4, 1, 10
+        # A royal flush on the board splits the pot between every seat.
+        state.board, state.deck = [8, 9, 10, 11, 12], []
+        state.holes = [[13, 26], [14, 27], [15, 28], [16, 29]]
+        state.showdown()
+        self.assertEqual(state.stacks, [2, 2, 3, 3])
+
+    def test_search_reports_and_reuses_the_tree(self):
+        COUNTERS.reset()
+        players = [MCTSPlayer(Account(username="MCTS", chips=100), budget=0.01, rng=random.Random(2)),
+                   CallingPlayer(Account(username="BOT", chips=100))]
+        self.play(players, 6)
+        self.assertEqual(sum(player.account.chips for player in players), 200)
+        counters = COUNTERS.snapshot()
+        self.assertGreater(counters["mcts.decisions"], 0)
+        self.assertGreaterEqual(counters["mcts.rollouts"], counters["mcts.decisions"])
+        self.assertGreater(counters["mcts.rollouts_per_second"], 0)
+        self.assertGreater(counters["mcts.tree_size"], 1)
+        self.assertGreater(counters["mcts.reused_visits"], 0)
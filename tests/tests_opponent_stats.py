@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from dataclasses import dataclass
+
+from env.holdem_env import CallingPlayer
+from game.game import TexasHoldemGame
+from game.opponent_stats import OpponentStats
+from models.account import Account
+from models.deck import StandardDeck
+from models.player import Player
+from settings import GameSettings
+
+
+@dataclass
+class RaisingPlayer(Player):
+    """A player who raises whenever possible and calls otherwise."""
+
+    def decide(self, game):
+        legal = game.legal_actions(game.current_player_index)
+        if legal.can_raise:
+            game.make_raise(self, min(legal.call_amount + 5, legal.max_raise))
+        else:
+            game.make_call(self)
+
+
+class TestOpponentStats(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "stats.npz")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def play(self, stats, hands):
+        for hand in range(hands):
+            players = [RaisingPlayer(Account(username="RAISER", chips=100)),
+                       CallingPlayer(Account(username="CALLER", chips=100))]
+            game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=hand % 2,
+                                                small_blind=1, big_blind=2, headless=True), [stats])
+            game.run()
+
+    def test_counters_follow_the_actions(self):
+        stats = OpponentStats()
+        self.play(stats, 6)
+        raiser, caller = stats.stats("RAISER"), stats.stats("CALLER")
+        self.assertEqual((raiser.hands, caller.hands), (6, 6))
+        # Heads-up, the big blind has no option after the small blind calls, so the raiser acts preflop
+        # only in the small blind.
+        self.assertEqual((raiser.vpip, raiser.pfr), (0.5, 0.5))
+        self.assertEqual((caller.vpip, caller.pfr), (1.0, 0.0))
+        self.assertGreater(raiser.aggression, 0)
+        self.assertEqual(caller.aggression, 0)
+        self.assertEqual(caller.fold_to_bet, 0)
+        self.assertEqual((raiser.went_to_showdown, caller.went_to_showdown), (1.0, 1.0))
+        self.assertEqual(stats.stats("NOBODY").hands, 0)
+
+    def test_counters_persist_across_tables(self):
+        stats = OpponentStats(self.path)
+        self.play(stats, 3)
+        stats.close()
+        reloaded = OpponentStats(self.path)
+        self.assertEqual(reloaded.stats("RAISER"), stats.stats("RAISER"))
+        self.play(reloaded, 2)
+        self.assertEqual(reloaded.stats("CALLER").hands, 5)
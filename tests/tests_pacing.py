@@ -0,0 +1,47 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from game.game import TexasHoldemGame
+from models.account import Account
+from models.deck import StandardDeck
+from models.player import ComputerPlayer, HumanPlayer
+from settings import GameSettings, Pacing
+
+
+class TestPacing(unittest.TestCase):
+
+    def make_game(self, pacing):
+        self.human = HumanPlayer(Account(username="human", chips=100))
+        self.bot = ComputerPlayer(Account(username="BOT-0", chips=100))
+        return TexasHoldemGame(GameSettings(players=[self.human, self.bot], deck=StandardDeck(), dealer=0,
+                                            small_blind=1, big_blind=2, pacing=pacing))
+
+    def street_pauses(self, pacing):
+        players = [ComputerPlayer(Account(username=f"BOT-{i}", chips=100)) for i in range(3)]
+        game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                            big_blind=2, pacing=pacing, seed=3))
+        with mock.patch("game.game.time.sleep") as sleep, contextlib.redirect_stdout(io.StringIO()):
+            game.run()
+        return [call.args[0] for call in sleep.call_args_list]
+
+    def test_faster_pacings_pause_less(self):
+        normal, fast, turbo = (self.street_pauses(pacing) for pacing in (Pacing.NORMAL, Pacing.FAST, Pacing.TURBO))
+        self.assertTrue(normal)
+        self.assertEqual(len(fast), len(normal))
+        self.assertLess(sum(fast), sum(normal))
+        # Turbo plays the streets of a hand without a human at once.
+        self.assertEqual(turbo, [])
+
+    def test_turbo_batches_streets_without_a_human(self):
+        game = self.make_game(Pacing.TURBO)
+        self.assertFalse(game.batching_bot_streets())
+        self.human.active = False
+        self.assertTrue(game.batching_bot_streets())
+
+    def test_other_pacings_never_batch_streets(self):
+        for pacing in (Pacing.NORMAL, Pacing.FAST):
+            game = self.make_game(pacing)
+            self.human.active = False
+            self.assertFalse(game.batching_bot_streets())
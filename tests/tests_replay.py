@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from game.history import HandHistoryRecorder, INDEX_NAME, read_hand, read_hand_history
+from game.replay import ReplayEngine
+from models.account import Account
+from models.deck import StandardDeck
+from models.player import ComputerPlayer
+from settings import GameSettings
+from tests_history import RecordedTable
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        players = [ComputerPlayer(Account(username=f"BOT-{i}", chips=100)) for i in range(3)]
+        game_settings = GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                     big_blind=2, headless=True)
+        recorder = HandHistoryRecorder(self.directory, batch_size=2, segment_bytes=1024)
+        RecordedTable(6, [recorder]).createTable(game_settings)
+        recorder.close()
+        self.records = list(read_hand_history(self.directory))
+
+    def test_replay_matches_recording(self):
+        engine = ReplayEngine(self.directory)
+        report = engine.replay_range()
+        self.assertEqual(report.hands, len(self.records))
+        self.assertEqual(report.mismatches, [])
+
+    def test_seek_to_hand(self):
+        engine = ReplayEngine(self.directory)
+        self.assertEqual(engine.hand_count(), len(self.records))
+        for record in self.records:
+            self.assertEqual(read_hand(self.directory, record.hand_id), record)
+        last = self.records[-1]
+        self.assertEqual(engine.replay(last.hand_id).final_chips, last.final_chips)
+        self.assertEqual(list(read_hand_history(self.directory, last.hand_id)), [last])
+        with self.assertRaises(IndexError):
+            read_hand(self.directory, len(self.records))
+
+    def test_missing_index_is_rebuilt(self):
+        os.remove(os.path.join(self.directory, INDEX_NAME))
+        recorder = HandHistoryRecorder(self.directory)
+        self.assertEqual(recorder.next_hand_id, len(self.records))
+        self.assertEqual(read_hand(self.directory, 1), self.records[1])
@@ -0,0 +1,138 @@
+import asyncio
+import unittest
+
+from models.account import Account
+from models.deck import StandardDeck
+from models.player import ComputerPlayer
+from server.protocol import decode_message, encode_message
+from server.table_server import NetworkGame, RemotePlayer, RemoteTable, TableServer
+from settings import GameSettings
+
+
+class ScriptedConnection:
+    """
+    Stands in for a PlayerConnection, replying to every decision with the next scripted action, then with a
+    call or a check.
+    """
+    closed = False
+
+    def __init__(self, actions=()):
+        self.actions = list(actions)
+        self.sent = []
+        self.requests = []
+
+    def send_threadsafe(self, message):
+        self.sent.append(message)
+
+    def request_threadsafe(self, message, deadline=None):
+        self.requests.append(message)
+        if self.actions:
+            action = self.actions.pop(0)
+        else:
+            action = "call" if "call" in message["options"] else "check"
+        return {"type": "action", "decision": message["decision"], "action": action}
+
+
+async def play_client(host, port, username, received):
+    """
+    Joins a table server and plays until the table closes, going all-in whenever it can.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(encode_message({"type": "join", "username": username}))
+    await writer.drain()
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        message = decode_message(line)
+        received.append(message)
+        if message.get("type") == "bye":
+            break
+        if message.get("type") == "decision":
+            options = message["options"]
+            reply = {"type": "action", "decision": message["decision"]}
+            if "all_in" in options:
+                reply["action"] = "all_in"
+            elif "raise" in options and message["max_raise"] > 0:
+                reply.update(action="raise", amount=message["max_raise"])
+            else:
+                reply["action"] = "call" if "call" in options else "check"
+            writer.write(encode_message(reply))
+            await writer.drain()
+    writer.close()
+
+
+class TestProtocol(unittest.TestCase):
+
+    def test_round_trip(self):
+        message = {"type": "decision", "decision": 3, "options": ["call", "fold"], "error": None}
+        line = encode_message(message)
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(line.count(b"\n"), 1)
+        self.assertEqual(decode_message(line), message)
+
+    def test_invalid_lines_decode_to_empty_messages(self):
+        self.assertEqual(decode_message(b"not json\n"), {})
+        self.assertEqual(decode_message(b"[1, 2]\n"), {})
+
+
+class TestTableServer(unittest.TestCase):
+
+    def test_join_renames_duplicate_usernames(self):
+        server = TableServer(players_per_table=2, humans_per_table=2, chips_amount=10, seed=5)
+
+        async def run():
+            listener = await asyncio.start_server(server.handle_client, "127.0.0.1", 0)
+            host, port = listener.sockets[0].getsockname()[:2]
+            first, second = [], []
+            first_client = asyncio.create_task(play_client(host, port, "player", first))
+            while not first:
+                await asyncio.sleep(0.01)
+            await asyncio.wait_for(asyncio.gather(first_client, play_client(host, port, "player", second)), 30)
+            listener.close()
+            await listener.wait_closed()
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first[0], {"type": "message", "text": "Waiting for more players..."})
+        self.assertEqual(second[0], {"type": "message", "text": "player is taken, you play as player-2."})
+        table = next(message for message in first if message["type"] == "table")
+        self.assertEqual(sorted(player["username"] for player in table["players"]), ["player", "player-2"])
+        self.assertEqual(first[-1]["chips"] + second[-1]["chips"], 20)
+        self.assertEqual(server.usernames, set())
+
+    def test_unique_username(self):
+        server = TableServer()
+        server.usernames.update({"player", "player-2"})
+        self.assertEqual(server.unique_username("player"), "player-3")
+        self.assertEqual(server.unique_username("alice"), "alice")
+        self.assertEqual(server.unique_username("BOT-1-0"), "player-3")
+
+    def test_scripted_remote_player_plays_a_hand(self):
+        connection = ScriptedConnection(["bet"])
+        remote = RemotePlayer(Account(username="remote", chips=100), connection=connection)
+        bot = ComputerPlayer(Account(username="BOT-1-0", chips=100))
+        game = NetworkGame(GameSettings(players=[remote, bot], deck=StandardDeck(), dealer=0, small_blind=1,
+                                        big_blind=2, headless=True, seed=3))
+        game.run()
+
+        self.assertEqual(remote.account.chips + bot.account.chips, 200)
+        self.assertTrue(connection.requests)
+        # "bet" is not offered to the small blind facing the big blind, so the player is asked again.
+        self.assertIsNone(connection.requests[0]["error"])
+        self.assertEqual(connection.requests[1]["error"], "Invalid choice.")
+        self.assertEqual(connection.requests[1]["options"], connection.requests[0]["options"])
+        table = next(message for message in connection.sent if message["type"] == "table")
+        self.assertEqual(len(table["hole_cards"]), 2)
+
+    def test_dealer_stays_seated_after_a_bust(self):
+        players = [ComputerPlayer(Account(username=f"BOT-1-{i}", chips=chips)) for i, chips in enumerate((50, 0, 50))]
+        table = RemoteTable(1)
+        table.dealer = 2
+        game_settings = GameSettings(players=players[:], deck=StandardDeck(), dealer=2, small_blind=1, big_blind=2,
+                                     headless=True, seed=3)
+        table.createTable(game_settings)
+
+        self.assertEqual(table.games_played, 1)
+        self.assertEqual(table.current_game.curr_game_settings.dealer, 1)
+        self.assertEqual([player.account.username for player in game_settings.players], ["BOT-1-0", "BOT-1-2"])
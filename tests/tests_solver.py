@@ -0,0 +1,200 @@
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from game.game import TexasHoldemGame
+from models.account import Account
+from models.deck import StandardDeck
+from models.player import ComputerPlayer
+from settings import GameSettings
+from solver.abstraction import AbstractGame, BUCKETS, chen_score, hand_bucket
+from solver.buckets import BucketTable, POSTFLOP_KEYS, PREFLOP_KEYS, preflop_key, situation_key
+from solver.cfr import CFRTrainer
+from solver.player import CFRPlayer
+from solver.policy import Policy
+from solver.push_fold import MAX_BEHIND, MAX_STACK, PushFoldCharts, push_fold_charts, starting_hands
+from utils.TexasHoldemStates import Action
+
+
+class TestCFRSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_chen_score_bounds(self):
+        # Aces of hearts and spades, then seven of hearts and two of diamonds.
+        self.assertEqual(chen_score(12, 51), 20)
+        self.assertEqual(chen_score(5, 13), -1)
+        self.assertEqual(hand_bucket([12, 51], []), BUCKETS - 1)
+        self.assertEqual(hand_bucket([5, 13], []), 0)
+
+    def test_infosets_are_numbered_densely(self):
+        game = AbstractGame(max_raises=2)
+        indexes = {game.infoset(street, seat, raises, facing, bucket)
+                   for street in range(4) for seat in range(2) for raises in range(3)
+                   for facing in (False, True) for bucket in range(game.buckets)}
+        self.assertEqual(indexes, set(range(game.infoset_count)))
+
+    def test_resumed_training_matches_uninterrupted_training(self):
+        checkpoint = os.path.join(self.directory.name, "cfr.npz")
+        uninterrupted = CFRTrainer(seed=3)
+        uninterrupted.train(60)
+        CFRTrainer(seed=3).train(25, checkpoint)
+        resumed = CFRTrainer.from_checkpoint(checkpoint, seed=3)
+        self.assertEqual(resumed.iterations, 25)
+        resumed.train(35)
+        np.testing.assert_array_equal(resumed.regrets, uninterrupted.regrets)
+        np.testing.assert_array_equal(resumed.strategy_sums, uninterrupted.strategy_sums)
+
+    def test_exported_policy_is_memory_mapped(self):
+        path = os.path.join(self.directory.name, "policy.cfr")
+        trainer = CFRTrainer(seed=4)
+        trainer.train(50)
+        trainer.export_policy(path)
+        policy = Policy.load(path)
+        self.assertIsInstance(policy.table, np.memmap)
+        self.assertEqual(policy.game, trainer.game)
+        expected = np.rint(trainer.average_strategy() * 255)
+        np.testing.assert_array_equal(policy.table, expected)
+
+    def test_cfr_players_play_a_hand(self):
+        path = os.path.join(self.directory.name, "policy.cfr")
+        trainer = CFRTrainer(seed=5)
+        trainer.train(50)
+        trainer.export_policy(path)
+        players = [CFRPlayer.load(Account(username=f"CFR-{i}", chips=100), path) for i in range(3)]
+        game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                            big_blind=2, headless=True, seed=6))
+        game.run()
+        self.assertEqual(sum(player.account.chips for player in players), 300)
+
+
+class TestBucketTable(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = BucketTable.build(buckets=4, samples=200, seed=1, runouts=2, opponents=4)
+
+    def test_keys_are_a_perfect_hash(self):
+        keys = {preflop_key((first, second)) for first in range(52) for second in range(first + 1, 52)}
+        self.assertEqual(keys, set(range(PREFLOP_KEYS)))
+        rng = random.Random(2)
+        for _ in range(200):
+            cards = rng.sample(range(52), 7)
+            for size in (3, 4, 5):
+                self.assertIn(situation_key(cards[:2], cards[2:2 + size]), range(POSTFLOP_KEYS))
+
+    def test_lookup_covers_every_street(self):
+        self.assertEqual([len(table) for table in self.table.tables],
+                         [PREFLOP_KEYS, POSTFLOP_KEYS, POSTFLOP_KEYS, POSTFLOP_KEYS])
+        for table in self.table.tables:
+            self.assertEqual(table.dtype, np.uint8)
+            self.assertLess(table.max(), 4)
+        # A pair of aces against seven-deuce offsuit.
+        self.assertGreater(self.table.bucket([12, 25], []), self.table.bucket([5, 13], []))
+
+    def test_table_round_trips_and_trains_a_policy(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "buckets.npz")
+            self.table.save(path)
+            loaded = BucketTable.load(path)
+        for saved, read in zip(self.table.tables, loaded.tables):
+            np.testing.assert_array_equal(saved, read)
+        trainer = CFRTrainer(AbstractGame(buckets=loaded.buckets), seed=1, bucket_table=loaded)
+        trainer.train(20)
+        self.assertGreater(trainer.strategy_sums.sum(), 0)
+        with self.assertRaises(ValueError):
+            CFRTrainer(AbstractGame(buckets=8), bucket_table=loaded)
+
+    def test_policy_is_played_with_its_bucket_table(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "policy.cfr")
+            trainer = CFRTrainer(AbstractGame(buckets=self.table.buckets), seed=1, bucket_table=self.table)
+            trainer.train(20)
+            trainer.export_policy(path)
+            account = Account(username="CFR", chips=100)
+            self.assertEqual(Policy.load(path).bucket_digest, self.table.digest())
+            self.assertIs(CFRPlayer.load(account, path, self.table).bucket_table, self.table)
+            with self.assertRaises(ValueError):
+                CFRPlayer.load(account, path)
+            other = BucketTable(self.table.buckets, [table.copy() for table in self.table.tables])
+            other.tables[0][[0, 1]] = other.tables[0][[1, 0]] + 1
+            with self.assertRaises(ValueError):
+                CFRPlayer.load(account, path, other)
+
+            CFRTrainer(seed=1).export_policy(path)
+            self.assertIsNone(Policy.load(path).bucket_digest)
+            with self.assertRaises(ValueError):
+                CFRPlayer.load(account, path, self.table)
+
+
+class TestPushFoldCharts(unittest.TestCase):
+
+    def setUp(self):
+        self.charts = push_fold_charts()
+        self.cards = {card.index: card for card in StandardDeck().cards}
+
+    def share(self, chart):
+        weights = np.array([len(hands) for hands in starting_hands()])
+        return weights @ chart / weights.sum()
+
+    def test_charts_are_shipped_for_every_stack_and_position(self):
+        self.assertIsNotNone(self.charts)
+        self.assertEqual(self.charts.push.shape, (MAX_STACK, MAX_BEHIND, 169))
+        for stack in range(1, MAX_STACK + 1):
+            for behind in range(1, MAX_BEHIND + 1):
+                # A pair of aces always goes all-in, seven-deuce offsuit never calls from 5 big blinds up.
+                self.assertTrue(self.charts.should_push(stack, behind, (12, 25)))
+                self.assertTrue(self.charts.should_call(stack, behind, (12, 25)))
+                if stack >= 5:
+                    self.assertFalse(self.charts.should_call(stack, behind, (5, 13)))
+
+    def test_ranges_tighten_with_stack_and_players_behind(self):
+        heads_up = [self.share(self.charts.push[stack - 1, 0]) for stack in (2, 10, 20)]
+        self.assertEqual(heads_up, sorted(heads_up, reverse=True))
+        self.assertGreater(self.share(self.charts.push[9, 0]), self.share(self.charts.push[9, MAX_BEHIND - 1]))
+        # The heads-up equilibrium at 10 big blinds pushes close to 58% of the hands and calls close to 37%.
+        self.assertAlmostEqual(self.share(self.charts.push[9, 0]), 0.58, delta=0.05)
+        self.assertAlmostEqual(self.share(self.charts.call[9, 0]), 0.37, delta=0.05)
+
+    def test_charts_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "push_fold.npz")
+            self.charts.save(path)
+            loaded = PushFoldCharts.load(path)
+        np.testing.assert_array_equal(loaded.push, self.charts.push)
+        np.testing.assert_array_equal(loaded.call, self.charts.call)
+
+    def short_stacked_game(self, chips):
+        players = [ComputerPlayer(Account(username=f"Bot-{i}", chips=chips)) for i in range(2)]
+        game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=0, small_blind=1,
+                                            big_blind=2, headless=True))
+        # Heads-up the dealer posts the big blind and the small blind acts first.
+        game.collect_blind(1, 1)
+        game.collect_blind(0, 2)
+        game.current_player_index = 1
+        return game, players
+
+    def test_short_stacked_bots_push_or_fold(self):
+        game, players = self.short_stacked_game(20)
+        players[1].hole_cards = [self.cards[12], self.cards[25]]
+        players[1].decide(game)
+        self.assertEqual(game.actions[-1], (1, Action.RAISE))
+        self.assertEqual(players[1].account.chips, 0)
+
+        game.current_player_index = 0
+        players[0].hole_cards = [self.cards[5], self.cards[13]]
+        players[0].decide(game)
+        self.assertEqual(game.actions[-1], (0, Action.FOLD))
+
+    def test_deep_stacks_are_left_to_the_hand_strength(self):
+        game, players = self.short_stacked_game(100)
+        players[1].hole_cards = [self.cards[5], self.cards[13]]
+        self.assertFalse(players[1].push_or_fold(game))
+        self.assertEqual(game.actions, [])
@@ -0,0 +1,133 @@
+import contextlib
+import io
+import os
+import random
+import re
+import tempfile
+import time
+import unittest
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+from game.combo_ranking import ComboRanking
+from game.decision_context import DecisionContext
+from game.game import TexasHoldemGame
+from models.account import Account
+from models.card import Card
+from models.deck import StandardDeck
+from models.player import ComputerPlayer, Player
+from models.strategies import STRATEGIES, create_bot, display_strategy_stats, register_strategy
+from settings import BotSettings, GameSettings
+from solver.cfr import CFRTrainer
+from solver.mcts import MCTSPlayer
+from utils.instrumentation import COUNTERS, LATENCIES, Histograms
+from utils.timed_input import DecisionTimeout, check_deadline
+
+
+@dataclass
+class SlowPlayer(Player):
+    """
+    A computer player thinking for 50 ms before checking or calling, checking its deadline when done.
+    """
+
+    def decide(self, game):
+        time.sleep(0.05)
+        check_deadline(self.deadline)
+        if game.legal_actions(game.current_player_index).can_call:
+            game.make_call(self)
+        else:
+            game.make_check(self)
+
+
+class TestStrategies(unittest.TestCase):
+
+    def setUp(self):
+        LATENCIES.reset()
+        COUNTERS.reset()
+        register_strategy("slow")(lambda account, settings: SlowPlayer(account))
+        self.addCleanup(STRATEGIES.pop, "slow")
+
+    def play(self, settings, seats=3, hands=1):
+        players = [create_bot(settings.strategies[i % len(settings.strategies)],
+                              Account(username=f"BOT-{i}", chips=100), settings) for i in range(seats)]
+        for hand in range(hands):
+            game = TexasHoldemGame(GameSettings(players=players, deck=StandardDeck(), dealer=hand % seats,
+                                                small_blind=1, big_blind=2, headless=True, seed=3,
+                                                hand_number=hand))
+            game.run()
+        return game, players
+
+    def test_registry_seats_strategies_in_turn(self):
+        self.assertTrue({"default", "cfr", "mcts"} <= set(STRATEGIES))
+        settings = BotSettings(strategies=["default", "mcts"], search_budget=0.01)
+        game, players = self.play(settings)
+        self.assertEqual([type(player) for player in players], [ComputerPlayer, MCTSPlayer, ComputerPlayer])
+        self.assertEqual([player.strategy for player in players], ["default", "mcts", "default"])
+        self.assertEqual(sum(player.account.chips for player in players), 300)
+        self.assertIn("strategy.mcts", LATENCIES.snapshot())
+        with self.assertRaises(ValueError):
+            create_bot("unknown", Account(username="BOT", chips=100), settings)
+
+    def test_slow_decisions_take_the_fallback_action(self):
+        game, players = self.play(BotSettings(strategies=["slow"], latency_budget=0.01))
+        self.assertTrue(game.timeouts)
+        self.assertEqual(COUNTERS.snapshot()["strategy.slow.fallbacks"], len(game.timeouts))
+        self.assertGreaterEqual(LATENCIES.percentile("strategy.slow", 0.5), 0.05)
+
+        game, players = self.play(BotSettings(strategies=["slow"]))
+        self.assertEqual(game.timeouts, [])
+
+    def test_strategy_stats_show_percentiles_and_fallbacks(self):
+        self.play(BotSettings(strategies=["slow", "default"], latency_budget=0.01))
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            display_strategy_stats(LATENCIES.snapshot(), COUNTERS.snapshot())
+        lines = re.sub(r"\033\[\d+m", "", output.getvalue()).splitlines()
+        self.assertEqual([line.split(":")[0] for line in lines], ["Strategy default", "Strategy slow"])
+        fallbacks = COUNTERS.snapshot()["strategy.slow.fallbacks"]
+        # The slow player sleeps for 50 ms, just past the bound of the 50 ms bucket.
+        self.assertTrue(lines[1].endswith(f"p50 <= 100 ms, p95 <= 100 ms, {fallbacks} fallbacks"))
+        self.assertRegex(lines[0], r"p50 <= [\d.]+ ms, p95 <= [\d.]+ ms, 0 fallbacks$")
+
+    def test_pending_ranking_is_kept_when_the_deadline_passes(self):
+        player = ComputerPlayer(Account(username="BOT-0", chips=100))
+        player.hole_cards = [Card.from_index(12), Card.from_index(25)]
+        board = [Card.from_index(index) for index in (0, 14, 29)]
+        context = DecisionContext()
+        context.check_board(board)
+        future = context.pending = Future()
+        player.deadline = time.monotonic() + 0.01
+        with self.assertRaises(DecisionTimeout):
+            context.hand_strength(player, board)
+        self.assertIs(context.pending, future)
+        ranking = ComboRanking([0, 14, 29])
+        future.set_result(ranking)
+        player.deadline = None
+        self.assertEqual(context.hand_strength(player, board), ranking.strength([12, 25]))
+        self.assertIs(context.ranking, ranking)
+
+    def test_histogram_buckets(self):
+        histograms = Histograms(bounds=(0.01, 0.1))
+        for seconds in (0.005, 0.005, 0.05, 3.0):
+            histograms.record("decide", seconds)
+        self.assertEqual(histograms.snapshot(), {"decide": [2, 1, 1]})
+        self.assertEqual(histograms.percentile("decide", 0.5), 0.01)
+        self.assertEqual(histograms.percentile("decide", 0.75), 0.1)
+        self.assertEqual(histograms.percentile("decide", 1.0), float("inf"))
+        self.assertIsNone(histograms.percentile("other", 0.5))
+
+    def test_seeded_bots_replay_the_same_choices(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "policy.cfr")
+            trainer = CFRTrainer(seed=4)
+            trainer.train(50)
+            trainer.export_policy(path)
+            settings = BotSettings(strategies=["cfr"], policy_path=path, seed=8)
+            chips = []
+            for _ in range(2):
+                random.seed()
+                game, players = self.play(settings, hands=5)
+                self.assertIsNot(players[0].rng, random)
+                chips.append([player.account.chips for player in players])
+                del game, players
+        self.assertEqual(chips[0], chips[1])
@@ -0,0 +1,46 @@
+import io
+import os
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from utils.timed_input import DecisionTimeout, check_deadline, timed_input
+
+
+@unittest.skipIf(os.name == "nt", "timed_input polls the console on Windows")
+class TestTimedInput(unittest.TestCase):
+
+    def setUp(self):
+        read_end, self.write_end = os.pipe()
+        self.stdin = os.fdopen(read_end)
+        self.addCleanup(self.stdin.close)
+        self.addCleanup(os.close, self.write_end)
+
+    def timed_input(self, deadline):
+        with mock.patch("sys.stdin", self.stdin), redirect_stdout(io.StringIO()) as output:
+            try:
+                return timed_input("> ", deadline)
+            finally:
+                self.assertTrue(output.getvalue().startswith("> "))
+
+    def test_expired_deadline(self):
+        os.write(self.write_end, b"1\n")
+        with self.assertRaises(DecisionTimeout):
+            self.timed_input(time.monotonic() - 1)
+
+    def test_no_line_before_the_deadline(self):
+        start = time.monotonic()
+        with self.assertRaises(DecisionTimeout):
+            self.timed_input(start + 0.05)
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_line_before_the_deadline(self):
+        os.write(self.write_end, b"2\n")
+        self.assertEqual(self.timed_input(time.monotonic() + 5), "2")
+
+    def test_check_deadline(self):
+        check_deadline(None)
+        check_deadline(time.monotonic() + 5)
+        with self.assertRaises(DecisionTimeout):
+            check_deadline(time.monotonic() - 1)
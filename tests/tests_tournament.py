@@ -0,0 +1,71 @@
+import contextlib
+import io
+import unittest
+
+from game.tournament import Tournament, TableState, TournamentTable
+from models.account import Account
+from models.deck import StandardDeck
+from models.player import ComputerPlayer
+from settings import GameSettings, TournamentSettings
+
+
+class TestTournament(unittest.TestCase):
+
+    def setUp(self):
+        self.tournament = Tournament(TournamentSettings(entrants=20, seats_per_table=6))
+        self.tournament.seat_players()
+
+    def test_seat_players(self):
+        sizes = sorted(len(state.usernames) for state in self.tournament.tables.values())
+        self.assertEqual(sizes, [5, 5, 5, 5])
+        usernames = [username for state in self.tournament.tables.values() for username in state.usernames]
+        self.assertEqual(len(set(usernames)), 20)
+
+    def test_balance_tables_breaks_table(self):
+        tables = self.tournament.tables
+        for table_id in (0, 1):
+            state = tables[table_id]
+            tables[table_id] = state._replace(chips=(0, 0) + state.chips[2:])
+        self.tournament.balance_tables()
+
+        sizes = sorted(len(state.usernames) for state in self.tournament.tables.values())
+        self.assertEqual(sizes, [5, 5, 6])
+        self.assertEqual(len(self.tournament.busted), 4)
+        for state in self.tournament.tables.values():
+            self.assertNotIn(0, state.chips)
+
+    def test_balance_tables_evens_sizes(self):
+        self.tournament.tables = {
+            0: TableState(0, 0, 1, 0, ("A", "B", "C", "D", "E", "F"), (10,) * 6),
+            1: TableState(1, 0, 1, 0, ("G", "H"), (10, 10)),
+        }
+        self.tournament.balance_tables()
+        sizes = sorted(len(state.usernames) for state in self.tournament.tables.values())
+        self.assertEqual(sizes, [4, 4])
+
+    def test_seed_is_independent_of_workers(self):
+        reports = [Tournament(TournamentSettings(entrants=6, seats_per_table=2, chips=10, seed=42,
+                                                 workers=workers)).run() for workers in (0, 2)]
+        self.assertEqual(reports[0].places, reports[1].places)
+        self.assertEqual(reports[0].hands, reports[1].hands)
+
+    def test_report_sums_the_strategy_latencies_of_every_worker(self):
+        report = Tournament(TournamentSettings(entrants=6, seats_per_table=2, chips=10, seed=42, workers=2)).run()
+        self.assertEqual(list(report.latencies), ["strategy.default"])
+        self.assertGreater(sum(report.latencies["strategy.default"]), 0)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            report.display()
+        self.assertIn("Strategy default: ", output.getvalue())
+
+    def test_dealer_stays_seated_after_a_bust(self):
+        players = [ComputerPlayer(Account(username=f"BOT-{i}", chips=chips)) for i, chips in enumerate((50, 0, 50))]
+        table = TournamentTable(hands=1)
+        table.dealer = 2
+        game_settings = GameSettings(players=players[:], deck=StandardDeck(), dealer=2, small_blind=1, big_blind=2,
+                                     headless=True, seed=3)
+        table.createTable(game_settings)
+
+        self.assertEqual(table.games_played, 1)
+        self.assertEqual(table.current_game.curr_game_settings.dealer, 1)
+        self.assertEqual([player.account.username for player in game_settings.players], ["BOT-0", "BOT-2"])
@@ -1,7 +1,9 @@
 from collections import Counter
 from enum import Enum
 from itertools import combinations
+from typing import NamedTuple
 
+from models.card import Suit
 from models.deck import Deck
 
 
@@ -71,6 +73,86 @@ class HandStrength(Enum):
     def int(self):
         return self.value["int"]
 
+    @staticmethod
+    def from_int(value):
+        """
+        Returns the hand strength with the given integer representation.
+
+        Args:
+            value (int): The integer representation of the hand strength.
+
+        Returns:
+            HandStrength: The matching hand strength.
+        """
+        return _HAND_STRENGTH_BY_INT[value]
+
+    @staticmethod
+    def from_score(score):
+        """
+        Returns the hand strength encoded in a score produced by HandChecker.score_hand.
+
+        Args:
+            score (int): The hand score.
+
+        Returns:
+            HandStrength: The hand strength of the scored hand.
+        """
+        return _HAND_STRENGTH_BY_INT[score >> SCORE_CATEGORY_SHIFT]
+
+
+_HAND_STRENGTH_BY_INT = {strength.int: strength for strength in HandStrength}
+
+
+class Outs(NamedTuple):
+    """
+    The unseen cards that improve a hand, as found by HandChecker.find_outs.
+
+    Attributes:
+        by_category (dict): The card indexes of the outs, by the HandStrength they improve the hand to.
+        clean (list): The outs that leave the improved hand ahead of, or tied with, the opponent's hand.
+        tainted (list): The outs that also improve the opponent's hand to a better category, and past the
+            improved hand.
+        dead (list): The cards that improve the hand but still leave it behind the opponent's unimproved hand.
+            They are not outs, so they are neither counted nor listed by category.
+    """
+    by_category: dict
+    clean: list
+    tainted: list
+    dead: list
+
+    @property
+    def count(self):
+        """
+        The number of outs.
+        """
+        return len(self.clean) + len(self.tainted)
+
+
+# A score packs the hand category above five 4-bit tie-break ranks, so comparing two scores
+# as plain integers compares the hands.
+SCORE_CATEGORY_SHIFT = 20
+
+_SUIT_INDEX = {suit: index for index, suit in enumerate(Suit)}
+
+
+def _build_straight_table():
+    """
+    Builds a lookup table from a 13-bit rank mask to the top rank of the best straight in it (0 if none).
+    """
+    table = [0] * (1 << 13)
+    windows = [(0b11111 << (top - 6), top) for top in range(14, 5, -1)]
+    # The wheel (A-2-3-4-5) uses the ace as the lowest card.
+    windows.append(((1 << 12) | 0b1111, 5))
+    for mask in range(1 << 13):
+        for window, top in windows:
+            if mask & window == window:
+                table[mask] = top
+                break
+    return table
+
+
+_STRAIGHT_TOP = _build_straight_table()
+
 
 class HandChecker:
     """
@@ -79,6 +161,11 @@ class HandChecker:
        Methods:
            hand_strength(hole_cards, community_cards): Calculates the strength of a hand given the hole cards and community cards.
            check_hand(cards): Determines the strength of a given set of cards.
+           score_hand(cards): Scores a set of cards as a single comparable integer.
+           score_indexes(indexes): Scores a set of cards given as card indexes.
+           rank_hands(hands): Scores many sets of cards in one call.
+           find_outs(hole, board, opponent): Finds the unseen cards that improve a hand.
+           get_score_cards(cards, score): Retrieves the cards making up a scored hand.
            compare_same_combination(hand1, hand2): Compares two hands with the same combination.
            has_pair(cards): Checks if the given set of cards contains a pair.
            has_two_pair(cards): Checks if the given set of cards contains two pairs.
@@ -159,6 +246,250 @@ class HandChecker:
         else:
             return HandStrength.HIGH_CARD
 
+    @staticmethod
+    def score_hand(cards):
+        """
+        Scores a set of cards as a single integer.
+
+        The hand category (the integer of its HandStrength) is stored above five 4-bit tie-break ranks,
+        so a higher score always means a better hand and equal scores mean a split.
+
+        Args:
+            cards (list): The set of cards (two to seven cards).
+
+        Returns:
+            int: The score of the best hand that can be made from the cards.
+        """
+        rank_counts = [0] * 15
+        suit_masks = [0, 0, 0, 0]
+        rank_mask = 0
+        for card in cards:
+            rank = card.rank.value["int"]
+            rank_counts[rank] += 1
+            bit = 1 << (rank - 2)
+            suit_masks[_SUIT_INDEX[card.suit]] |= bit
+            rank_mask |= bit
+        return HandChecker._score_masks(rank_counts, suit_masks, rank_mask)
+
+    @staticmethod
+    def score_indexes(indexes):
+        """
+        Scores a set of cards given as card indexes (see Card.index), without building Card objects.
+
+        Args:
+            indexes: The card indexes (two to seven cards).
+
+        Returns:
+            int: The score of the best hand that can be made from the cards, as returned by score_hand.
+        """
+        return HandChecker._score_masks(*HandChecker._index_masks(indexes))
+
+    @staticmethod
+    def _index_masks(indexes):
+        """
+        Returns the number of cards of every rank, the rank mask of every suit and the rank mask of a set of
+        card indexes.
+        """
+        rank_counts = [0] * 15
+        suit_masks = [0, 0, 0, 0]
+        rank_mask = 0
+        for index in indexes:
+            suit, rank_bit = divmod(int(index), 13)
+            rank_counts[rank_bit + 2] += 1
+            bit = 1 << rank_bit
+            suit_masks[suit] |= bit
+            rank_mask |= bit
+        return rank_counts, suit_masks, rank_mask
+
+    @staticmethod
+    def _score_with(masks, index):
+        """
+        Scores the cards of a set of masks (see _index_masks) together with one more card index.
+        """
+        rank_counts, suit_masks, rank_mask = masks
+        suit, rank_bit = divmod(index, 13)
+        bit = 1 << rank_bit
+        rank_counts = rank_counts.copy()
+        rank_counts[rank_bit + 2] += 1
+        suit_masks = suit_masks.copy()
+        suit_masks[suit] |= bit
+        return HandChecker._score_masks(rank_counts, suit_masks, rank_mask | bit)
+
+    @staticmethod
+    def find_outs(hole, board, opponent=None):
+        """
+        Finds the unseen cards that improve a hand to a better category on the next street.
+
+        The rank counts and suit masks of the hand, the board and the opponent's hand are built once, and every
+        unseen card is added to them with a few bit operations before scoring. A card only counts as an out if
+        the improved hand also beats the category the board makes with that card, so a card pairing the board
+        for everyone is not an out, and against an opponent, neither is a card that leaves the improved hand
+        behind the opponent's hand as it already stands.
+
+        Args:
+            hole: The card indexes of the hole cards.
+            board: The card indexes of the flop or the turn; no outs are found on other streets.
+            opponent: The card indexes of an opponent's hole cards, or None to count every out as clean.
+
+        Returns:
+            Outs: The outs, by category and split into clean and tainted outs, and the dead cards.
+        """
+        outs = Outs({}, [], [], [])
+        if len(board) not in (3, 4):
+            return outs
+        known = set(hole) | set(board) | set(opponent or ())
+        ours = HandChecker._index_masks(list(hole) + list(board))
+        board_only = HandChecker._index_masks(board)
+        theirs = None if opponent is None else HandChecker._index_masks(list(opponent) + list(board))
+        category = HandChecker._score_masks(*ours) >> SCORE_CATEGORY_SHIFT
+        if theirs is not None:
+            their_category = HandChecker._score_masks(*theirs) >> SCORE_CATEGORY_SHIFT
+        for index in range(52):
+            if index in known:
+                continue
+            score = HandChecker._score_with(ours, index)
+            improved = score >> SCORE_CATEGORY_SHIFT
+            if improved <= category or improved <= HandChecker._score_with(board_only, index) >> SCORE_CATEGORY_SHIFT:
+                continue
+            their_score = 0 if theirs is None else HandChecker._score_with(theirs, index)
+            if their_score <= score:
+                outs.clean.append(index)
+            elif their_score >> SCORE_CATEGORY_SHIFT > their_category:
+                outs.tainted.append(index)
+            else:
+                outs.dead.append(index)
+                continue
+            outs.by_category.setdefault(HandStrength.from_int(improved), []).append(index)
+        return outs
+
+    @staticmethod
+    def _score_masks(rank_counts, suit_masks, rank_mask):
+        """
+        Scores a set of cards from the number of cards of every rank and the rank masks of every suit.
+        """
+        for suit_mask in suit_masks:
+            if suit_mask.bit_count() >= 5:
+                top = _STRAIGHT_TOP[suit_mask]
+                if top:
+                    return (HandStrength.STRAIGHT_FLUSH.int << SCORE_CATEGORY_SHIFT) | (top << 16)
+                flush_score = HandStrength.FLUSH.int << SCORE_CATEGORY_SHIFT
+                shift = 16
+                for rank in range(14, 1, -1):
+                    if suit_mask & (1 << (rank - 2)):
+                        flush_score |= rank << shift
+                        shift -= 4
+                        if shift < 0:
+                            break
+                break
+        else:
+            flush_score = 0
+
+        quads, trips, pairs, singles = [], [], [], []
+        for rank in range(14, 1, -1):
+            count = rank_counts[rank]
+            if count == 4:
+                quads.append(rank)
+            elif count == 3:
+                trips.append(rank)
+            elif count == 2:
+                pairs.append(rank)
+            elif count == 1:
+                singles.append(rank)
+
+        if quads:
+            kicker = sorted(trips + pairs + singles + quads[1:], reverse=True)[:1]
+            return HandChecker._pack(HandStrength.FOUR_OF_A_KIND, quads[:1] + kicker)
+        if trips and (len(trips) > 1 or pairs):
+            pair = max(trips[1:] + pairs)
+            return HandChecker._pack(HandStrength.FULL_HOUSE, [trips[0], pair])
+        if flush_score:
+            return flush_score
+        top = _STRAIGHT_TOP[rank_mask]
+        if top:
+            return (HandStrength.STRAIGHT.int << SCORE_CATEGORY_SHIFT) | (top << 16)
+        if trips:
+            return HandChecker._pack(HandStrength.THREE_OF_A_KIND, trips[:1] + singles[:2])
+        if len(pairs) >= 2:
+            kicker = sorted(pairs[2:] + singles, reverse=True)[:1]
+            return HandChecker._pack(HandStrength.TWO_PAIR, pairs[:2] + kicker)
+        if pairs:
+            return HandChecker._pack(HandStrength.PAIR, pairs[:1] + singles[:3])
+        return HandChecker._pack(HandStrength.HIGH_CARD, singles[:5])
+
+    @staticmethod
+    def _pack(strength, ranks):
+        """
+        Packs a hand category and its tie-break ranks into a score.
+        """
+        score = strength.int << SCORE_CATEGORY_SHIFT
+        shift = 16
+        for rank in ranks:
+            score |= rank << shift
+            shift -= 4
+        return score
+
+    @staticmethod
+    def rank_hands(hands):
+        """
+        Scores many sets of cards in one call.
+
+        Args:
+            hands (list): A list of card lists, e.g. each player's hole cards plus the community cards.
+
+        Returns:
+            list: The score of each hand, in the same order.
+        """
+        score_hand = HandChecker.score_hand
+        return [score_hand(cards) for cards in hands]
+
+    @staticmethod
+    def get_score_cards(cards, score):
+        """
+        Retrieves the cards making up a hand that was already scored, without evaluating it again.
+
+        Args:
+            cards (list): The set of cards that produced the score.
+            score (int): The score returned by score_hand for these cards.
+
+        Returns:
+            list: The cards involved in the combination.
+        """
+        strength = HandStrength.from_score(score)
+        ranks = [(score >> shift) & 0xF for shift in range(16, -1, -4)]
+        ranks = [rank for rank in ranks if rank]
+
+        if strength in (HandStrength.STRAIGHT, HandStrength.STRAIGHT_FLUSH):
+            top = ranks[0]
+            wanted = [14 if rank == 1 else rank for rank in range(top, top - 5, -1)]
+            suit = None
+            if strength == HandStrength.STRAIGHT_FLUSH:
+                suit = next(suit for suit in Suit
+                            if all(any(card.suit == suit and card.rank.int == rank for card in cards)
+                                   for rank in wanted))
+            combination = []
+            for rank in wanted:
+                combination.append(next(card for card in cards
+                                        if card.rank.int == rank and (suit is None or card.suit == suit)))
+            return sorted(combination)
+
+        if strength == HandStrength.FLUSH:
+            suit_counts = Counter(card.suit for card in cards)
+            suit = next(suit for suit, count in suit_counts.items() if count >= 5)
+            return sorted(card for card in cards if card.suit == suit and card.rank.int in ranks)
+
+        group_sizes = {
+            HandStrength.FOUR_OF_A_KIND: [4],
+            HandStrength.FULL_HOUSE: [3, 2],
+            HandStrength.THREE_OF_A_KIND: [3],
+            HandStrength.TWO_PAIR: [2, 2],
+            HandStrength.PAIR: [2],
+            HandStrength.HIGH_CARD: [1],
+        }[strength]
+        combination = []
+        for rank, size in zip(ranks, group_sizes):
+            combination.extend([card for card in cards if card.rank.int == rank][:size])
+        return sorted(combination)
+
     @staticmethod
     def get_combination_cards(cards):
         """
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import NamedTuple
 
 class Action(Enum):
     """
@@ -9,12 +10,51 @@ class Action(Enum):
         CHECK (str): The action of checking, i.e., declining to bet and passing the action to the next player.
         BET (str): The action of placing a bet.
         RAISE (str): The action of raising the current bet.
+        CALL (str): The action of calling the current bet, all-in if the player has fewer chips.
     """
 
     FOLD = "FOLD"
     CHECK = "CHECK"
     BET = "BET"
     RAISE = "RAISE"
+    CALL = "CALL"
+
+
+class LegalActions(NamedTuple):
+    """
+    The actions a player can take at a decision.
+
+    Attributes:
+        can_fold (bool): Whether the player can fold.
+        can_check (bool): Whether the player can check, i.e. there is nothing to call.
+        can_call (bool): Whether there is a bet to call.
+        call_amount (int): The chips a call puts in, all the player's chips if they cannot cover the bet.
+        min_raise (int): The fewest chips a bet or raise can put in, 0 if the player cannot raise.
+        max_raise (int): The most chips a bet or raise can put in, 0 if the player cannot raise.
+    """
+    can_fold: bool
+    can_check: bool
+    can_call: bool
+    call_amount: int
+    min_raise: int
+    max_raise: int
+
+    @property
+    def can_raise(self):
+        """
+        Whether the player can bet or raise.
+        """
+        return self.max_raise > 0
+
+    @property
+    def all_in_call(self):
+        """
+        Whether calling puts all the player's chips in without covering the bet.
+        """
+        return self.can_call and not self.can_raise
+
+
+NO_ACTIONS = LegalActions(False, False, False, 0, 0, 0)
 
 
 class TexasHoldemState(Enum):
@@ -0,0 +1,195 @@
+import bisect
+import threading
+from collections import Counter
+
+
+class Counters:
+    """
+    Named event counters shared by everything running in a process. A counter can also hold the last value
+    of a measurement, such as a size or a rate.
+
+    Attributes:
+        values (Counter): The value of every counter, by name.
+
+    Methods:
+        add(name, amount): Adds to a counter.
+        set(name, value): Sets a counter to a measured value.
+        snapshot(): Returns a copy of all counters.
+        reset(): Sets all counters back to zero.
+    """
+
+    def __init__(self):
+        """
+        Initializes a Counters instance with every counter at zero.
+        """
+        self.values = Counter()
+        self.lock = threading.Lock()
+
+    def add(self, name, amount=1):
+        """
+        Adds to a counter.
+
+        Args:
+            name (str): The name of the counter.
+            amount (int): The amount to add.
+        """
+        with self.lock:
+            self.values[name] += amount
+
+    def set(self, name, value):
+        """
+        Sets a counter to a measured value.
+
+        Args:
+            name (str): The name of the counter.
+            value (int): The value.
+        """
+        with self.lock:
+            self.values[name] = value
+
+    def snapshot(self):
+        """
+        Returns a copy of all counters.
+
+        Returns:
+            Counter: The value of every counter, by name.
+        """
+        with self.lock:
+            return Counter(self.values)
+
+    def reset(self):
+        """
+        Sets all counters back to zero.
+        """
+        with self.lock:
+            self.values.clear()
+
+
+COUNTERS = Counters()
+
+
+# Upper bounds, in seconds, of the latency buckets; the last bucket holds everything slower.
+LATENCY_BOUNDS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)
+
+
+class Histograms:
+    """
+    Named latency histograms shared by everything running in a process, with fixed buckets so recording
+    is O(log buckets) and takes no memory per sample.
+
+    Attributes:
+        bounds (tuple): The upper bound of every bucket but the last, in seconds.
+        counts (dict): The count of every bucket, by histogram name.
+        totals (Counter): The sum of the recorded latencies, by histogram name.
+
+    Methods:
+        record(name, seconds): Adds a latency to a histogram.
+        snapshot(): Returns a copy of all histograms.
+        since(snapshot): Returns the latencies recorded since a snapshot.
+        percentile(name, share): Returns the bucket bound below which a share of the latencies fall.
+        reset(): Removes all histograms.
+    """
+
+    def __init__(self, bounds=LATENCY_BOUNDS):
+        """
+        Initializes a Histograms instance without any histogram.
+
+        Args:
+            bounds (tuple): The upper bound of every bucket but the last, in seconds.
+        """
+        self.bounds = bounds
+        self.counts = {}
+        self.totals = Counter()
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds):
+        """
+        Adds a latency to a histogram.
+
+        Args:
+            name (str): The name of the histogram.
+            seconds (float): The latency.
+        """
+        bucket = bisect.bisect_left(self.bounds, seconds)
+        with self.lock:
+            counts = self.counts.get(name)
+            if counts is None:
+                counts = self.counts[name] = [0] * (len(self.bounds) + 1)
+            counts[bucket] += 1
+            self.totals[name] += seconds
+
+    def snapshot(self):
+        """
+        Returns a copy of all histograms.
+
+        Returns:
+            dict: The bucket counts of every histogram, by name.
+        """
+        with self.lock:
+            return {name: list(counts) for name, counts in self.counts.items()}
+
+    def since(self, snapshot):
+        """
+        Returns the latencies recorded since a snapshot, such as the ones a worker process adds while playing.
+
+        Args:
+            snapshot (dict): A snapshot taken earlier.
+
+        Returns:
+            dict: The bucket counts added to every histogram since the snapshot, by name.
+        """
+        added = {}
+        for name, counts in self.snapshot().items():
+            before = snapshot.get(name, [0] * len(counts))
+            if counts != before:
+                added[name] = [count - earlier for count, earlier in zip(counts, before)]
+        return added
+
+    def percentile(self, name, share):
+        """
+        Returns the bucket bound below which a share of the latencies of a histogram fall.
+
+        Args:
+            name (str): The name of the histogram.
+            share (float): The share of the latencies, between 0 and 1.
+
+        Returns:
+            float: The bound in seconds, infinity for the last bucket, or None for an empty histogram.
+        """
+        with self.lock:
+            counts = list(self.counts.get(name, ()))
+        return percentile(counts, share, self.bounds)
+
+    def reset(self):
+        """
+        Removes all histograms.
+        """
+        with self.lock:
+            self.counts.clear()
+            self.totals.clear()
+
+
+def percentile(counts, share, bounds=LATENCY_BOUNDS):
+    """
+    Returns the bucket bound below which a share of the latencies of a histogram fall.
+
+    Args:
+        counts (list): The bucket counts of the histogram, as in a snapshot.
+        share (float): The share of the latencies, between 0 and 1.
+        bounds (tuple): The upper bound of every bucket but the last, in seconds.
+
+    Returns:
+        float: The bound in seconds, infinity for the last bucket, or None for an empty histogram.
+    """
+    total = sum(counts)
+    if total == 0:
+        return None
+    seen = 0
+    for bucket, count in enumerate(counts):
+        seen += count
+        if seen >= share * total:
+            break
+    return bounds[bucket] if bucket < len(bounds) else float("inf")
+
+
+LATENCIES = Histograms()
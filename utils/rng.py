@@ -0,0 +1,36 @@
+import hashlib
+import random
+
+
+def derive_seed(seed, *keys):
+    """
+    Derives the seed of a random stream from the session seed and the keys naming the stream.
+
+    Streams with different keys are independent, so a table's cards do not depend on how many other
+    tables were dealt before it, or in which process.
+
+    Args:
+        seed (int): The session seed.
+        *keys: The keys naming the stream, such as "deck", a table id and a hand number.
+
+    Returns:
+        int: A 64-bit seed for the stream.
+    """
+    digest = hashlib.blake2b(repr((seed,) + keys).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def make_rng(seed, *keys):
+    """
+    Returns the random number generator of a stream.
+
+    Args:
+        seed (int): The session seed, or None for an unseeded session.
+        *keys: The keys naming the stream.
+
+    Returns:
+        random.Random: The generator of the stream, or the global random module for an unseeded session.
+    """
+    if seed is None:
+        return random
+    return random.Random(derive_seed(seed, *keys))
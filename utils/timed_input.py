@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+
+
+class DecisionTimeout(TimeoutError):
+    """
+    Raised when a player runs out of time for a decision.
+    """
+
+
+def check_deadline(deadline):
+    """
+    Raises DecisionTimeout if a deadline has passed, for decisions that check their time as they go.
+
+    Args:
+        deadline (float): The time.monotonic() value by which the decision must be made, or None for no limit.
+
+    Raises:
+        DecisionTimeout: If the deadline has passed.
+    """
+    if deadline is not None and time.monotonic() > deadline:
+        raise DecisionTimeout()
+
+
+def timed_input(prompt, deadline=None):
+    """
+    Reads a line of user input that has to be entered before a deadline.
+
+    Args:
+        prompt (str): The prompt to display.
+        deadline (float): The time.monotonic() value by which the line must be entered, or None to wait forever.
+
+    Returns:
+        str: The line entered by the user, without the trailing newline.
+
+    Raises:
+        DecisionTimeout: If the deadline passes before a line is entered.
+    """
+    if deadline is None:
+        return input(prompt)
+
+    print(prompt, end='', flush=True)
+    if os.name == 'nt':
+        return _windows_timed_input(deadline)
+
+    import select
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        print()
+        raise DecisionTimeout()
+    ready, _, _ = select.select([sys.stdin], [], [], remaining)
+    if not ready:
+        print()
+        raise DecisionTimeout()
+    return sys.stdin.readline().rstrip('\n')
+
+
+def _windows_timed_input(deadline):
+    """
+    Reads a line from the Windows console by polling for key presses until the deadline.
+    """
+    import msvcrt
+
+    characters = []
+    while time.monotonic() < deadline:
+        while msvcrt.kbhit():
+            character = msvcrt.getwche()
+            if character in '\r\n':
+                print()
+                return ''.join(characters)
+            if character == '\b':
+                if characters:
+                    characters.pop()
+            else:
+                characters.append(character)
+        time.sleep(0.05)
+    print()
+    raise DecisionTimeout()